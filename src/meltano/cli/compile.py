@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import multiprocessing
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
@@ -12,10 +16,20 @@ from meltano.cli.params import pass_project
 from meltano.cli.utils import CliError, InstrumentedCmd
 from meltano.core.environment import Environment
 from meltano.core.environment_service import EnvironmentService
+from meltano.core.logging import LogFormat, setup_logging
 from meltano.core.manifest import Manifest
+from meltano.core.manifest.cache import read_inputs_index, write_inputs_index
+from meltano.core.manifest.manifest import (
+    ManifestInputs,
+    build_manifest_data,
+    validate_manifest,
+)
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.tracking.contexts import CliEvent
 
 if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from meltano.core.project import Project
     from meltano.core.tracking import Tracker
 
@@ -56,6 +70,25 @@ if t.TYPE_CHECKING:
     show_default=True,
     help="Expose values for sensitive settings.",
 )
+@click.option(
+    "--parallelism",
+    "-p",
+    type=click.INT,
+    default=1,
+    show_default=True,
+    help=(
+        "The number of manifests to compile in parallel, in separate processes. "
+        "Set to 0 to compile all of them at once."
+    ),
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help=(
+        "Skip environments whose manifest was already compiled from the same "
+        "project files, lockfiles, environment variables and options."
+    ),
+)
 @click.pass_context
 @pass_project(migrate=True)
 def compile_command(
@@ -66,6 +99,8 @@ def compile_command(
     lint: bool,
     indent: int,
     safe: bool,
+    parallelism: int,
+    incremental: bool,
 ) -> None:
     """Compile a Meltano project into environment-specific manifest files.
 
@@ -89,23 +124,47 @@ def compile_command(
         "Compiling Meltano manifest for environments: "
         + ", ".join("no environment" if x is None else x.name for x in environments),
     )
+
+    # The project files and lockfiles are the same for every environment
+    inputs = ManifestInputs.from_project(project, check_schema=lint)
+    index = read_inputs_index(directory)
+    input_hashes: dict[str, str] = {}
+    targets: list[tuple[Environment | None, Path]] = []
     for environment in environments:
         path = directory / (
             "meltano-manifest.json"
             if environment is None
             else f"meltano-manifest.{environment.name}.json"
         )
-        project.refresh(environment=environment)
-        manifest = Manifest(
-            project=project,
-            path=path,
-            check_schema=lint,
-            redact_secrets=safe,
+        input_hashes[path.name] = _input_hash(
+            inputs,
+            environment,
+            indent=indent,
+            safe=safe,
         )
+        if (
+            incremental
+            and index is not None
+            and index.get(path.name) == input_hashes[path.name]
+            and path.exists()
+        ):
+            click.echo(f"Skipped {path} (up to date)")
+            continue
+        targets.append((environment, path))
+
+    for path, data in _build_manifests(
+        project,
+        targets,
+        inputs=inputs,
+        safe=safe,
+        parallelism=parallelism,
+    ):
+        if lint:
+            validate_manifest("newly compiled manifest", path, data)
         try:
             with path.open("w") as manifest_file:
                 json.dump(
-                    manifest.data,
+                    data,
                     manifest_file,
                     indent=indent if indent > 0 else None,
                     sort_keys=True,
@@ -119,6 +178,100 @@ def compile_command(
         click.echo(f"Compiled {path}")
         tracker.track_command_event(CliEvent.inflight)
 
+    # Keep an existing index up to date even when not compiling incrementally,
+    # so that it never vouches for a manifest compiled from other inputs
+    if incremental or index is not None:
+        write_inputs_index(
+            directory,
+            {
+                **(index or {}),
+                **{path.name: input_hashes[path.name] for _, path in targets},
+            },
+        )
+
+
+def _input_hash(
+    inputs: ManifestInputs,
+    environment: Environment | None,
+    *,
+    indent: int,
+    safe: bool,
+) -> str:
+    key = [inputs.sha256, environment and environment.name, indent, safe]
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+
+def _build_manifests(
+    project: Project,
+    targets: list[tuple[Environment | None, Path]],
+    *,
+    inputs: ManifestInputs,
+    safe: bool,
+    parallelism: int,
+) -> Iterator[tuple[Path, dict[str, t.Any]]]:
+    if parallelism < 1:
+        parallelism = len(targets)
+
+    if min(parallelism, len(targets)) <= 1:
+        for environment, path in targets:
+            project.refresh(environment=environment)
+            manifest = Manifest(
+                project=project,
+                path=path,
+                check_schema=False,
+                redact_secrets=safe,
+                inputs=inputs,
+            )
+            yield path, manifest.data
+        return
+
+    build = functools.partial(
+        build_manifest_data,
+        project.root,
+        inputs=inputs,
+        redact_secrets=safe,
+        dotenv_file=project.dotenv_file,
+    )
+    paths = [path for _, path in targets]
+    # Spawn fresh interpreters rather than forking, so that workers do not
+    # inherit open database connections or locks held by other threads
+    with ProcessPoolExecutor(
+        max_workers=min(parallelism, len(targets)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            dict(ProjectSettingsService.config_override),
+            str(project.settings.get("cli.log_level")),
+            project.settings.get("cli.log_config"),
+            str(project.settings.get("cli.log_format")),
+        ),
+    ) as executor:
+        yield from zip(
+            paths,
+            executor.map(
+                build,
+                [None if env is None else env.name for env, _ in targets],
+                paths,
+            ),
+            strict=True,
+        )
+
+
+def _init_worker(
+    config_override: dict[str, t.Any],
+    log_level: str,
+    log_config: str | None,
+    log_format: str,
+) -> None:
+    # Spawned workers neither inherit the logging configuration nor the
+    # `--log-*` overrides of the CLI process, which end up in the manifests
+    ProjectSettingsService.config_override.update(config_override)
+    setup_logging(
+        log_level=log_level,
+        log_config=log_config,
+        log_format=LogFormat(log_format),
+    )
+
 
 def _environments(
     ctx: click.Context,
@@ -129,6 +129,14 @@ class ELOptions:
         help="Strategy to use for state updates.",
         default=StateStrategy.auto.value,
     )
+    force_dbt_deps = click.option(
+        "--force-dbt-deps",
+        help=(
+            "Run `dbt clean` and `dbt deps` before the transform even if the dbt "
+            "package files did not change."
+        ),
+        is_flag=True,
+    )
     run_id = click.option(
         "--run-id",
         type=UUIDParamType(),
@@ -239,6 +247,7 @@ async def el(  # WPS408
 @install
 @no_install
 @only_install
+@ELOptions.force_dbt_deps
 @ELOptions.run_id
 @click.pass_context
 @pass_project(migrate=True)
@@ -263,6 +272,7 @@ async def elt(  # WPS408
     merge_state: bool,
     state_strategy: str,
     install_plugins: InstallPlugins,
+    force_dbt_deps: bool,
     run_id: uuid.UUID | None,
 ) -> None:
     """Run an ELT pipeline to Extract, Load, and Transform data.
@@ -295,6 +305,7 @@ async def elt(  # WPS408
         merge_state=merge_state,
         state_strategy=state_strategy,
         install_plugins=install_plugins,
+        force_dbt_deps=force_dbt_deps,
         run_id=run_id,
     )
 
@@ -320,6 +331,7 @@ async def _run_el_command(
     state_strategy: str,
     install_plugins: InstallPlugins,
     run_id: uuid.UUID | None,
+    force_dbt_deps: bool = False,
 ) -> None:
     if platform.system() == "Windows":
         raise CliError(  # noqa: TRY003
@@ -382,6 +394,7 @@ async def _run_el_command(
             state=state,
             state_strategy=state_strategy_,
             run_id=run_id,
+            force_dbt_deps=force_dbt_deps,
         )
 
         if dump:
@@ -421,6 +434,7 @@ def _elt_context_builder(
     state: str | None = None,
     state_strategy: StateStrategy,
     run_id: uuid.UUID | None = None,
+    force_dbt_deps: bool = False,
 ) -> ELTContextBuilder:
     transform_name = None
     if transform != "skip":
@@ -442,6 +456,7 @@ def _elt_context_builder(
         .with_state(state)
         .with_state_strategy(state_strategy=state_strategy)
         .with_run_id(run_id)
+        .with_force_dbt_deps(force_dbt_deps=force_dbt_deps)
     )
 
 
@@ -483,15 +498,23 @@ async def _run_job(
         )
 
     async with job.run(session):
+        state_id, run_id = job.job_name, job.run_id
         job_logging_service = JobLoggingService(project)
-        log_file = job_logging_service.generate_log_name(job.job_name, job.run_id)
-
-        output_logger = OutputLogger(log_file)
+        output_logger = job_logging_service.create_output_logger(state_id, run_id)
         context_builder.set_base_output_logger(output_logger)
 
-        log = logger.bind(name="meltano", run_id=str(job.run_id), state_id=job.job_name)
+        log = logger.bind(name="meltano", run_id=str(run_id), state_id=state_id)
 
-        await _run_elt(tracker, log, context_builder, output_logger, install_plugins)
+        try:
+            await _run_elt(
+                tracker,
+                log,
+                context_builder,
+                output_logger,
+                install_plugins,
+            )
+        finally:
+            job_logging_service.finalize_log(state_id, run_id)
 
 
 @asynccontextmanager
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import typing as t
+from pathlib import Path
 
 import click
 import structlog
@@ -10,12 +11,19 @@ import structlog
 from meltano.cli.params import PluginTypeArg, pass_project
 from meltano.cli.utils import PartialInstrumentedCmd
 from meltano.core.block.block_parser import BlockParser
+from meltano.core.error import PluginInstallError
 from meltano.core.plugin import PluginType
-from meltano.core.plugin_install_service import install_plugins
+from meltano.core.plugin_install_manifest import InstallDrift, PluginInstallManifest
+from meltano.core.plugin_install_service import (
+    PluginInstallReason,
+    PluginInstallService,
+    install_plugins,
+)
 from meltano.core.schedule import ELTSchedule, JobSchedule
 from meltano.core.schedule_service import ScheduleService
 from meltano.core.tracking.contexts import CliEvent, PluginsTrackingContext
 from meltano.core.utils import run_async
+from meltano.core.venv_snapshot import export_venv_snapshot, import_venv_snapshot
 
 if t.TYPE_CHECKING:
     from meltano.core.plugin.project_plugin import ProjectPlugin
@@ -55,6 +63,27 @@ logger = structlog.getLogger(__name__)
     "schedule_name",
     help="Install all plugins from the given schedule.",
 )
+@click.option(
+    "--from-snapshot",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help=(
+        "Restore plugin virtual environments from a snapshot created with "
+        "`--export-snapshot`, and only install the plugins it does not cover."
+    ),
+)
+@click.option(
+    "--export-snapshot",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the virtual environments of the installed plugins to a snapshot.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help=(
+        "Report the plugins that need to be installed without installing them. "
+        "Exits with status 1 if there are any."
+    ),
+)
 @click.pass_context
 @pass_project(migrate=True)
 @run_async
@@ -68,6 +97,9 @@ async def install(
     parallelism: int,
     force: bool,
     schedule_name: str,
+    from_snapshot: Path | None,
+    export_snapshot: Path | None,
+    check: bool,
 ) -> None:
     """Install all the dependencies of your project based on the meltano.yml file.
 
@@ -77,6 +109,10 @@ async def install(
     tracker: Tracker = ctx.obj["tracker"]
     plugin_names = plugin
 
+    if clean and from_snapshot:
+        msg = "--clean cannot be used with --from-snapshot"
+        raise click.UsageError(msg)
+
     try:
         if plugin_type:
             plugins = project.plugins.get_plugins_of_type(plugin_type)
@@ -96,25 +132,118 @@ async def install(
         tracker.track_command_event(CliEvent.aborted)
         raise
 
-    logger.info("Installing %d plugins", len(plugins))
+    manifest = PluginInstallManifest(project)
+    if check:
+        _check_and_exit(ctx, manifest, plugins)
+
+    pending = plugins if clean else manifest.pending(plugins)
+    if len(pending) < len(plugins):
+        logger.info(
+            "%d/%d plugins are already installed and up to date",
+            len(plugins) - len(pending),
+            len(plugins),
+        )
+
+    logger.info("Installing %d plugins", len(pending))
     tracker.add_contexts(
         PluginsTrackingContext([(candidate, None) for candidate in plugins]),
     )
     tracker.track_command_event(CliEvent.inflight)
 
-    success = await install_plugins(
-        project,
-        plugins,
-        parallelism=parallelism,
-        clean=clean,
-        force=force,
-    )
+    to_install = pending
+    success = True
+    if from_snapshot and pending:
+        restored = await import_venv_snapshot(project, pending, from_snapshot)
+        logger.info(
+            "Restored %d/%d plugins from snapshot '%s'",
+            len(restored),
+            len(pending),
+            from_snapshot,
+        )
+        to_install = [plugin for plugin in pending if plugin not in restored]
+        success = await _run_install_hooks(project, restored)
+
+    if to_install:
+        success = (
+            await install_plugins(
+                project,
+                to_install,
+                parallelism=parallelism,
+                clean=clean,
+                force=force,
+            )
+            and success
+        )
+    if pending:
+        manifest.record(pending)
+        manifest.save()
     if not success:
         tracker.track_command_event(CliEvent.failed)
         ctx.exit(1)
+
+    if export_snapshot:
+        exported = export_venv_snapshot(project, plugins, export_snapshot)
+        logger.info(
+            "Exported %d plugins to snapshot '%s'",
+            len(exported),
+            export_snapshot,
+        )
+
     tracker.track_command_event(CliEvent.completed)
 
 
+async def _run_install_hooks(project: Project, plugins: list[ProjectPlugin]) -> bool:
+    """Run the install hooks of plugins restored from a snapshot, without pip.
+
+    Args:
+        project: The Meltano project.
+        plugins: The restored plugins.
+
+    Returns:
+        Whether the hooks of all plugins succeeded.
+    """
+    install_service = PluginInstallService(project)
+    success = True
+    for plugin in plugins:
+        try:
+            async with plugin.trigger_hooks(
+                "install",
+                install_service,
+                plugin,
+                PluginInstallReason.INSTALL,
+            ):
+                pass
+        except PluginInstallError as err:  # noqa: PERF203
+            logger.error(  # noqa: TRY400
+                "Could not set up %s '%s': %s",
+                plugin.type.descriptor,
+                plugin.name,
+                err,
+            )
+            success = False
+    return success
+
+
+def _check_and_exit(
+    ctx: click.Context,
+    manifest: PluginInstallManifest,
+    plugins: list[ProjectPlugin],
+) -> t.NoReturn:
+    drifted = 0
+    for plugin in plugins:
+        drift = manifest.drift(plugin)
+        if drift is None or drift is InstallDrift.ALWAYS:
+            continue
+        drifted += 1
+        click.echo(f"{plugin.type.descriptor} '{plugin.name}': {drift.description}")
+
+    if drifted:
+        click.echo(f"{drifted}/{len(plugins)} plugins need to be installed")
+    else:
+        click.echo(f"All {len(plugins)} plugins are up to date")
+    ctx.exit(1 if drifted else 0)
+
+
 def _get_schedule_plugins(project: Project, schedule_name: str) -> set[ProjectPlugin]:
     schedule_service = ScheduleService(project)
     schedule_obj = schedule_service.find_schedule(schedule_name)
@@ -19,6 +19,7 @@ from meltano.cli.utils import (
 from meltano.core.db import project_engine
 from meltano.core.job import State
 from meltano.core.logging.job_logging_service import (
+    MAX_FILE_SIZE,
     JobLoggingService,
 )
 from meltano.core.tracking.contexts import CliEvent
@@ -26,6 +27,7 @@ from meltano.core.tracking.contexts import CliEvent
 if t.TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+    from meltano.core.job import Job
     from meltano.core.project import Project
     from meltano.core.tracking.tracker import Tracker
 
@@ -192,6 +194,12 @@ def list_logs(
     type=int,
     help="Show last N lines of the log.",
 )
+@click.option(
+    "--follow",
+    "-f",
+    is_flag=True,
+    help="Keep streaming new log lines while the job is running.",
+)
 @click.option(
     "--format",
     "output_format",
@@ -206,6 +214,7 @@ def show_log(
     project: Project,
     log_id: str,
     tail: int | None,
+    follow: bool,  # noqa: FBT001
     output_format: str,
 ) -> None:
     """Show log content for a specific job run.
@@ -218,6 +227,9 @@ def show_log(
 
         # Show last 50 lines
         meltano logs show 550e8400-e29b-41d4-a716-446655440000 --tail 50
+
+        # Show last 50 lines and keep streaming new lines
+        meltano logs show 550e8400-e29b-41d4-a716-446655440000 --tail 50 --follow
     """
     tracker: Tracker = ctx.obj["tracker"]
     session = _cli_db_session(project, ctx=ctx)
@@ -235,42 +247,56 @@ def show_log(
         click.echo(job_logging_service.format_job_info(job, output_format))
         click.echo()
 
-        # Read log content
-        log_content, log_exists = job_logging_service.read_job_log(job, tail)
-
-        if not log_exists:
+        log_file_path = job_logging_service.get_job_log_path(job)
+        segments = job_logging_service.log_segments(log_file_path)
+        if not segments:
             msg = (
                 f"Log file not found for job run '{log_id}'. The log may have "
                 "been cleaned up or the job may not have generated logs."
             )
             raise CliError(msg)  # noqa: TRY301
 
+        # Anything written after this offset is picked up by --follow
+        log_size = log_file_path.stat().st_size if log_file_path.exists() else 0
+        total_size = sum(segment.stat().st_size for segment in segments)
+
         # Handle tail mode
         if tail:
-            lines = log_content.split("\n") if log_content else []
+            lines = job_logging_service.tail_log(log_file_path, tail, end=log_size)
             click.echo(f"Last {len(lines)} lines:")
             click.echo("-" * 40)
-            click.echo(log_content)
-            tracker.track_command_event(CliEvent.completed)
-            return
-
+            click.echo("\n".join(lines))
         # Check file size for full log display
-        log_file_path = job_logging_service.get_job_log_path(job)
-        if (
-            log_file_path.stat().st_size > 2097152  # 2MB
+        elif (
+            not follow
+            and total_size > MAX_FILE_SIZE
             and not click.confirm(
-                f"Log file is large ({log_file_path.stat().st_size / 1024 / 1024:.1f}MB). "  # noqa: E501
+                f"Log file is large ({total_size / 1024 / 1024:.1f}MB). "
                 "Do you want to display it anyway?"
             )
         ):
             click.echo(f"Log file path: {log_file_path}")
             tracker.track_command_event(CliEvent.completed)
             return
+        else:
+            # Show full log
+            click.echo("Log content:")
+            click.echo("-" * 12)
+            for segment in segments:
+                _echo_chunks(
+                    job_logging_service.iter_file_chunks(
+                        segment,
+                        end=log_size if segment == log_file_path else None,
+                    )
+                )
 
-        # Show full log
-        click.echo("Log content:")
-        click.echo("-" * 12)
-        click.echo(log_content, nl=False)
+        if follow and log_file_path.exists():
+            for line in job_logging_service.follow_file(
+                log_file_path,
+                offset=log_size,
+                is_active=lambda: _job_is_running(session, job),
+            ):
+                click.echo(line)
     except CliError:
         tracker.track_command_event(CliEvent.failed)
         raise
@@ -282,6 +308,16 @@ def show_log(
     tracker.track_command_event(CliEvent.completed)
 
 
+def _echo_chunks(chunks: t.Iterable[str]) -> None:
+    for chunk in chunks:
+        click.echo(chunk, nl=False)
+
+
+def _job_is_running(session: Session, job: Job) -> bool:
+    session.refresh(job)
+    return job.is_running()
+
+
 @logs.command(
     cls=PartialInstrumentedCmd,
     name="dir",
@@ -20,6 +20,7 @@ from meltano.core.block.block_parser import BlockParser, validate_block_sets
 from meltano.core.block.extract_load import ExtractLoadBlocks
 from meltano.core.block.plugin_command import InvokerCommand
 from meltano.core.logging.utils import change_console_log_level
+from meltano.core.plugin.dbt.worker import DbtWorkerPool
 from meltano.core.plugin_install_service import PluginInstallReason
 from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.runner import RunnerError
@@ -124,6 +125,37 @@ install, no_install, only_install = get_install_options(include_only_install=Tru
         "the pipeline will be gracefully terminated."
     ),
 )
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    default=1,
+    show_envvar=True,
+    envvar="MELTANO_RUN_SHARDS",
+    help=(
+        "Split the selected streams of every extractor into this many shards, "
+        "each extracted by its own extractor process."
+    ),
+)
+@click.option(
+    "--max-records-per-stream",
+    "--sample",
+    "max_records_per_stream",
+    type=click.IntRange(min=1),
+    show_envvar=True,
+    envvar="MELTANO_RUN_MAX_RECORDS_PER_STREAM",
+    help=(
+        "Load at most this many records per stream, ending extractors once "
+        "every selected stream is sampled. State is not updated."
+    ),
+)
+@click.option(
+    "--containers",
+    is_flag=True,
+    help=(
+        "Run extractors, mappers and loaders referenced as "
+        "`plugin:command` in the container of that command."
+    ),
+)
 @click.argument(
     "blocks",
     nargs=-1,
@@ -148,6 +180,9 @@ async def run(
     state_strategy: str,
     run_id: uuid.UUID | None,
     timeout: int | None,
+    shards: int,
+    max_records_per_stream: int | None,
+    containers: bool,
     blocks: list[str],
     install_plugins: InstallPlugins,
 ) -> None:
@@ -189,6 +224,8 @@ async def run(
         state_strategy=state_strategy,
     )
 
+    dbt_workers = DbtWorkerPool() if project.settings.get("run.dbt_worker") else None
+
     try:
         parser = BlockParser(
             logger,
@@ -201,6 +238,10 @@ async def run(
             state_id_suffix=state_id_suffix,
             state_strategy=state_strategy_,
             run_id=run_id,
+            dbt_workers=dbt_workers,
+            containers=containers,
+            shards=shards,
+            max_records_per_stream=max_records_per_stream,
         )
         parsed_blocks = list(parser.find_blocks(0))
         if not parsed_blocks:
@@ -251,6 +292,8 @@ async def run(
         tracker.track_command_event(CliEvent.failed)
         raise err  # noqa: TRY201
     finally:
+        if dbt_workers is not None:
+            await dbt_workers.close()
         run_end_time = time.perf_counter()
         total_duration = run_end_time - run_start_time
         logger.info(
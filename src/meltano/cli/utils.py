@@ -668,6 +668,9 @@ class PartialInstrumentedCmd(InstrumentedCmdMixin, _BaseMeltanoCommand):
             "refresh_catalog": "Run options",
             "run_id": "Run options",
             "timeout": "Run options",
+            "containers": "Run options",
+            "shards": "Run options",
+            "max_records_per_stream": "Run options",
             # State options
             "no_state_update": "State options",
             "force": "State options",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import sys
 import typing as t
@@ -18,7 +19,11 @@ from meltano.cli.utils import (
 from meltano.core.db import project_engine
 from meltano.core.plugin_install_service import PluginInstallReason
 from meltano.core.utils import run_async
-from meltano.core.validation_service import ValidationOutcome, ValidationsRunner
+from meltano.core.validation_service import (
+    ValidationOutcome,
+    ValidationsRunner,
+    run_validations,
+)
 
 if sys.version_info >= (3, 12):
     from typing import override  # noqa: ICN003
@@ -26,10 +31,6 @@ else:
     from typing_extensions import override
 
 if t.TYPE_CHECKING:
-    from collections import abc
-
-    from sqlalchemy.orm.session import Session
-
     from meltano.cli.params import InstallPlugins
     from meltano.core.project import Project
 
@@ -76,6 +77,36 @@ class CommandLineRunner(ValidationsRunner):
             return await handle.wait()
 
 
+class BufferedCommandLineRunner(CommandLineRunner):
+    """Validator that runs in the CLI and prints the output of each test at once.
+
+    Used when tests of several plugins run concurrently, so that their output is
+    not interleaved.
+    """
+
+    @override
+    async def run_test(self, name: str) -> int:
+        """Run a test command, buffering its output until it completes.
+
+        Args:
+            name: Test command name to invoke.
+
+        Returns:
+            Exit code for the plugin invocation.
+        """
+        handle = await self.invoker.invoke_async(
+            command=name,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        with propagate_stop_signals(handle):
+            output, _ = await handle.communicate()
+
+        write_sep_line(f"{self.plugin_name}:{name}", "=", bold=True)
+        click.echo(output.decode(errors="replace"), nl=False)
+        return handle.returncode  # type: ignore[return-value]
+
+
 @click.command(
     cls=InstrumentedCmd,
     short_help="Run validations using plugins' tests.",
@@ -93,6 +124,17 @@ class CommandLineRunner(ValidationsRunner):
     required=False,
     nargs=-1,
 )
+@click.option(
+    "--parallelism",
+    "-p",
+    type=click.INT,
+    default=1,
+    show_default=True,
+    help=(
+        "Limit the number of plugins to test in parallel. Use 0 for no limit. "
+        "The output of each test is printed once it completes."
+    ),
+)
 @install
 @no_install
 @only_install
@@ -102,6 +144,7 @@ async def test(
     project: Project,
     *,
     all_tests: bool,
+    parallelism: int,
     install_plugins: InstallPlugins,
     plugin_tests: tuple[str, ...],
 ) -> None:
@@ -113,7 +156,8 @@ async def test(
     _, session_maker = project_engine(project)
     session = session_maker()
 
-    collected = CommandLineRunner.collect(project, select_all=all_tests)
+    runner_class = CommandLineRunner if parallelism == 1 else BufferedCommandLineRunner
+    collected = runner_class.collect(project, select_all=all_tests)
 
     for plugin_test in plugin_tests:
         try:
@@ -132,18 +176,15 @@ async def test(
         reason=PluginInstallReason.AUTO,
     )
 
-    exit_codes = await _run_plugin_tests(session, collected.values())
+    exit_codes = await run_validations(
+        session,
+        collected.values(),
+        parallelism=parallelism,
+    )
     click.echo()
     _report_and_exit(exit_codes)
 
 
-async def _run_plugin_tests(
-    session: Session,
-    runners: abc.Iterable[ValidationsRunner],
-) -> dict[str, dict[str, int]]:
-    return {runner.plugin_name: await runner.run_all(session) for runner in runners}
-
-
 def _report_and_exit(results: dict[str, dict[str, int]]) -> None:
     exit_code = 0
     failed_count = 0
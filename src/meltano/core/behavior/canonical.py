@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import copy
+import datetime as dt
 import sys
 import typing as t
+from decimal import Decimal
 from functools import lru_cache
 
 from ruamel import yaml
@@ -18,6 +20,65 @@ else:
 if t.TYPE_CHECKING:
     from ruamel.yaml import Representer
 
+T = t.TypeVar("T")
+
+# Leaf values that can be shared between copies of a tree, instead of copied.
+# This includes the `ruamel.yaml` scalar types, which subclass these.
+IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    Decimal,
+    dt.date,
+    dt.time,
+    type(None),
+)
+
+
+def copy_tree(obj: T, memo: dict[int, t.Any] | None = None) -> T:
+    """Copy a tree of mappings and sequences, such as parsed YAML.
+
+    Mappings and sequences are copied recursively, along with the YAML
+    comments and formatting attached to them, while immutable leaves are
+    shared between the original and the copy. This is equivalent to
+    `copy.deepcopy` for parsed YAML, but much cheaper for large trees.
+
+    Args:
+        obj: The tree to copy.
+        memo: Memo shared by the `copy.deepcopy` calls made for YAML metadata
+            and other values.
+
+    Returns:
+        A copy of the tree.
+    """
+    if isinstance(obj, IMMUTABLE_TYPES):
+        return obj
+
+    if memo is None:
+        memo = {}
+
+    obj_type = type(obj)
+    if obj_type is CommentedMap:
+        copied_map = CommentedMap(
+            (key, copy_tree(val, memo)) for key, val in obj.items()
+        )
+        obj.copy_attributes(copied_map, memo=memo)
+        return t.cast("T", copied_map)
+
+    if obj_type is CommentedSeq:
+        copied_seq = CommentedSeq(copy_tree(val, memo) for val in obj)
+        obj.copy_attributes(copied_seq, memo=memo)
+        return t.cast("T", copied_seq)
+
+    if obj_type is dict:
+        return t.cast("T", {key: copy_tree(val, memo) for key, val in obj.items()})
+
+    if obj_type is list:
+        return t.cast("T", [copy_tree(val, memo) for val in obj])
+
+    return copy.deepcopy(obj, memo)
+
 
 class IdHashBox:
     """Wrapper class that makes the hash of an object its Python ID."""
@@ -176,7 +237,7 @@ class Canonical(metaclass=AnnotationsMeta):  # (too many methods)
                 return as_commented_seq
             return as_list
 
-        return copy.deepcopy(target)
+        return copy_tree(target)
 
     def canonical(self) -> dict | list | CommentedMap | CommentedSeq | t.Any:  # noqa: ANN401
         """Return a canonical representation of the current instance.
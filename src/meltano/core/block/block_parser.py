@@ -11,7 +11,11 @@ import click
 
 from meltano.core._state import StateStrategy
 from meltano.core.block.blockset import BlockSet, BlockSetValidationError
-from meltano.core.block.extract_load import ELBContextBuilder, ExtractLoadBlocks
+from meltano.core.block.extract_load import (
+    ELBContextBuilder,
+    ExtractLoadBlocks,
+    ShardedExtractLoadBlocks,
+)
 from meltano.core.block.plugin_command import plugin_command_invoker
 from meltano.core.block.singer import CONSUMERS
 from meltano.core.plugin import PluginType
@@ -24,8 +28,10 @@ if t.TYPE_CHECKING:
 
     import structlog
 
+    from meltano.core.block.fan_out import FanOutBlock
     from meltano.core.block.plugin_command import InvokerCommand
     from meltano.core.block.singer import SingerBlock
+    from meltano.core.plugin.dbt.worker import DbtWorkerPool
     from meltano.core.plugin.project_plugin import ProjectPlugin
     from meltano.core.project import Project
 
@@ -89,6 +95,10 @@ class BlockParser:  # noqa: D101
         state_id_suffix: str | None = None,
         state_strategy: StateStrategy = StateStrategy.auto,
         run_id: uuid.UUID | None = None,
+        dbt_workers: DbtWorkerPool | None = None,
+        containers: bool = False,
+        shards: int = 1,
+        max_records_per_stream: int | None = None,
     ):
         """Parse a meltano run command invocation into a list of blocks.
 
@@ -105,6 +115,13 @@ class BlockParser:  # noqa: D101
             state_id_suffix: State ID suffix to use.
             state_strategy: Strategy to use for state evolution.
             run_id: Custom run ID to use.
+            dbt_workers: Long-lived dbt workers to run dbt commands in, if any.
+            containers: Whether to run extractors, mappers and loaders referenced
+                with a command in the container of that command.
+            shards: The number of shards to split the selected streams of every
+                extractor into.
+            max_records_per_stream: The maximum number of records every extractor
+                relays per stream. Limited runs never update state.
 
         Raises:
             ClickException: If a block name is not found.
@@ -120,14 +137,24 @@ class BlockParser:  # noqa: D101
         self._plugins: list[ProjectPlugin] = []
         self._commands: dict[int, str] = {}
         self._mappings_ref: dict[int, str] = {}
+        self._fan_outs: dict[int, list[ProjectPlugin]] = {}
         self._state_strategy = state_strategy
         self._run_id = run_id
+        self._dbt_workers = dbt_workers
+        self._containers = containers
+        self._shards = shards
+        self._max_records_per_stream = max_records_per_stream
 
         task_sets_service: TaskSetsService = TaskSetsService(project)
 
         blocks = self._expand_jobs(blocks, task_sets_service)
 
         for idx, name in enumerate(blocks):
+            if "," in name:
+                self._fan_outs[idx] = self._find_fan_out(name)
+                self._plugins.append(self._fan_outs[idx][0])
+                continue
+
             try:
                 parsed_name, command_name = name.split(":")
             except ValueError:
@@ -163,7 +190,40 @@ class BlockParser:  # noqa: D101
     @property
     def plugins(self) -> list[ProjectPlugin]:
         """The list of plugins in the block."""
-        return self._plugins
+        return [
+            plugin
+            for idx, head in enumerate(self._plugins)
+            for plugin in self._fan_outs.get(idx, [head])
+        ]
+
+    def _find_fan_out(self, name: str) -> list[ProjectPlugin]:
+        """Find the loaders of a comma-separated list of loader names.
+
+        Args:
+            name: The comma-separated loader names, e.g. "target-a,target-b".
+
+        Returns:
+            The loaders.
+
+        Raises:
+            ClickException: If a loader is not found, or a plugin is not a loader.
+        """
+        loaders: list[ProjectPlugin] = []
+        for loader_name in name.split(","):
+            try:
+                plugin = self.project.plugins.find_plugin(loader_name)
+            except PluginNotFoundError as e:
+                raise click.ClickException(f"Block {loader_name} not found") from e  # noqa: EM102, TRY003
+
+            if plugin.type != PluginType.LOADERS:
+                raise click.ClickException(  # noqa: TRY003
+                    f"Only loaders can be listed together in '{name}', but "  # noqa: EM102
+                    f"'{loader_name}' is not a loader.",
+                )
+            loaders.append(plugin)
+
+        self.log.debug("found loaders to fan out to", plugin_names=name)
+        return loaders
 
     def _expand_jobs(self, blocks: list[str], task_sets: TaskSetsService) -> list[str]:
         """Expand any jobs present in a list of blocks into their raw block names.
@@ -226,6 +286,7 @@ class BlockParser:  # noqa: D101
                     self._plugins[cur],
                     self.project,
                     command=self._commands.get(cur),
+                    dbt_workers=self._dbt_workers,
                 )
                 cur += 1
             else:
@@ -237,11 +298,14 @@ class BlockParser:  # noqa: D101
     def _find_next_elb_set(
         self,
         offset: int = 0,
+        shard: int | None = None,
     ) -> tuple[ExtractLoadBlocks | None, int]:
         """Search plugins to find an extract EL block set.
 
         Args:
             offset: Optional starting offset for search.
+            shard: The 1-based index of the shard to find the block set for, if
+                the set is sharded.
 
         Returns:
             The `ExtractLoadBlocks` object, and offset for remaining plugins.
@@ -249,18 +313,26 @@ class BlockParser:  # noqa: D101
         Raises:
             BlockSetValidationError: If the block set is not valid.
         """
-        blocks: list[SingerBlock] = []
+        blocks: list[SingerBlock | FanOutBlock] = []
 
         builder = (
             ELBContextBuilder(self.project)
             .with_force(force=self._force)  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
             .with_full_refresh(full_refresh=self._full_refresh)
             .with_refresh_catalog(refresh_catalog=self._refresh_catalog)
-            .with_no_state_update(no_state_update=self._no_state_update)
+            .with_no_state_update(
+                # State of a limited run would skip the records left out
+                no_state_update=self._no_state_update
+                or self._max_records_per_stream is not None,
+            )
             .with_state_id_suffix(self._state_id_suffix)
             .with_state_strategy(state_strategy=self._state_strategy)
             .with_run_id(self._run_id)
+            .with_containers(containers=self._containers)
+            .with_max_records_per_stream(self._max_records_per_stream)
         )
+        if shard is not None:
+            builder.with_shard(shard, self._shards)
 
         if self._plugins[offset].type != PluginType.EXTRACTORS:
             self.log.debug(
@@ -275,7 +347,12 @@ class BlockParser:  # noqa: D101
             block=self._plugins[offset].name,
         )
 
-        blocks.append(builder.make_block(self._plugins[offset]))
+        blocks.append(
+            builder.make_block(
+                self._plugins[offset],
+                command=self._commands.get(offset),
+            ),
+        )
 
         for idx, plugin in enumerate(self._plugins[offset + 1 :]):
             next_block = idx + 1
@@ -313,12 +390,36 @@ class BlockParser:  # noqa: D101
                         f"Expected unique mappings name not the mapper plugin "  # noqa: EM102
                         f"name: {plugin.name}.",
                     )
-                blocks.append(builder.make_block(plugin))
+                blocks.append(
+                    builder.make_block(
+                        plugin,
+                        command=self._commands.get(offset + next_block),
+                    ),
+                )
 
             elif plugin.type == PluginType.LOADERS:
                 self.log.debug("blocks", offset=offset, idx=next_block)
-                blocks.append(builder.make_block(plugin))
-                elb = ExtractLoadBlocks(builder.context(), blocks)
+                if loaders := self._fan_outs.get(offset + next_block):
+                    blocks.append(builder.make_fan_out_block(loaders))
+                else:
+                    blocks.append(
+                        builder.make_block(
+                            plugin,
+                            command=self._commands.get(offset + next_block),
+                        ),
+                    )
+                elb: ExtractLoadBlocks
+                if shard is None and self._shards > 1:
+                    shards = [
+                        t.cast(
+                            "ExtractLoadBlocks",
+                            self._find_next_elb_set(offset, shard=index)[0],
+                        )
+                        for index in range(1, self._shards + 1)
+                    ]
+                    elb = ShardedExtractLoadBlocks(builder.context(), blocks, shards)
+                else:
+                    elb = ExtractLoadBlocks(builder.context(), blocks)
                 return elb, idx + 2
             else:
                 self.log.warning(
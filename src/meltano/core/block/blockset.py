@@ -6,6 +6,8 @@ import typing as t
 from abc import ABC, abstractmethod
 
 if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from meltano.core.block.ioblock import IOBlock
 
 _T = t.TypeVar("_T", bound="IOBlock")
@@ -35,6 +37,11 @@ class BlockSet(ABC, t.Generic[_T]):
 
     blocks: tuple[_T, ...]
 
+    @property
+    def plugin_blocks(self) -> Sequence[IOBlock]:
+        """The blocks of the individual plugins in the set."""
+        return self.blocks
+
     @abstractmethod
     async def run(self) -> None:
         """Do whatever a BlockSet is designed to do."""
@@ -0,0 +1,110 @@
+"""`ContainerBlock` runs singer plugins in containers to implement `IOBlock`."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import typing as t
+
+from meltano.core.block.singer import SingerBlock
+from meltano.core.logging import capture_output_batches
+from meltano.core.runner import RunnerError
+
+if sys.version_info >= (3, 12):
+    from typing import override  # noqa: ICN003
+else:
+    from typing_extensions import override
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from meltano.core.container.container_service import ContainerProcess
+    from meltano.core.elt_context import PluginContext
+    from meltano.core.plugin_invoker import PluginInvoker
+    from meltano.core.project import Project
+
+
+class ContainerBlock(SingerBlock):
+    """ContainerBlock runs a singer plugin command that declares a container spec.
+
+    The standard streams of the container are read from and written to the
+    Docker attach socket in chunks, and its output is proxied a batch of lines
+    at a time rather than line by line.
+    """
+
+    def __init__(
+        self,
+        block_ctx: PluginContext,
+        project: Project,
+        plugin_invoker: PluginInvoker,
+        plugin_args: Sequence[str],
+        plugin_command: str,
+    ):
+        """Configure and return a containerized Singer plugin wrapped as an IOBlock.
+
+        Args:
+            block_ctx: the block context.
+            project:  the project to use to obtain project settings.
+            plugin_invoker: the plugin invoker.
+            plugin_args: any additional plugin args that should be used.
+            plugin_command: the plugin command that declares the container spec.
+        """
+        super().__init__(
+            block_ctx=block_ctx,
+            project=project,
+            plugin_invoker=plugin_invoker,
+            plugin_args=plugin_args,
+        )
+        self.plugin_command = plugin_command
+
+    @property
+    def container_process(self) -> ContainerProcess:
+        """The running container of the underlying plugin."""
+        return t.cast("ContainerProcess", self.process_handle)
+
+    @override
+    async def start(self) -> None:
+        """Start the ContainerBlock by starting the plugin container.
+
+        Raises:
+            RunnerError: If the plugin container can not start.
+        """
+        try:
+            self._process_handle = await self.invoker.invoke_container(  # type: ignore[assignment]  # ty:ignore[invalid-assignment]
+                self.plugin_command,
+                *self.plugin_args,
+                attach_stdin=self.consumer,
+            )
+        except Exception as err:
+            raise RunnerError(f"Cannot start plugin {self.string_id}: {err}") from err  # noqa: EM102, TRY003
+
+    @override
+    def proxy_stdout(self) -> asyncio.Task:
+        """Start proxying stdout to the linked stdout destinations.
+
+        Returns:
+            The stdout proxy future.
+        """
+        if self._stdout_future is None:
+            outputs = self._merge_outputs(self.invoker.StdioSource.STDOUT, self.outputs)
+            self._stdout_future = asyncio.ensure_future(
+                capture_output_batches(self.container_process.stdout, *outputs),
+            )
+        return self._stdout_future
+
+    @override
+    def proxy_stderr(self) -> asyncio.Task:
+        """Start proxying stderr to the linked stderr destinations.
+
+        Returns:
+            The stderr proxy future.
+        """
+        if self._stderr_future is None:
+            err_outputs = self._merge_outputs(
+                self.invoker.StdioSource.STDERR,
+                self.err_outputs,
+            )
+            self._stderr_future = asyncio.ensure_future(
+                capture_output_batches(self.container_process.stderr, *err_outputs),
+            )
+        return self._stderr_future
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import typing as t
-from contextlib import asynccontextmanager, closing
+from contextlib import asynccontextmanager, closing, suppress
 
 import structlog
 
@@ -14,22 +15,31 @@ from meltano.core._state import StateStrategy
 from meltano.core.constants import STATE_ID_COMPONENT_DELIMITER
 from meltano.core.db import project_engine
 from meltano.core.elt_context import PluginContext
-from meltano.core.job import Job, JobFinder
+from meltano.core.job import Job, JobFinder, Payload
 from meltano.core.job.stale_job_failer import fail_stale_jobs
+from meltano.core.job_state import SINGER_STATE_KEY
 from meltano.core.logging import JobLoggingService, OutputLogger
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.error import PluginExecutionError, PluginLacksCapabilityError
 from meltano.core.plugin.settings_service import PluginSettingsService
+from meltano.core.plugin.singer.catalog import ListSelectedExecutor, shard_catalog
 from meltano.core.plugin_invoker import invoker_factory
 from meltano.core.runner import RunnerError
+from meltano.core.setting_definition import json_dumps
 from meltano.core.state_service import StateService
 
 from .blockset import BlockSet, BlockSetValidationError
+from .container import ContainerBlock
+from .fan_out import FanOutBlock
 from .future_utils import first_failed_future, handle_producer_line_length_limit_error
+from .sample import RecordSampler, selected_streams
 from .singer import SingerBlock
 
 if t.TYPE_CHECKING:
     import sys
     import uuid
+    from asyncio import StreamWriter
+    from collections.abc import Sequence
     from pathlib import Path
 
     from sqlalchemy.orm import Session
@@ -70,6 +80,8 @@ class ELBContext(ELContextProtocol):
         base_output_logger: OutputLogger | None = None,
         state_strategy: StateStrategy = StateStrategy.auto,
         run_id: uuid.UUID | None = None,
+        shard: str | None = None,
+        max_records_per_stream: int | None = None,
     ):
         """Use an ELBContext to pass information on to ExtractLoadBlocks.
 
@@ -85,6 +97,9 @@ class ELBContext(ELContextProtocol):
             base_output_logger: The base logger to use.
             state_strategy: Strategy to use for state updates.
             run_id: The run ID to use.
+            shard: The shard of a sharded extraction this context runs, if any.
+            max_records_per_stream: The maximum number of records the extractor
+                relays per stream, if limited.
         """
         self.project = project
         self.session = session
@@ -96,6 +111,8 @@ class ELBContext(ELContextProtocol):
         self.state_id_suffix = state_id_suffix
         self.state_strategy = state_strategy
         self.run_id = run_id
+        self.shard = shard
+        self.max_records_per_stream = max_records_per_stream
 
         # not yet used but required to satisfy the interface
         self.dry_run = False
@@ -132,6 +149,9 @@ class ELBContextBuilder:
         self._blocks = []
         self._state_strategy = StateStrategy.auto
         self._run_id: uuid.UUID | None = None
+        self._containers = False
+        self._shard: str | None = None
+        self._max_records_per_stream: int | None = None
 
         self._base_output_logger = None
 
@@ -235,32 +255,103 @@ class ELBContextBuilder:
         self._run_id = run_id
         return self
 
+    def with_containers(self, *, containers: bool):  # noqa: ANN201
+        """Set whether plugin commands with a container spec run in containers.
+
+        Args:
+            containers: Whether to run plugin commands in containers.
+
+        Returns:
+            self
+        """
+        self._containers = containers
+        return self
+
+    def with_shard(self, index: int, count: int):  # noqa: ANN201
+        """Set the shard of a sharded extraction the blocks run.
+
+        Args:
+            index: The 1-based index of the shard.
+            count: The number of shards.
+
+        Returns:
+            self
+        """
+        self._shard = f"shard-{index}-of-{count}"
+        return self
+
+    def with_max_records_per_stream(self, max_records: int | None):  # noqa: ANN201
+        """Limit the number of records the extractor relays per stream.
+
+        Args:
+            max_records: The maximum number of records per stream, if limited.
+
+        Returns:
+            self
+        """
+        self._max_records_per_stream = max_records
+        return self
+
     def make_block(
         self,
         plugin: ProjectPlugin,
         plugin_args: list[str] | None = None,
+        command: str | None = None,
     ) -> SingerBlock:
         """Create a new `SingerBlock` object, from a plugin.
 
         Args:
             plugin: The plugin to be executed.
             plugin_args: The arguments to be passed to the plugin.
+            command: The plugin command the block was referenced with, if any.
+                When running in containers, its container spec is used.
 
         Returns:
-            The new `SingerBlock` object.
+            The new `SingerBlock` object, or a `ContainerBlock` when running the
+            plugin command in a container.
         """
         ctx = self.plugin_context(plugin, env=self._env.copy())
 
-        block = SingerBlock(
-            block_ctx=ctx,
-            project=self.project,
-            plugin_invoker=self.invoker_for(ctx),
-            plugin_args=plugin_args or (),
-        )
+        block: SingerBlock
+        if self._containers and command:
+            block = ContainerBlock(
+                block_ctx=ctx,
+                project=self.project,
+                plugin_invoker=self.invoker_for(ctx),
+                plugin_args=plugin_args or (),
+                plugin_command=command,
+            )
+        else:
+            block = SingerBlock(
+                block_ctx=ctx,
+                project=self.project,
+                plugin_invoker=self.invoker_for(ctx),
+                plugin_args=plugin_args or (),
+            )
         self._blocks.append(block)
         self._env.update(ctx.env)
         return block
 
+    def make_fan_out_block(self, plugins: t.Sequence[ProjectPlugin]) -> FanOutBlock:
+        """Create a new `FanOutBlock` object, from several loaders.
+
+        Every loader gets the environment of the blocks upstream of it, but not
+        the environment of the other loaders.
+
+        Args:
+            plugins: The loaders to be executed.
+
+        Returns:
+            The new `FanOutBlock` object.
+        """
+        upstream_env = self._env
+        blocks: list[SingerBlock] = []
+        for plugin in plugins:
+            self._env = upstream_env.copy()
+            blocks.append(self.make_block(plugin))
+        self._env = upstream_env
+        return FanOutBlock(self.project, blocks)
+
     def plugin_context(
         self,
         plugin: ProjectPlugin,
@@ -297,11 +388,16 @@ class ELBContextBuilder:
         Returns:
             A new `PluginInvoker` object.
         """
+        run_dir = self.elt_run_dir
+        if run_dir is None and self._shard:
+            # Shards run concurrently, so each needs its own plugin files
+            run_dir = self.project.dirs.run(plugin_context.plugin.name, self._shard)
+
         return invoker_factory(
             self.project,
             plugin_context.plugin,
             context=self.context(),
-            run_dir=self.elt_run_dir,
+            run_dir=run_dir,
             plugin_settings_service=plugin_context.settings_service,
         )
 
@@ -331,16 +427,18 @@ class ELBContextBuilder:
             base_output_logger=self._base_output_logger,
             state_strategy=self._state_strategy,
             run_id=self._run_id,
+            shard=self._shard,
+            max_records_per_stream=self._max_records_per_stream,
         )
 
 
-class ExtractLoadBlocks(BlockSet[SingerBlock]):
+class ExtractLoadBlocks(BlockSet[SingerBlock | FanOutBlock]):
     """`BlockSet` that supports basic EL (extract, load) patterns."""
 
     def __init__(
         self,
         context: ELBContext,
-        blocks: t.Sequence[SingerBlock],
+        blocks: t.Sequence[SingerBlock | FanOutBlock],
     ):
         """Initialize a basic BlockSet suitable for executing ELT tasks.
 
@@ -362,23 +460,24 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
                 self.context.state_id_suffix,
                 self.head,
                 self.tail,
+                shard=self.context.shard,
             )
             self.context.job = Job(job_name=state_id)
             if self.context.run_id:
                 self.context.job.run_id = self.context.run_id
 
             job_logging_service = JobLoggingService(self.context.project)
-            log_file = job_logging_service.generate_log_name(
+            self.output_logger = job_logging_service.create_output_logger(
                 self.context.job.job_name,
                 self.context.job.run_id,
             )
-            self.output_logger = OutputLogger(log_file)
 
         self._process_futures = None
         self._stdout_futures = None
         self._stderr_futures = None
         self._errors = []
         self._state_service = None
+        self.sampler: RecordSampler | None = None
 
     def has_state(self) -> bool:
         """Check to see if any block in this BlockSet has 'state' capability.
@@ -493,20 +592,34 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             manager = ELBExecutionManager(self)
             await manager.run()
 
+        if self.sampler:
+            logger.info(
+                "Sampled records",
+                records=dict(self.sampler.records),
+                dropped=self.sampler.dropped,
+            )
+
     async def run(self) -> None:
         """Run the ELT task."""
-        if self.context.job:
+        if job := self.context.job:
+            # The job may be detached from its session by the time the run ends
+            state_id, run_id = job.job_name, job.run_id
             # TODO: legacy `meltano elt` style logging should be deprecated
             legacy_log_handler = self.output_logger.out("meltano", logger)
-            with legacy_log_handler.redirect_logging():
-                await self.run_with_job()
-                return
-        else:
-            logger.warning(
-                "No active environment, proceeding with stateless run! See "
-                "https://docs.meltano.com/reference/command-line-interface#run "
-                "for details.",
-            )
+            try:
+                with legacy_log_handler.redirect_logging():
+                    await self.run_with_job()
+            finally:
+                JobLoggingService(self.context.project).finalize_log(
+                    state_id,
+                    run_id,
+                )
+            return
+        logger.warning(
+            "No active environment, proceeding with stateless run! See "
+            "https://docs.meltano.com/reference/command-line-interface#run "
+            "for details.",
+        )
         await self.execute()
 
     async def run_with_job(self) -> None:
@@ -602,6 +715,21 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         """
         return self.blocks[-1]
 
+    @property
+    def plugin_blocks(self) -> list[SingerBlock]:
+        """Obtain the plugin blocks in the block set, including fanned out consumers.
+
+        Returns:
+            The plugin blocks in the block set.
+        """
+        return [
+            plugin_block
+            for block in self.blocks
+            for plugin_block in (
+                block.blocks if isinstance(block, FanOutBlock) else (block,)
+            )
+        ]
+
     @property
     def intermediate(self) -> tuple[IOBlock]:
         """Obtain the intermediate blocks in the set - excluding the first and last block.
@@ -615,13 +743,44 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
     async def _start_blocks(self) -> AsyncGenerator[None]:
         """Start the blocks in the block set.
 
+        Blocks are prepared concurrently, e.g. the loader's configuration is
+        rendered while the extractor's catalog is being discovered. Each block
+        is started as soon as it and all of the blocks upstream of it are
+        prepared, so processes are still started in order. If any block fails
+        to prepare or start, the pending preparations are cancelled and any
+        processes that were already started are killed.
+
         Yields:
             None
         """
+        prepared = [
+            asyncio.ensure_future(block.pre(self.context)) for block in self.blocks
+        ]
+        started: list[IOBlock] = []
         try:
-            for block in self.blocks:
-                await block.pre(self.context)
-                await block.start()
+            try:
+                pending: set[asyncio.Future] = set(prepared)
+                for block, preparation in zip(self.blocks, prepared, strict=True):
+                    while not preparation.done():
+                        done, pending = await asyncio.wait(
+                            pending,
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        # Fail fast if any other block failed to prepare
+                        for future in done:
+                            future.result()
+                    preparation.result()
+                    await block.start()
+                    started.append(block)
+            except BaseException:
+                for preparation in prepared:
+                    preparation.cancel()
+                await asyncio.gather(*prepared, return_exceptions=True)
+                await asyncio.gather(
+                    *(block.stop(kill=True) for block in started),
+                    return_exceptions=True,
+                )
+                raise
             yield
         finally:
             await self._cleanup()
@@ -639,7 +798,7 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         Raises:
             BlockSetValidationError: if consumer does not have an upstream producer.
         """
-        for idx, block in enumerate(self.blocks):
+        for block in self.plugin_blocks:
             context = {
                 "consumer": block.consumer,
                 "producer": block.producer,
@@ -665,16 +824,234 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
                     log_parser=block.invoker.get_log_parser(),
                 ),
             )
+
+        for idx, block in enumerate(self.blocks):
             if block.consumer and block.stdin is not None:
                 if idx != 0 and self.blocks[idx - 1].producer:
+                    stdin = block.stdin
+                    if idx == 1 and self.context.max_records_per_stream:
+                        stdin = self._sample(stdin)
                     self.blocks[idx - 1].stdout_link(
-                        block.stdin,
+                        stdin,
                     )  # link previous blocks stdout with current blocks stdin
                 else:
                     raise BlockSetValidationError(  # noqa: TRY003
                         "run step requires input but has no upstream",  # noqa: EM101
                     )
 
+    def _sample(self, stdin: StreamWriter) -> StreamWriter:
+        """Limit the records the extractor relays to stdin per stream.
+
+        Args:
+            stdin: The stdin of the block downstream of the extractor.
+
+        Returns:
+            The writer relaying the sampled output to stdin.
+        """
+        head = t.cast("SingerBlock", self.head)
+        catalog_path = head.invoker.files.get("catalog")
+        streams = selected_streams(catalog_path) if catalog_path else None
+        if streams is None:
+            logger.warning(
+                "Selected streams are unknown, the extractor will run to completion",
+                block=head.string_id,
+            )
+
+        def end_extractor() -> None:
+            logger.info(
+                "Sampled every selected stream, ending the extractor",
+                block=head.string_id,
+            )
+            with suppress(ProcessLookupError):
+                head.process_handle.terminate()
+
+        self.sampler = RecordSampler(
+            stdin,
+            t.cast("int", self.context.max_records_per_stream),
+            streams,
+            end_extractor,
+        )
+        return t.cast("StreamWriter", self.sampler)
+
+
+class ShardedExtractLoadBlocks(ExtractLoadBlocks):
+    """`ExtractLoadBlocks` splitting the selected streams of the extractor into shards.
+
+    Every shard runs its own extractor process with a catalog limited to its
+    share of the selected streams, loads into its own loader processes, and keeps
+    its own state ID. The state of every shard is merged onto the state ID of the
+    set as a whole, which seeds the shards of the next run.
+    """
+
+    def __init__(
+        self,
+        context: ELBContext,
+        blocks: t.Sequence[SingerBlock | FanOutBlock],
+        shards: Sequence[ExtractLoadBlocks],
+    ):
+        """Initialize a sharded BlockSet.
+
+        Args:
+            context: the elt context to use for this elt run.
+            blocks: the IOBlocks of the set as a whole, used to load the catalog.
+            shards: the sets running each shard.
+        """
+        super().__init__(context, blocks)
+        self.shards = tuple(shards)
+
+    def validate_set(self) -> None:
+        """Validate the set and every shard.
+
+        Raises:
+            BlockSetValidationError: if the block set is not valid.
+        """
+        super().validate_set()
+        if not isinstance(self.head, SingerBlock):
+            raise BlockSetValidationError("first block in set should be an extractor")  # noqa: EM101, TRY003
+
+        for shard in self.shards:
+            shard.validate_set()
+
+    async def run(self) -> None:
+        """Run the shards of the ELT task concurrently.
+
+        Raises:
+            BaseException: the first error a shard failed with.
+        """
+        shards = await self._plan_shards()
+        track_state = self.context.job is not None and self.has_state()
+
+        with closing(self.context.session):
+            if track_state and not self.context.full_refresh:
+                self._seed_state(shards)
+
+            results = await asyncio.gather(
+                *(
+                    self._run_shard(shard, streams, track_state=track_state)
+                    for shard, streams in shards
+                ),
+                return_exceptions=True,
+            )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def terminate(self, *, graceful: bool = False) -> None:
+        """Terminate every shard of an in flight ExtractLoad execution.
+
+        Args:
+            graceful: Whether the shards should try to gracefully quit.
+        """
+        await asyncio.gather(
+            *(shard.terminate(graceful=graceful) for shard in self.shards),
+        )
+
+    async def _plan_shards(self) -> list[tuple[ExtractLoadBlocks, frozenset[str]]]:
+        """Assign the selected streams of the extractor to the shards.
+
+        Returns:
+            The shards that have streams to extract, with the IDs and names of
+            their streams.
+
+        Raises:
+            RunnerError: if the catalog of the extractor is not available.
+        """
+        head = t.cast("SingerBlock", self.head)
+        try:
+            async with head.invoker.prepared(self.context.session):
+                catalog = json.loads(await head.invoker.dump("catalog"))
+        except (
+            FileNotFoundError,
+            PluginExecutionError,
+            PluginLacksCapabilityError,
+        ) as err:
+            msg = f"Cannot shard the streams of {head.string_id}: {err}"
+            raise RunnerError(msg) from err
+
+        catalogs = shard_catalog(catalog, len(self.shards))
+        if not catalogs:
+            logger.warning("No streams selected to shard", block=head.string_id)
+
+        for shard, shard_catalog_ in zip(self.shards, catalogs, strict=False):
+            shard_head = t.cast("SingerBlock", shard.head)
+            catalog_path = shard_head.invoker.plugin_config_service.run_dir.joinpath(
+                "tap.shard.properties.json",
+            )
+            catalog_path.write_text(json_dumps(shard_catalog_, indent=2))
+            shard_head.invoker.settings_service.config_override["_catalog"] = str(
+                catalog_path,
+            )
+            logger.debug(
+                "Assigned streams to shard",
+                shard=shard.context.shard,
+                streams=len(shard_catalog_["streams"]),
+            )
+
+        return [
+            (shard, _shard_streams(shard_catalog_))
+            for shard, shard_catalog_ in zip(self.shards, catalogs, strict=False)
+        ]
+
+    def _seed_state(
+        self,
+        shards: Sequence[tuple[ExtractLoadBlocks, frozenset[str]]],
+    ) -> None:
+        """Merge the state of the set's streams onto the state of every shard.
+
+        This carries state over from runs with a different number of shards,
+        or from runs that were not sharded at all. Each shard is only seeded
+        with the state of its own streams.
+
+        Args:
+            shards: The shards to seed the state of, with their streams.
+        """
+        state_id = t.cast("Job", self.context.job).job_name
+        if not (state := self.state_service.get_state(state_id)):
+            return
+
+        for shard, streams in shards:
+            self.state_service.add_state(
+                t.cast("Job", shard.context.job).job_name,
+                json.dumps(_shard_state(state, streams)),
+                payload_flags=Payload.INCOMPLETE_STATE,
+            )
+
+    async def _run_shard(
+        self,
+        shard: ExtractLoadBlocks,
+        streams: frozenset[str],
+        *,
+        track_state: bool,
+    ) -> None:
+        """Run a shard, and merge its state onto the state of the set as a whole.
+
+        Taps emit the bookmarks of every stream they were given state for, so
+        only the state of the shard's own streams is merged. Otherwise a shard
+        could revert the bookmarks other shards advanced.
+
+        Args:
+            shard: The shard to run.
+            streams: The IDs and names of the streams of the shard.
+            track_state: Whether to merge the state of the shard.
+        """
+        if not track_state:
+            await shard.run()
+            return
+
+        # The jobs may be detached from their sessions by the time the run ends
+        shard_state_id = t.cast("Job", shard.context.job).job_name
+        state_id = t.cast("Job", self.context.job).job_name
+        try:
+            await shard.run()
+        finally:
+            if state := self.state_service.get_state(shard_state_id):
+                self.state_service.add_state(
+                    state_id,
+                    json.dumps(_shard_state(state, streams)),
+                    payload_flags=Payload.INCOMPLETE_STATE,
+                )
+
 
 class ELBExecutionManager:
     """Execution manager for ExtractLoadBlock sets."""
@@ -686,9 +1063,14 @@ class ELBExecutionManager:
             elb: The `ExtractLoadBlocks` to manage.
         """
         self.elb = elb
-        self.stream_buffer_size = self.elb.context.project.settings.get(
-            "elt.buffer_size",
-        )
+        settings = self.elb.context.project.settings
+        self.stream_buffer_size = settings.get("elt.buffer_size")
+        self.buffer_size_setting = "elt.buffer_size"
+        max_buffer_size = settings.get("elt.max_buffer_size")
+        if max_buffer_size > self.stream_buffer_size:
+            # Longer messages are read up to half the maximum buffer size
+            self.stream_buffer_size = max_buffer_size
+            self.buffer_size_setting = "elt.max_buffer_size"
         self.line_length_limit = self.stream_buffer_size // 2
 
         self._producer_code = None
@@ -704,6 +1086,9 @@ class ELBExecutionManager:
         any of the blocks exit with a non 0 exit code.
         """
         await self._wait_for_process_completion(self.elb.head)
+        if self.elb.sampler and self.elb.sampler.sampled:
+            # The extractor was ended once every stream was sampled
+            self._producer_code = 0
         _check_exit_codes(
             self._producer_code,
             self._consumer_code,
@@ -775,6 +1160,7 @@ class ELBExecutionManager:
                     output_futures_failed.exception(),
                     line_length_limit=self.line_length_limit,
                     stream_buffer_size=self.stream_buffer_size,
+                    setting=self.buffer_size_setting,
                 )
             raise output_futures_failed.exception()
 
@@ -886,11 +1272,62 @@ def _check_exit_codes(
         raise RunnerError("Mappers failed", failed_mappers)  # noqa: EM101, TRY003
 
 
+def _shard_streams(catalog: dict[str, t.Any]) -> frozenset[str]:
+    """Get the IDs and names of the selected streams of a shard catalog.
+
+    Args:
+        catalog: The catalog of the shard.
+
+    Returns:
+        The stream IDs and names, either of which taps may key bookmarks by.
+    """
+    list_selected = ListSelectedExecutor()
+    list_selected.visit(catalog)  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
+    selected = {stream for stream, selection in list_selected.streams if selection}
+    return frozenset(
+        name
+        for stream in catalog["streams"]
+        if stream["tap_stream_id"] in selected
+        for name in (stream["tap_stream_id"], stream.get("stream"))
+        if name
+    )
+
+
+def _shard_state(state: dict[str, t.Any], streams: frozenset[str]) -> dict[str, t.Any]:
+    """Keep only the Singer state of some streams.
+
+    Args:
+        state: The state, with the Singer state under `singer_state`.
+        streams: The IDs and names of the streams to keep the state of.
+
+    Returns:
+        The state, without the bookmarks of other streams.
+    """
+    singer_state = state.get(SINGER_STATE_KEY)
+    if not isinstance(singer_state, dict):
+        return state
+
+    singer_state = {
+        key: value
+        for key, value in singer_state.items()
+        if key != "currently_syncing" or value in streams
+    }
+    if isinstance(bookmarks := singer_state.get("bookmarks"), dict):
+        singer_state["bookmarks"] = {
+            stream: bookmark
+            for stream, bookmark in bookmarks.items()
+            if stream in streams
+        }
+    return {**state, SINGER_STATE_KEY: singer_state}
+
+
 def generate_state_id(
     project: Project,
     state_id_suffix: str | None,
     consumer: IOBlock,
     producer: IOBlock,
+    *,
+    shard: str | None = None,
 ) -> str:
     """Generate a state ID from the active environment and consumer & producer names.
 
@@ -899,6 +1336,7 @@ def generate_state_id(
         state_id_suffix: State ID suffix value.
         consumer: Consumer block.
         producer: Producer block.
+        shard: The shard of a sharded extraction, if any.
 
     Returns:
         State id string.
@@ -915,6 +1353,7 @@ def generate_state_id(
         project.environment.name,
         f"{consumer.string_id}-to-{producer.string_id}",
         state_id_suffix or project.environment.state_id_suffix,
+        shard,
     ]
 
     if any(c for c in state_id_components if c and STATE_ID_COMPONENT_DELIMITER in c):
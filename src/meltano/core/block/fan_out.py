@@ -0,0 +1,467 @@
+"""`FanOutBlock` relays the output of a producer to several consumers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import typing as t
+from collections import deque
+from contextlib import suppress
+
+import structlog
+
+from meltano.core.block.ioblock import IOBlock
+from meltano.core.logging.utils import AsyncStreamWriter, _write_lines_writer
+from meltano.core.plugin.singer.target import BookmarkWriter
+
+if sys.version_info >= (3, 12):
+    from typing import override  # noqa: ICN003
+else:
+    from typing_extensions import override
+
+if t.TYPE_CHECKING:
+    from asyncio import StreamWriter
+    from collections.abc import Sequence
+
+    from meltano.core.block.singer import SingerBlock
+    from meltano.core.logging.utils import SubprocessOutputWriter
+    from meltano.core.project import Project
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class _ConsumerBuffer:
+    """A bounded buffer relaying data to the stdin of a single consumer."""
+
+    def __init__(self, block: IOBlock, size: int) -> None:
+        self.block = block
+        self.size = size
+        self.closed = False
+        self._chunks: deque[bytes] = deque()
+        self._buffered = 0
+        self._closing = False
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self.future = asyncio.ensure_future(self._relay())
+
+    def put(self, data: bytes) -> None:
+        if self.closed:
+            return
+        self._chunks.append(data)
+        self._buffered += len(data)
+        self._readable.set()
+        if self._buffered >= self.size:
+            self._writable.clear()
+
+    def close(self) -> None:
+        self._closing = True
+        self._readable.set()
+
+    async def wait_writable(self) -> None:
+        await self._writable.wait()
+
+    async def _relay(self) -> None:
+        stdin = t.cast("SubprocessOutputWriter", self.block.stdin)
+        try:
+            while self._chunks or not self._closing:
+                if not self._chunks:
+                    self._readable.clear()
+                    await self._readable.wait()
+                    continue
+                # Write everything buffered while the consumer was busy at once
+                chunks = list(self._chunks)
+                self._chunks.clear()
+                if not await _write_lines_writer(stdin, chunks):
+                    logger.debug(
+                        "Consumer closed its input",
+                        block=self.block.string_id,
+                    )
+                    break
+                self._buffered -= sum(len(chunk) for chunk in chunks)
+                if self._buffered < self.size:
+                    self._writable.set()
+        finally:
+            # A closed consumer must not hold back the others
+            self.closed = True
+            self._chunks.clear()
+            self._buffered = 0
+            self._writable.set()
+
+        with suppress(BrokenPipeError, ConnectionResetError):
+            await self.block.close_stdin()
+
+
+class TeeWriter(AsyncStreamWriter):
+    """Relays data written to it to the stdin of several consumers.
+
+    Each consumer is written to from its own buffer, so that a consumer that is
+    momentarily slow does not stall the others. `drain` waits until every
+    consumer has room in its buffer, so the slowest consumer sets the pace of
+    the producer.
+    """
+
+    def __init__(self, consumers: Sequence[IOBlock], buffer_size: int) -> None:
+        """Initialize the `TeeWriter` instance.
+
+        Args:
+            consumers: The consumer blocks to relay data to.
+            buffer_size: The size of the buffer of each consumer, in bytes.
+        """
+        self._buffers = [_ConsumerBuffer(block, buffer_size) for block in consumers]
+
+    @override
+    def write(self, data: bytes) -> None:
+        """Write data to the stdin of every consumer.
+
+        Args:
+            data: The data to write.
+
+        Raises:
+            BrokenPipeError: If all consumers closed their stdin.
+        """
+        buffers = [buffer for buffer in self._buffers if not buffer.closed]
+        if not buffers:
+            raise BrokenPipeError
+        for buffer in buffers:
+            buffer.put(data)
+
+    @override
+    async def drain(self) -> None:
+        """Wait until every consumer has room in its buffer."""
+        for buffer in self._buffers:
+            await buffer.wait_writable()
+
+    @override
+    def close(self) -> None:
+        """Close the stdin of every consumer once its buffer is written."""
+        for buffer in self._buffers:
+            buffer.close()
+
+    @override
+    async def wait_closed(self) -> None:
+        """Wait until the stdin of every consumer is closed."""
+        await asyncio.gather(*(buffer.future for buffer in self._buffers))
+
+
+class StateGate:
+    """Persists a state only once every consumer has acknowledged it.
+
+    Consumers emit the state messages they received once the records before
+    them are loaded. A state is persisted when it has been emitted by every
+    consumer, at which point the states emitted before it are superseded.
+
+    States are numbered in the order they are first emitted. Only the states
+    emitted after the last acknowledgement of the slowest consumer are kept,
+    since the others can not be acknowledged by every consumer anymore, and at
+    most `max_pending` of them.
+    """
+
+    def __init__(
+        self,
+        writer: SubprocessOutputWriter,
+        consumers: Sequence[str],
+        *,
+        max_pending: int = 1000,
+    ) -> None:
+        """Initialize the `StateGate` instance.
+
+        Args:
+            writer: The writer persisting the acknowledged states.
+            consumers: The names of the consumers that acknowledge states.
+            max_pending: The maximum number of states waiting to be acknowledged
+                by every consumer. The oldest ones are dropped past it.
+        """
+        self.writer = writer
+        self.consumers = tuple(consumers)
+        self.max_pending = max_pending
+        # The sequence number of each pending state by its serialized form, in
+        # sequence order, and the consumers that acknowledged it
+        self._pending: dict[str, tuple[int, set[int]]] = {}
+        self._sequence = 0
+        # The sequence number of the last state acknowledged by each consumer
+        self._last: list[int | None] = [None] * len(self.consumers)
+        self._warned = False
+
+    def acknowledge(self, consumer: int, line: str) -> None:
+        """Record a state emitted by a consumer.
+
+        Args:
+            consumer: The index of the consumer.
+            line: The raw JSON state line.
+        """
+        try:
+            key = json.dumps(json.loads(line), sort_keys=True)
+        except ValueError:
+            logger.warning(
+                "Received state is invalid, incremental state has not been updated",
+            )
+            return
+
+        if key not in self._pending:
+            self._pending[key] = (self._sequence, set())
+            self._sequence += 1
+        sequence, acknowledged = self._pending[key]
+        acknowledged.add(consumer)
+        self._last[consumer] = sequence
+
+        if len(acknowledged) == len(self.consumers):
+            self._discard_before(sequence + 1)
+            self.writer.writeline(line)
+            return
+
+        if None not in self._last:
+            self._discard_before(min(t.cast("list[int]", self._last)))
+        if len(self._pending) > self.max_pending:
+            self._drop_oldest()
+
+    def _discard_before(self, sequence: int) -> None:
+        while self._pending:
+            key, (first, _) = next(iter(self._pending.items()))
+            if first >= sequence:
+                break
+            del self._pending[key]
+
+    def _drop_oldest(self) -> None:
+        del self._pending[next(iter(self._pending))]
+        if self._warned:
+            return
+
+        self._warned = True
+        if silent := [
+            name
+            for name, last in zip(self.consumers, self._last, strict=True)
+            if last is None
+        ]:
+            logger.warning(
+                "Incremental state is only persisted once every loader emitted "
+                "it, and some loaders have not emitted any state",
+                loaders=silent,
+            )
+        else:
+            logger.warning(
+                "Too many states are waiting to be emitted by every loader, "
+                "the oldest ones will not be persisted",
+                max_pending=self.max_pending,
+            )
+
+
+class _StateAcknowledgement:
+    """Output handler passing the states emitted by a consumer to a `StateGate`."""
+
+    def __init__(self, gate: StateGate, consumer: int) -> None:
+        self.gate = gate
+        self.consumer = consumer
+
+    def writeline(self, line: str) -> None:
+        self.gate.acknowledge(self.consumer, line)
+
+
+class FanOutBlock(IOBlock):
+    """FanOutBlock loads the output of a producer into several consumers at once.
+
+    The output of the producer is read once and relayed to the stdin of every
+    consumer through a bounded buffer per consumer, and state is persisted only
+    once every consumer acknowledged it.
+    """
+
+    def __init__(self, project: Project, blocks: Sequence[SingerBlock]) -> None:
+        """Initialize the `FanOutBlock` instance.
+
+        Args:
+            project: The project to use to obtain project settings.
+            blocks: The consumer blocks.
+        """
+        self.project = project
+        self.blocks = tuple(blocks)
+        self.state_gate: StateGate | None = None
+        self._buffer_size: int = project.settings.get("elt.buffer_size")
+        self._tee: TeeWriter | None = None
+        self._process_future: asyncio.Task | None = None
+        self._stdout_future: asyncio.Future | None = None
+        self._stderr_future: asyncio.Future | None = None
+
+    @property
+    @override
+    def string_id(self) -> str:
+        """A string identifier for this block."""
+        return ",".join(block.string_id for block in self.blocks)
+
+    @property
+    @override
+    def consumer(self) -> bool:
+        """Whether this block is a consumer."""
+        return True
+
+    @property
+    @override
+    def producer(self) -> bool:
+        """Whether this block is a producer."""
+        return False
+
+    @property
+    @override
+    def has_state(self) -> bool:
+        """Whether any of the consumers has state."""
+        return any(block.has_state for block in self.blocks)
+
+    @property
+    @override
+    def stdin(self) -> StreamWriter | None:
+        """The writer relaying data to the stdin of every consumer."""
+        return t.cast("StreamWriter | None", self._tee)
+
+    @override
+    def stdout_link(self, dst: SubprocessOutputWriter) -> None:
+        """Link the stdout of every consumer to dst.
+
+        Args:
+            dst: The destination stdout output should be written too.
+        """
+        for block in self.blocks:
+            block.stdout_link(dst)
+
+    @override
+    def stderr_link(self, dst: SubprocessOutputWriter) -> None:
+        """Link the stderr of every consumer to dst.
+
+        Args:
+            dst: The destination stderr output should be written too.
+        """
+        for block in self.blocks:
+            block.stderr_link(dst)
+
+    @override
+    async def start(self) -> None:
+        """Start every consumer, and stop those already started if one fails."""
+        started: list[SingerBlock] = []
+        try:
+            for block in self.blocks:
+                await block.start()
+                started.append(block)
+        except BaseException:
+            await asyncio.gather(
+                *(block.stop(kill=True) for block in started),
+                return_exceptions=True,
+            )
+            raise
+
+        self._gate_state()
+        self._tee = TeeWriter(self.blocks, self._buffer_size)
+
+    def _gate_state(self) -> None:
+        """Route the states emitted by the consumers through a `StateGate`."""
+        acknowledgements: list[tuple[list, int]] = []
+        names: list[str] = []
+        bookmark_writer: BookmarkWriter | None = None
+        for block in self.blocks:
+            handlers = (block.invoker.output_handlers or {}).get(
+                block.invoker.StdioSource.STDOUT,
+                [],
+            )
+            for idx, handler in enumerate(handlers):
+                if isinstance(handler, BookmarkWriter):
+                    bookmark_writer = handler
+                    acknowledgements.append((handlers, idx))
+                    names.append(block.string_id)
+
+        if bookmark_writer is None:
+            return
+
+        self.state_gate = StateGate(bookmark_writer, names)
+        for consumer, (handlers, idx) in enumerate(acknowledgements):
+            handlers[idx] = _StateAcknowledgement(self.state_gate, consumer)
+
+    @override
+    async def stop(self, *, kill: bool = True) -> None:
+        """Stop every consumer.
+
+        Args:
+            kill: Whether to send a SIGKILL. If false, a SIGTERM is sent.
+        """
+        await asyncio.gather(*(block.stop(kill=kill) for block in self.blocks))
+
+    @override
+    def proxy_stdout(self) -> asyncio.Task:
+        """Start proxying the stdout of every consumer.
+
+        Returns:
+            The future of all stdout proxy tasks.
+        """
+        if self._stdout_future is None:
+            self._stdout_future = asyncio.ensure_future(
+                asyncio.gather(*(block.proxy_stdout() for block in self.blocks)),
+            )
+        return t.cast("asyncio.Task", self._stdout_future)
+
+    @override
+    def proxy_stderr(self) -> asyncio.Task:
+        """Start proxying the stderr of every consumer.
+
+        Returns:
+            The future of all stderr proxy tasks.
+        """
+        if self._stderr_future is None:
+            self._stderr_future = asyncio.ensure_future(
+                asyncio.gather(*(block.proxy_stderr() for block in self.blocks)),
+            )
+        return t.cast("asyncio.Task", self._stderr_future)
+
+    @override
+    def proxy_io(self) -> tuple[asyncio.Task, asyncio.Task]:
+        """Start proxying stdout AND stderr of every consumer.
+
+        Returns:
+            proxy_stdout asyncio.Task and proxy_stderr asyncio.Task
+        """
+        return self.proxy_stdout(), self.proxy_stderr()
+
+    @property
+    def process_future(self) -> asyncio.Task:
+        """The future of the consumer processes, resolving to an exit code."""
+        if self._process_future is None:
+            self._process_future = asyncio.ensure_future(self._wait())
+        return self._process_future
+
+    async def _wait(self) -> int:
+        pending = {block.process_future for block in self.blocks}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if exit_codes := [code for future in done if (code := future.result())]:
+                # The remaining consumers would miss the output the failed
+                # consumer did not load, so they are stopped too
+                await asyncio.gather(
+                    *(
+                        block.stop()
+                        for block in self.blocks
+                        if block.process_future in pending
+                    ),
+                )
+                return exit_codes[0]
+        return 0
+
+    @override
+    async def pre(self, context: object) -> None:
+        """Prepare every consumer.
+
+        Args:
+            context: The context with which to update the invokers.
+        """
+        await asyncio.gather(*(block.pre(context) for block in self.blocks))
+
+    @override
+    async def post(self) -> None:
+        """Reset the configuration of every consumer."""
+        for block in self.blocks:
+            await block.post()
+
+    @override
+    async def close_stdin(self) -> None:
+        """Close the stdin of every consumer once all buffered data is written."""
+        if self._tee is not None:
+            self._tee.close()
+            await self._tee.wait_closed()
@@ -45,6 +45,7 @@ def handle_producer_line_length_limit_error(
     exception: BaseException,
     line_length_limit: int,
     stream_buffer_size: int,
+    setting: str = "elt.buffer_size",
 ) -> None:
     """Handle `asyncio.LimitOverrunError` from producers.
 
@@ -52,7 +53,8 @@ def handle_producer_line_length_limit_error(
         exception: The exception to handle, which should be a `ValueError` with
             a `asyncio.LimitOverrunError` as its context.
         line_length_limit: The message size limit.
-        stream_buffer_size: The stream buffer size.
+        stream_buffer_size: The stream buffer size the limit derives from.
+        setting: The setting the stream buffer size is configured with.
 
     Raises:
         RunnerError: An exception raised from the `asyncio.LimitOverrunError`.
@@ -67,18 +69,21 @@ def handle_producer_line_length_limit_error(
     if not isinstance(contextual_exception, asyncio.LimitOverrunError):
         return
 
+    size_name = (
+        "maximum buffer size" if setting == "elt.max_buffer_size" else "buffer size"
+    )
     logger.error(
         "The extractor generated a message exceeding the message size limit "  # noqa: G004
-        f"of {human_size(line_length_limit)} (half the buffer size "
+        f"of {human_size(line_length_limit)} (half the {size_name} "
         f"of {human_size(stream_buffer_size)}).",
     )
     logger.error(
-        "To let this message be processed, increase the 'elt.buffer_size' "
+        f"To let this message be processed, increase the '{setting}' "  # noqa: G004
         "setting to at least double the size of the largest expected message, "
         "and try again.",
     )
     logger.error(
-        "To learn more, visit "
-        "https://docs.meltano.com/reference/settings#eltbuffer_size",
+        "To learn more, visit "  # noqa: G004
+        f"https://docs.meltano.com/reference/settings#{setting.replace('.', '')}",
     )
     raise RunnerError("Output line length limit exceeded") from contextual_exception  # noqa: EM101, TRY003
@@ -20,6 +20,7 @@ if t.TYPE_CHECKING:
     from pathlib import Path
 
     from meltano.core.logging.utils import SubprocessOutputWriter
+    from meltano.core.plugin.dbt.worker import DbtWorkerPool
     from meltano.core.plugin.project_plugin import ProjectPlugin
     from meltano.core.plugin_invoker import PluginInvoker
     from meltano.core.project import Project
@@ -66,6 +67,7 @@ class InvokerCommand(InvokerBase, PluginCommandBlock):
         plugin_invoker: PluginInvoker,
         command: str | None,
         command_args: str | None,
+        dbt_workers: DbtWorkerPool | None = None,
     ):
         """Configure and return a wrapped plugin invoker.
 
@@ -77,6 +79,7 @@ class InvokerCommand(InvokerBase, PluginCommandBlock):
             plugin_invoker: the plugin invoker.
             command: the command to invoke.
             command_args: any additional plugin args that should be used.
+            dbt_workers: long-lived dbt workers to run dbt commands in, if any.
         """
         super().__init__(
             block_ctx=block_ctx,
@@ -88,6 +91,7 @@ class InvokerCommand(InvokerBase, PluginCommandBlock):
         self._command = command
         self._command_args = command_args
         self._log = log
+        self._dbt_workers = dbt_workers
 
     @property
     def name(self) -> str:
@@ -112,9 +116,33 @@ class InvokerCommand(InvokerBase, PluginCommandBlock):
         """The command args to use when invoking the plugin."""
         return self._command_args
 
+    @property
+    def _invoke_args(self) -> tuple[str, ...]:
+        return (self.command_args,) if self.command_args else ()
+
     async def _start(self) -> None:
-        invoke_args = (self.command_args,) if self.command_args else ()
-        await self.start(*invoke_args)
+        await self.start(*self._invoke_args)
+
+    async def _run_in_dbt_worker(self, dbt_workers: DbtWorkerPool) -> int | None:
+        return await self.invoker.invoke_dbt_worker(
+            dbt_workers,
+            *self._invoke_args,
+            command=self.command,
+            stdout=self._merge_outputs(self.invoker.StdioSource.STDOUT, [self._log]),
+            stderr=self._merge_outputs(self.invoker.StdioSource.STDERR, [self._log]),
+        )
+
+    async def _run_in_process(self) -> int:
+        await self._start()
+
+        self.stdout_link(self._log)
+        self.stderr_link(self._log)
+
+        await asyncio.wait(
+            [*self.proxy_io(), self.process_future],
+            return_when=asyncio.ALL_COMPLETED,
+        )
+        return self.process_future.result()
 
     async def run(self) -> None:
         """Invoke a command capturing and logging produced output.
@@ -124,18 +152,14 @@ class InvokerCommand(InvokerBase, PluginCommandBlock):
         """
         try:
             async with self.invoker.prepared(self.context.session):
-                await self._start()
-
-                self.stdout_link(self._log)
-                self.stderr_link(self._log)
-
-                await asyncio.wait(
-                    [*self.proxy_io(), self.process_future],
-                    return_when=asyncio.ALL_COMPLETED,
-                )
+                exitcode = None
+                if self._dbt_workers is not None:
+                    exitcode = await self._run_in_dbt_worker(self._dbt_workers)
+                if exitcode is None:
+                    exitcode = await self._run_in_process()
         finally:
             self.context.session.close()
-        if exitcode := self.process_future.result():
+        if exitcode:
             command = self.command or self.command_args[0]
             raise RunnerError(  # noqa: TRY003
                 f"`{self.name} {command}` failed with exit code: {exitcode}",  # noqa: EM102
@@ -148,6 +172,7 @@ def plugin_command_invoker(
     command: str | None,
     command_args: str | None = None,
     run_dir: Path | None = None,
+    dbt_workers: DbtWorkerPool | None = None,
 ) -> InvokerCommand:
     """Make an InvokerCommand from a plugin.
 
@@ -158,6 +183,7 @@ def plugin_command_invoker(
         command_args: any additional command args that should be passed in
             during invocation.
         run_dir: Optional directory to run commands in.
+        dbt_workers: Optional long-lived dbt workers to run dbt commands in.
 
     Returns:
         InvokerCommand
@@ -194,4 +220,5 @@ def plugin_command_invoker(
         plugin_invoker=invoker,
         command=command,
         command_args=command_args,
+        dbt_workers=dbt_workers,
     )
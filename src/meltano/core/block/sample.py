@@ -0,0 +1,140 @@
+"""`RecordSampler` limits the records an extractor relays per stream."""
+
+from __future__ import annotations
+
+import json
+import sys
+import typing as t
+from collections import Counter
+
+from meltano.core.logging.utils import AsyncStreamWriter, _write_lines_writer
+from meltano.core.plugin.singer.catalog import ListSelectedExecutor
+
+if sys.version_info >= (3, 12):
+    from typing import override  # noqa: ICN003
+else:
+    from typing_extensions import override
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from meltano.core.logging.utils import SubprocessOutputWriter
+
+
+def selected_streams(catalog_path: Path) -> set[str] | None:
+    """Get the names of the streams selected in a catalog.
+
+    Args:
+        catalog_path: The path to the catalog.
+
+    Returns:
+        The stream names of the records of the selected streams, or None if the
+        catalog can not be read.
+    """
+    try:
+        catalog = json.loads(catalog_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    list_selected = ListSelectedExecutor()
+    list_selected.visit(catalog)  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
+    selected = {stream for stream, selection in list_selected.streams if selection}
+
+    return {
+        stream.get("stream", stream["tap_stream_id"])
+        for stream in catalog.get("streams", [])
+        if stream.get("tap_stream_id") in selected
+    }
+
+
+class RecordSampler(AsyncStreamWriter):
+    """Relays the output of an extractor, up to a number of records per stream.
+
+    RECORD messages past the limit of their stream are dropped, and all other
+    messages are relayed as is. Once every selected stream reached the limit,
+    `on_sampled` is called so that the extractor can be ended early.
+    """
+
+    def __init__(
+        self,
+        writer: SubprocessOutputWriter,
+        max_records: int,
+        streams: Iterable[str] | None,
+        on_sampled: Callable[[], None],
+    ) -> None:
+        """Initialize the `RecordSampler` instance.
+
+        Args:
+            writer: The stdin of the consumer to relay the output to.
+            max_records: The maximum number of records to relay per stream.
+            streams: The streams the extractor emits records for, if known.
+                Without them, the extractor is never ended early.
+            on_sampled: Called once every stream reached the limit.
+        """
+        self.writer = writer
+        self.max_records = max_records
+        self.records: Counter[str] = Counter()
+        self.dropped = 0
+        self.sampled = False
+        self._remaining = set(streams) if streams is not None else None
+        self._on_sampled = on_sampled
+        self._pending: list[bytes] = []
+
+    @override
+    def write(self, data: bytes) -> None:
+        """Queue the lines to relay, dropping the records past the limit.
+
+        Args:
+            data: The lines to write.
+        """
+        self._pending.extend(
+            line for line in data.splitlines(keepends=True) if self._keep(line)
+        )
+
+    @override
+    async def drain(self) -> None:
+        """Relay the queued lines to the consumer.
+
+        Raises:
+            BrokenPipeError: If the consumer closed its stdin.
+        """
+        lines, self._pending = self._pending, []
+        if lines and not await _write_lines_writer(self.writer, lines):
+            raise BrokenPipeError
+
+    @override
+    def close(self) -> None:
+        """Close the stdin of the consumer."""
+        if hasattr(self.writer, "close"):
+            self.writer.close()
+
+    @override
+    async def wait_closed(self) -> None:
+        """Wait until the stdin of the consumer is closed."""
+        if hasattr(self.writer, "wait_closed"):
+            await self.writer.wait_closed()
+
+    def _keep(self, line: bytes) -> bool:
+        # Only RECORD messages are limited, so other messages are not parsed
+        if b'"RECORD"' not in line:
+            return True
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return True
+        if not isinstance(message, dict) or message.get("type") != "RECORD":
+            return True
+
+        stream = message.get("stream", "")
+        if self.records[stream] >= self.max_records:
+            self.dropped += 1
+            return False
+
+        self.records[stream] += 1
+        if self.records[stream] == self.max_records and self._remaining is not None:
+            self._remaining.discard(stream)
+            if not self._remaining and not self.sampled:
+                self.sampled = True
+                self._on_sampled()
+        return True
@@ -8,8 +8,10 @@ import sys
 import typing as t
 from contextlib import suppress
 
+import structlog
+
 from meltano.core.block.ioblock import IOBlock
-from meltano.core.logging import capture_subprocess_output
+from meltano.core.logging import OutputStats, capture_subprocess_output
 from meltano.core.plugin import PluginType
 from meltano.core.runner import RunnerError
 
@@ -27,6 +29,8 @@ if t.TYPE_CHECKING:
     from meltano.core.plugin_invoker import PluginInvoker
     from meltano.core.project import Project
 
+logger = structlog.stdlib.get_logger(__name__)
+
 PRODUCERS = (PluginType.EXTRACTORS, PluginType.MAPPERS)
 CONSUMERS = (PluginType.LOADERS, PluginType.MAPPERS)
 
@@ -275,6 +279,12 @@ class SingerBlock(InvokerBase, IOBlock):
             command=None,
         )
         self.plugin_args = plugin_args
+        self.stdout_stats = OutputStats()
+        self._stream_buffer_size: int = self.project.settings.get("elt.buffer_size")
+        max_buffer_size: int = self.project.settings.get("elt.max_buffer_size")
+        self._max_line_length = (
+            max_buffer_size // 2 if max_buffer_size > self._stream_buffer_size else None
+        )
 
     @property
     @override
@@ -317,8 +327,7 @@ class SingerBlock(InvokerBase, IOBlock):
         Raises:
             RunnerError: If the plugin can not start.
         """
-        stream_buffer_size = self.project.settings.get("elt.buffer_size")
-        line_length_limit = stream_buffer_size // 2
+        line_length_limit = self._stream_buffer_size // 2
 
         stdin = asyncio.subprocess.PIPE if self.consumer else None
         try:
@@ -331,6 +340,63 @@ class SingerBlock(InvokerBase, IOBlock):
         except Exception as err:
             raise RunnerError(f"Cannot start plugin {self.string_id}: {err}") from err  # noqa: EM102, TRY003
 
+    async def _capture_stdout(self, *outputs: SubprocessOutputWriter) -> None:
+        try:
+            await capture_subprocess_output(
+                self.process_handle.stdout,
+                *outputs,
+                max_line_length=self._max_line_length,
+                stats=self.stdout_stats,
+            )
+        finally:
+            stats = self.stdout_stats
+            logger.info(
+                "Block output stream completed",
+                block=self.string_id,
+                messages=stats.lines,
+                total_bytes=stats.total_bytes,
+                largest_message_bytes=stats.largest_line,
+                oversized_messages=stats.oversized_lines,
+                buffer_size=self._stream_buffer_size,
+            )
+
+    @override
+    def proxy_stdout(self) -> asyncio.Task:
+        """Start proxying stdout to the linked stdout destinations.
+
+        Messages longer than half of `elt.buffer_size` are read in parts, up to
+        half of `elt.max_buffer_size`, and high-water marks of the stream are
+        reported when it completes.
+
+        Returns:
+            The stdout proxy future.
+        """
+        if self._stdout_future is None:
+            outputs = self._merge_outputs(self.invoker.StdioSource.STDOUT, self.outputs)
+            self._stdout_future = asyncio.ensure_future(self._capture_stdout(*outputs))
+        return self._stdout_future
+
+    @override
+    def proxy_stderr(self) -> asyncio.Task:
+        """Start proxying stderr to the linked stderr destinations.
+
+        Returns:
+            The stderr proxy future.
+        """
+        if self._stderr_future is None:
+            err_outputs = self._merge_outputs(
+                self.invoker.StdioSource.STDERR,
+                self.err_outputs,
+            )
+            self._stderr_future = asyncio.ensure_future(
+                capture_subprocess_output(
+                    self.process_handle.stderr,
+                    *err_outputs,
+                    max_line_length=self._max_line_length,
+                ),
+            )
+        return self._stderr_future
+
     @override
     async def stop(self, *, kill: bool = True) -> None:
         """Stop (kill) the underlying process and cancel output proxying.
@@ -3,19 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import shlex
 import signal
 import typing as t
+from contextlib import suppress
 
 from structlog.stdlib import get_logger
 
+from meltano.core.logging.utils import AsyncStreamWriter
+
 if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from aiodocker import Docker
     from aiodocker.containers import DockerContainer
+    from aiodocker.stream import Stream
 
     from meltano.core.container.container_spec import ContainerSpec
 
 
 logger = get_logger(__name__)
 
+STDOUT = 1
+STDERR = 2
+
+# Chunks of output buffered per stream before reading from the container pauses
+OUTPUT_QUEUE_SIZE = 16
+
+# Data written to the stdin of a container is sent in chunks of this size, or
+# after this many seconds, whichever comes first
+STDIN_CHUNK_SIZE = 64 * 1024
+STDIN_FLUSH_INTERVAL = 0.05
+
 
 def stop_container(container: DockerContainer) -> None:
     """Stop a Docker container.
@@ -27,9 +46,354 @@ def stop_container(container: DockerContainer) -> None:
     asyncio.ensure_future(container.stop())  # noqa: RUF006
 
 
+class ContainerOutput:
+    """An output stream of a container, read from the Docker attach socket.
+
+    Output arrives in chunks of arbitrary size. Lines are split off the buffered
+    chunks as they are read, and reading from the container pauses while
+    `OUTPUT_QUEUE_SIZE` chunks are waiting to be read, until the container exits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the `ContainerOutput` instance."""
+        self._chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._released = False
+        self._buffer = bytearray()
+        self._pos = 0
+        self._eof = False
+
+    async def feed(self, chunk: bytes | None) -> None:
+        """Add a chunk of output, waiting while too many chunks are unread.
+
+        Args:
+            chunk: The output, or `None` at the end of the stream.
+        """
+        self._chunks.put_nowait(chunk)
+        if self._chunks.qsize() >= OUTPUT_QUEUE_SIZE and not self._released:
+            self._not_full.clear()
+            await self._not_full.wait()
+
+    def release(self) -> None:
+        """Stop waiting for unread chunks, e.g. once the remaining output is finite."""
+        self._released = True
+        self._not_full.set()
+
+    def at_eof(self) -> bool:
+        """Whether the stream ended and all of it was read.
+
+        Returns:
+            `True` if there is nothing more to read.
+        """
+        return self._eof and self._pos == len(self._buffer)
+
+    async def _fill(self) -> None:
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._pos = 0
+        chunk = await self._chunks.get()
+        if self._chunks.qsize() < OUTPUT_QUEUE_SIZE:
+            self._not_full.set()
+        if chunk is None:
+            self._eof = True
+        else:
+            self._buffer += chunk
+
+    async def readline(self) -> bytes:
+        """Read one line.
+
+        Returns:
+            The line, or the remaining data without a trailing newline at the end
+            of the stream.
+        """
+        while True:
+            end = self._buffer.find(b"\n", self._pos)
+            if end != -1 or self._eof:
+                end = len(self._buffer) if end == -1 else end + 1
+                line = bytes(self._buffer[self._pos : end])
+                self._pos = end
+                return line
+            await self._fill()
+
+    async def readlines(self) -> list[bytes]:
+        """Read all complete lines that are available, waiting for at least one.
+
+        Returns:
+            The lines, or the remaining data without a trailing newline at the
+            end of the stream.
+        """
+        while True:
+            end = self._buffer.rfind(b"\n", self._pos)
+            if end != -1 or self._eof:
+                end = len(self._buffer) if end == -1 else end + 1
+                data = bytes(self._buffer[self._pos : end])
+                self._pos = end
+                return data.splitlines(keepends=True)
+            await self._fill()
+
+
+class ContainerStdin(AsyncStreamWriter):
+    """The standard input of a container, written to the Docker attach socket.
+
+    Writes are buffered and sent in chunks of `STDIN_CHUNK_SIZE` bytes, or
+    after `STDIN_FLUSH_INTERVAL` seconds.
+    """
+
+    def __init__(self, stream: Stream) -> None:
+        """Initialize the `ContainerStdin` instance.
+
+        Args:
+            stream: The attach stream of the container, attached to its stdin only.
+        """
+        self._stream = stream
+        self._buffer = bytearray()
+        self._flush_task: asyncio.Task | None = None
+        self._close_task: asyncio.Task | None = None
+
+    def write(self, data: bytes) -> None:
+        """Buffer data to be written to the container.
+
+        Args:
+            data: The data to write.
+
+        Raises:
+            BrokenPipeError: If the stream is closed.
+        """
+        if self._close_task is not None:
+            raise BrokenPipeError
+        self._buffer += data
+
+    async def _flush(self) -> None:
+        if self._buffer:
+            data, self._buffer = bytes(self._buffer), bytearray()
+            try:
+                await self._stream.write_in(data)
+            except (RuntimeError, ConnectionError) as err:
+                raise BrokenPipeError from err
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(STDIN_FLUSH_INTERVAL)
+        self._flush_task = None
+        await self._flush()
+
+    async def drain(self) -> None:
+        """Send the buffered data if a full chunk is buffered."""
+        if len(self._buffer) >= STDIN_CHUNK_SIZE:
+            await self._flush()
+        elif self._buffer and self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        try:
+            await self._flush()
+        except BrokenPipeError:
+            logger.debug("Container stdin closed before all input was sent")
+        finally:
+            await self._stream.close()
+
+    def close(self) -> None:
+        """Send the buffered data, then close the standard input of the container."""
+        if self._close_task is None:
+            self._close_task = asyncio.ensure_future(self._close())
+
+    async def wait_closed(self) -> None:
+        """Wait until the standard input of the container is closed."""
+        self.close()
+        assert self._close_task is not None  # noqa: S101
+        await self._close_task
+
+
+class ContainerProcess:
+    """A running container, with the interface of `asyncio.subprocess.Process`.
+
+    The standard output and error of the container are read from a single
+    attach socket in chunks, and demultiplexed into `stdout` and `stderr`.
+    """
+
+    def __init__(
+        self,
+        docker: Docker,
+        container: DockerContainer,
+        output: Stream,
+        stdin: ContainerStdin | None,
+    ) -> None:
+        """Initialize the `ContainerProcess` instance.
+
+        Args:
+            docker: The Docker client, closed when the container is removed.
+            container: The started container.
+            output: The attach stream of the container's stdout and stderr.
+            stdin: The stdin of the container, if it is attached.
+        """
+        self.docker = docker
+        self.container = container
+        self.stdin = stdin
+        self.stdout = ContainerOutput()
+        self.stderr = ContainerOutput()
+        self.returncode: int | None = None
+        self._output = output
+        self._output_future = asyncio.ensure_future(self._read_output())
+        self._wait_future: asyncio.Future[int] | None = None
+
+    async def _read_output(self) -> None:
+        try:
+            while (message := await self._output.read_out()) is not None:
+                stream = self.stderr if message.stream == STDERR else self.stdout
+                await stream.feed(message.data)
+        finally:
+            await self._output.close()
+            await self.stdout.feed(None)
+            await self.stderr.feed(None)
+
+    async def _wait(self) -> int:
+        try:
+            result = await self.container.wait()
+            # The output left once the container exited is read even if it is
+            # not consumed, so that the attach stream can be closed
+            self.stdout.release()
+            self.stderr.release()
+            await self._output_future
+            self.returncode = int(result["StatusCode"])
+        finally:
+            if self.stdin is not None:
+                self.stdin.close()
+            try:
+                await self.container.delete(force=True)
+            finally:
+                await self.docker.close()
+        return self.returncode
+
+    async def wait(self) -> int:
+        """Wait for the container to exit, then remove it.
+
+        Returns:
+            The exit code of the container.
+        """
+        if self._wait_future is None:
+            self._wait_future = asyncio.ensure_future(self._wait())
+        return await asyncio.shield(self._wait_future)
+
+    def send_signal(self, sig: str) -> None:
+        """Send a signal to the container.
+
+        Args:
+            sig: The signal name.
+        """
+        logger.debug(
+            "Sending signal to container",
+            container_id=self.container.id,
+            signal=sig,
+        )
+        asyncio.ensure_future(self._send_signal(sig))  # noqa: RUF006
+
+    async def _send_signal(self, sig: str) -> None:
+        try:
+            await self.container.kill(signal=sig)
+        except Exception as err:  # noqa: BLE001
+            # The container may have exited already
+            logger.debug("Cannot send signal to container", signal=sig, err=err)
+
+    def terminate(self) -> None:
+        """Stop the container with `SIGTERM`."""
+        self.send_signal("SIGTERM")
+
+    def kill(self) -> None:
+        """Kill the container with `SIGKILL`."""
+        self.send_signal("SIGKILL")
+
+
 class ContainerService:
     """Wrapper for container interaction."""
 
+    def __init__(self, url: str | None = None) -> None:
+        """Initialize the `ContainerService` instance.
+
+        Args:
+            url: The Docker daemon URL. The Docker context, `DOCKER_HOST`, or the
+                default socket is used if not set.
+        """
+        self.url = url
+
+    def _docker(self) -> Docker:
+        try:
+            import aiodocker
+        except ImportError:  # pragma: no cover
+            msg = (
+                "The 'aiodocker' package is required to run containers. "
+                "Please install 'meltano[containers]'"
+            )
+            raise ImportError(msg) from None
+
+        return aiodocker.Docker(url=self.url)
+
+    async def start_container(
+        self,
+        spec: ContainerSpec,
+        name: str,
+        *,
+        args: Sequence[str] = (),
+        env: dict | None = None,
+        attach_stdin: bool = False,
+    ) -> ContainerProcess:
+        """Start a Docker container with its standard streams attached.
+
+        Args:
+            spec: Command container spec.
+            name: Container name.
+            args: Arguments to run the container with, if the spec does not
+                define a command.
+            env: Environment mapping for the container run.
+            attach_stdin: Whether to attach the standard input of the container.
+
+        Returns:
+            The running container.
+        """
+        docker = self._docker()
+        container = None
+        try:
+            config = spec.get_docker_config(additional_env=env)
+            if not spec.command:
+                config["Cmd"] = list(args)
+            config.update(
+                {
+                    "AttachStdin": attach_stdin,
+                    "AttachStdout": True,
+                    "AttachStderr": True,
+                    "OpenStdin": attach_stdin,
+                    "StdinOnce": attach_stdin,
+                    "Tty": False,
+                },
+            )
+
+            logger.debug(
+                "Starting container",
+                container_name=name,
+                cmd=shlex.join(config["Cmd"] or ()),
+            )
+            container = await docker.containers.run(config, name=name)
+            # Attaching with `logs` replays any output written before attaching
+            output = container.attach(stdout=True, stderr=True, logs=True)
+            stdin = None
+            if attach_stdin:
+                stdin_stream = container.attach(stdin=True)
+                # Connect right away, so that stdin is closed even without input
+                await stdin_stream.write_in(b"")
+                stdin = ContainerStdin(stdin_stream)
+        except BaseException:
+            try:
+                # Don't leave a container behind that no process will wait for
+                if container is not None:
+                    with suppress(Exception):
+                        await container.delete(force=True)
+            finally:
+                await docker.close()
+            raise
+
+        return ContainerProcess(docker, container, output, stdin)
+
     async def run_container(
         self,
         spec: ContainerSpec,
@@ -49,16 +413,7 @@ class ContainerService:
         Returns:
             Docker container information after execution.
         """
-        try:
-            import aiodocker
-        except ImportError:  # pragma: no cover
-            msg = (
-                "The 'aiodocker' package is required to run containers. "
-                "Please install 'meltano[containers]'"
-            )
-            raise ImportError(msg) from None
-
-        async with aiodocker.Docker() as docker:
+        async with self._docker() as docker:
             if pull:
                 await docker.images.pull(spec.image)
 
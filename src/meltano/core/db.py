@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 import typing as t
+from contextlib import nullcontext
 from urllib.parse import urlparse
 
 import structlog
@@ -104,15 +105,15 @@ def project_engine(
 
     engine = create_engine(database_uri, poolclass=NullPool, future=True)
 
-    # Connect to the database to ensure it is available.
-    connect(
+    # Connect to the database to ensure it is available, and reuse the connection
+    # to initialize it.
+    with connect(
         engine,
         max_retries=project.settings.get("database_max_retries"),
         retry_timeout=project.settings.get("database_retry_timeout"),
-    )
-
-    check_database_compatibility(engine)
-    init_hook(engine)
+    ) as conn:
+        check_database_compatibility(engine)
+        init_hook(engine, connection=conn)
 
     engine_session = (engine, sessionmaker(bind=engine, future=True))
 
@@ -165,21 +166,23 @@ init_hooks: dict[str, Callable[[Connection], t.Any]] = {
 }
 
 
-def init_hook(engine: Engine) -> None:
+def init_hook(engine: Engine, *, connection: Connection | None = None) -> None:
     """Run the initialization hook for the provided DB engine.
 
     The initialization hooks are taken from the `meltano.core.db.init_hooks`
     dictionary, which maps the dialect name of the engine to a unary function
-    which will be called with the provided DB engine.
+    which will be called with a connection to the provided DB engine.
 
     Args:
         engine: The engine for which the init hook will be run.
+        connection: An open connection of the engine to run the hook with. A new
+            connection is opened if not provided.
 
     Raises:
         Exception: The init hook raised an exception.
     """
     if hook := init_hooks.get(engine.dialect.name):
-        with engine.connect() as conn:
+        with nullcontext(connection) if connection else engine.connect() as conn:
             try:
                 hook(conn)
             except Exception as ex:
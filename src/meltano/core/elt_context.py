@@ -105,6 +105,7 @@ class ELTContext(ELContextProtocol):
         base_output_logger: OutputLogger | None = None,
         state_strategy: StateStrategy = StateStrategy.auto,
         run_id: uuid.UUID | None = None,
+        force_dbt_deps: bool = False,
     ):
         """Initialise ELT Context instance.
 
@@ -126,6 +127,8 @@ class ELTContext(ELContextProtocol):
             base_output_logger: OutputLogger to use.
             state_strategy: State strategy to use.
             run_id: Run ID.
+            force_dbt_deps: Flag. Run `dbt clean` and `dbt deps` even if the dbt
+                dependencies did not change.
         """
         self.project = project
         self.job = job
@@ -147,6 +150,7 @@ class ELTContext(ELContextProtocol):
         self.base_output_logger = base_output_logger
         self.state_strategy = state_strategy
         self.run_id = run_id
+        self.force_dbt_deps = force_dbt_deps
 
     @property
     def elt_run_dir(self) -> Path | None:
@@ -240,6 +244,7 @@ class ELTContextBuilder:
         self._state: str | None = None
         self._base_output_logger: OutputLogger | None = None
         self._state_strategy: StateStrategy = StateStrategy.auto
+        self._force_dbt_deps = False
 
     def with_session(self, session: Session) -> ELTContextBuilder:
         """Include session when building context.
@@ -342,6 +347,19 @@ class ELTContextBuilder:
         self._dry_run = dry_run
         return self
 
+    def with_force_dbt_deps(self, *, force_dbt_deps: bool) -> ELTContextBuilder:
+        """Include force dbt deps flag when building context.
+
+        Args:
+            force_dbt_deps: Flag. Run `dbt clean` and `dbt deps` even if the dbt
+                dependencies did not change.
+
+        Returns:
+            Updated ELTContextBuilder instance.
+        """
+        self._force_dbt_deps = force_dbt_deps
+        return self
+
     def with_full_refresh(self, *, full_refresh: bool) -> ELTContextBuilder:
         """Include full refresh flag when building context.
 
@@ -547,4 +565,5 @@ class ELTContextBuilder:
             state=self._state,
             base_output_logger=self._base_output_logger,
             state_strategy=self._state_strategy,
+            force_dbt_deps=self._force_dbt_deps,
         )
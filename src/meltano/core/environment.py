@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 import sys
 import typing as t
 
 from meltano.core.behavior import NameEq
-from meltano.core.behavior.canonical import Canonical
+from meltano.core.behavior.canonical import Canonical, copy_tree
 from meltano.core.constants import STATE_ID_COMPONENT_DELIMITER
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.base import PluginRef
@@ -67,8 +66,8 @@ class EnvironmentPluginConfig(PluginRef):
             extras: Plugin extras.
         """
         super().__init__(plugin_type, name)
-        self.config = copy.deepcopy(config or {})
-        self.env = copy.deepcopy(env or {})
+        self.config = copy_tree(config or {})
+        self.env = copy_tree(env or {})
         self.extras = extras
 
     @property
@@ -18,6 +18,8 @@ from .utils import (
     DEFAULT_LEVEL,
     LEVELS,
     LogFormat,
+    OutputStats,
+    capture_output_batches,
     capture_subprocess_output,
     setup_logging,
 )
@@ -29,7 +31,9 @@ __all__ = [
     "LogFormat",
     "MissingJobLogException",
     "OutputLogger",
+    "OutputStats",
     "SizeThresholdJobLogException",
+    "capture_output_batches",
     "capture_subprocess_output",
     "console_log_formatter",
     "json_formatter",
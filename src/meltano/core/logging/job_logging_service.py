@@ -1,16 +1,27 @@
 from __future__ import annotations  # noqa: D100
 
+import codecs
+import gzip
 import json
+import mmap
 import os
+import re
+import shutil
+import time
 import typing as t
+from collections import deque
 from contextlib import contextmanager
 
+import fasteners
 import structlog
 
 from meltano.core.job import Job, State
 from meltano.core.utils import makedirs, slugify
 
+from .output_logger import OutputLogger
+
 if t.TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterator
     from pathlib import Path
     from uuid import UUID
 
@@ -21,6 +32,11 @@ if t.TYPE_CHECKING:
 
 logger = structlog.stdlib.get_logger(__name__)
 MAX_FILE_SIZE = 2097152  # 2MB max
+LOG_CHUNK_SIZE = 65536  # 64KB per read when streaming log contents
+FOLLOW_POLL_INTERVAL = 0.5  # seconds between polls when following a log
+LOG_INDEX_FILE_NAME = "logs.index"
+LOG_INDEX_LOCK_FILE_NAME = "logs.index.lock"
+GZIP_SUFFIX = ".gz"
 
 
 class MissingJobLogException(Exception):
@@ -72,6 +88,266 @@ class JobLoggingService:  # noqa: D101
         """
         return self.logs_dir(state_id, str(run_id), file_name)
 
+    def register_log(
+        self,
+        state_id: str,
+        run_id: str | UUID,
+        file_name: str = "elt.log",
+    ) -> Path:
+        """Generate the path of a new log and record it in the log index.
+
+        The index of a state ID is a file in its logs directory listing the
+        relative path of every log, oldest first. It lets the most recent logs
+        be found without scanning every run directory.
+
+        Args:
+            state_id: The state ID for the log.
+            run_id: The run ID for the log.
+            file_name: The name of the log file.
+
+        Returns:
+            The full path to the log file.
+        """
+        log_path = self.generate_log_name(state_id, run_id, file_name)
+        index_path = self.logs_dir(state_id, LOG_INDEX_FILE_NAME)
+        entry = f"{run_id}/{file_name}"
+
+        try:
+            with self._index_lock(state_id):
+                if not index_path.exists():
+                    self._build_log_index(state_id, exclude=log_path)
+                with index_path.open("a", encoding="utf-8") as index:
+                    index.write(f"{entry}\n")
+        except OSError:
+            # The index is an optimization, don't fail the run because of it
+            logger.warning(
+                "Could not update log index",
+                index_path=str(index_path),
+                exc_info=True,
+            )
+
+        return log_path
+
+    def create_output_logger(
+        self,
+        state_id: str,
+        run_id: str | UUID,
+    ) -> OutputLogger:
+        """Register a new run log and create an `OutputLogger` writing to it.
+
+        The logger rotates the log according to the `elt.log_max_bytes`,
+        `elt.log_backup_count` and `elt.log_compress` settings.
+
+        Args:
+            state_id: The state ID for the log.
+            run_id: The run ID for the log.
+
+        Returns:
+            An `OutputLogger` for the run.
+        """
+        settings = self.project.settings
+        return OutputLogger(
+            self.register_log(state_id, run_id),
+            max_bytes=settings.get("elt.log_max_bytes"),
+            backup_count=settings.get("elt.log_backup_count"),
+            compress=settings.get("elt.log_compress"),
+        )
+
+    def finalize_log(self, state_id: str, run_id: str | UUID) -> None:
+        """Compress a finished run log and apply the log retention policy.
+
+        Args:
+            state_id: The state ID for the log.
+            run_id: The run ID for the log.
+        """
+        settings = self.project.settings
+        try:
+            if settings.get("elt.log_compress"):
+                self.compress_log(self.generate_log_name(state_id, run_id))
+            if retention := settings.get("elt.log_retention"):
+                self.apply_retention(state_id, retention)
+        except OSError:
+            # Log housekeeping should never fail a run
+            logger.warning(
+                "Could not finalize run log",
+                state_id=state_id,
+                run_id=str(run_id),
+                exc_info=True,
+            )
+
+    def compress_log(self, log_path: Path) -> Path | None:
+        """Gzip a log file, replacing the original.
+
+        Args:
+            log_path: Path to the log file.
+
+        Returns:
+            The path to the compressed log, or `None` if the log does not exist.
+        """
+        if not log_path.exists():
+            return None
+
+        gz_path = _gzip_path(log_path)
+        with log_path.open("rb") as src, gzip.open(gz_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        log_path.unlink()
+        return gz_path
+
+    def apply_retention(self, state_id: str, keep: int) -> None:
+        """Delete the logs of all but the most recent runs of a state ID.
+
+        Args:
+            state_id: The state ID to apply the retention policy to.
+            keep: The number of most recent runs to keep the logs of.
+        """
+        with self._index_lock(state_id):
+            self._apply_retention(state_id, keep)
+
+    def _apply_retention(self, state_id: str, keep: int) -> None:
+        logs_dir = self.logs_dir(state_id)
+        entries = self._read_log_index(state_id, lock=False)
+
+        run_dirs: list[str] = []
+        for entry in reversed(entries):
+            run_dir = entry.split("/", 1)[0]
+            if run_dir not in run_dirs:
+                run_dirs.append(run_dir)
+
+        expired = set(run_dirs[keep:])
+        if not expired:
+            return
+
+        for run_dir in expired:
+            path = logs_dir / run_dir
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+        index_path = logs_dir / LOG_INDEX_FILE_NAME
+        tmp_path = index_path.with_name(f"{index_path.name}.tmp")
+        tmp_path.write_text(
+            "".join(
+                f"{entry}\n"
+                for entry in entries
+                if entry.split("/", 1)[0] not in expired
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(index_path)
+
+    @contextmanager
+    def _index_lock(self, state_id: str) -> Generator[None]:
+        """Serialize the updates of the log index of a state ID across processes.
+
+        Args:
+            state_id: The state ID whose log index is updated.
+
+        Yields:
+            Once the lock is held.
+        """
+        with fasteners.InterProcessLock(
+            self.logs_dir(state_id, LOG_INDEX_LOCK_FILE_NAME),
+        ):
+            yield
+
+    def _build_log_index(
+        self,
+        state_id: str,
+        *,
+        exclude: Path | None = None,
+    ) -> list[str]:
+        """Build the log index of a state ID by scanning its logs directory.
+
+        The caller must hold the lock of the index.
+
+        Args:
+            state_id: The state ID to index the logs of.
+            exclude: A log path to leave out of the index.
+
+        Returns:
+            The index entries, oldest first.
+        """
+        logs_dir = self.logs_dir(state_id)
+        # Logs are indexed by their uncompressed path, compressed or not
+        log_files: dict[Path, Path] = {}
+        for path in (*logs_dir.glob("**/*.log"), *logs_dir.glob("**/*.log.gz")):
+            log_path = path.with_name(path.name.removesuffix(GZIP_SUFFIX))
+            if log_path != exclude:
+                log_files.setdefault(log_path, path)
+        entries = [
+            log_path.relative_to(logs_dir).as_posix()
+            for log_path, path in sorted(
+                log_files.items(),
+                key=lambda item: item[1].stat().st_ctime_ns,
+            )
+        ]
+        if entries or exclude:
+            index_path = logs_dir / LOG_INDEX_FILE_NAME
+            index_path.write_text(
+                "".join(f"{entry}\n" for entry in entries),
+                encoding="utf-8",
+            )
+        return entries
+
+    def _read_log_index(self, state_id: str, *, lock: bool = True) -> list[str]:
+        """Read the log index of a state ID, building it if it does not exist.
+
+        Args:
+            state_id: The state ID to read the log index of.
+            lock: Whether to take the lock of the index to build it, unless the
+                caller already holds it.
+
+        Returns:
+            The index entries, oldest first.
+        """
+        index_path = self.logs_dir(state_id, LOG_INDEX_FILE_NAME)
+        try:
+            return index_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            if not lock:
+                return self._build_log_index(state_id)
+
+        with self._index_lock(state_id):
+            # Another process may have built the index in the meantime
+            try:
+                return index_path.read_text(encoding="utf-8").splitlines()
+            except FileNotFoundError:
+                return self._build_log_index(state_id)
+
+    def iter_logs(self, state_id: str) -> Iterator[Path]:
+        """Iterate over the log files of a state ID, most recent first.
+
+        Indexed logs are checked for existence one at a time, so getting the
+        most recent log only touches the files that come before it. Compressed
+        logs are returned in place of logs that no longer exist uncompressed.
+        Logs in the legacy logs directory always come last.
+
+        Args:
+            state_id: The state ID to get the logs of.
+
+        Yields:
+            Paths to log files.
+        """
+        logs_dir = self.logs_dir(state_id)
+        seen: set[str] = set()
+        for entry in reversed(self._read_log_index(state_id)):
+            if entry in seen:
+                continue
+            seen.add(entry)
+            log_path = logs_dir / entry
+            if log_path.exists():
+                yield log_path
+            elif (gz_path := _gzip_path(log_path)).exists():
+                yield gz_path
+
+        if legacy_logs_dir := self.legacy_logs_dir(state_id):
+            yield from sorted(
+                legacy_logs_dir.glob("**/*.log"),
+                key=lambda path: path.stat().st_ctime_ns,
+                reverse=True,
+            )
+
     @contextmanager
     def create_log(self, state_id, run_id, file_name="elt.log"):  # noqa: ANN001, ANN201
         """Open a new log file for logging and yield it.
@@ -79,7 +355,7 @@ class JobLoggingService:  # noqa: D101
         Log will be created inside the logs_dir, which is
         `.meltano/logs/elt/:state_id/:run_id`
         """
-        log_file_name = self.generate_log_name(state_id, run_id, file_name)
+        log_file_name = self.register_log(state_id, run_id, file_name)
 
         try:
             with log_file_name.open("w") as log_file:
@@ -105,15 +381,18 @@ class JobLoggingService:  # noqa: D101
             the provided `state_id`.
         """
         try:
-            latest_log = next(iter(self.get_all_logs(state_id)))
+            latest_log = next(self.iter_logs(state_id))
+
+            # Cap the bytes read, as a compressed log may expand past the limit
+            with _open_log(latest_log) as f:
+                contents = f.read(MAX_FILE_SIZE + 1)
 
-            if latest_log.stat().st_size > MAX_FILE_SIZE:
+            if len(contents) > MAX_FILE_SIZE:
                 raise SizeThresholdJobLogException(  # noqa: TRY003
                     f"The log file size exceeds '{MAX_FILE_SIZE}'",  # noqa: EM102
                 )
 
-            with latest_log.open() as f:
-                return f.read()
+            return contents.decode("utf-8", errors="replace")
         except StopIteration:
             raise MissingJobLogException(  # noqa: TRY003
                 f"Could not find any log for job with ID '{state_id}'",  # noqa: EM102
@@ -126,7 +405,7 @@ class JobLoggingService:  # noqa: D101
     def get_downloadable_log(self, state_id):  # noqa: ANN001, ANN201
         """Get the `*.log` file of the most recent log for any ELT job that ran with the provided `state_id`."""  # noqa: E501
         try:
-            latest_log = next(iter(self.get_all_logs(state_id)))
+            latest_log = next(self.iter_logs(state_id))
             return str(latest_log.resolve())
         except StopIteration:
             raise MissingJobLogException(  # noqa: TRY003
@@ -142,15 +421,7 @@ class JobLoggingService:  # noqa: D101
 
         The result is ordered so that the most recent is first on the list.
         """
-        return sorted(
-            [
-                log_file
-                for logs_dir in self.logs_dirs(state_id)
-                for log_file in logs_dir.glob("**/*.log")
-            ],
-            key=lambda path: path.stat().st_ctime_ns,
-            reverse=True,
-        )
+        return list(self.iter_logs(state_id))
 
     def delete_all_logs(self, state_id) -> None:  # noqa: ANN001
         """Delete all the logs for any ELT job that ran with the provided `state_id`.
@@ -159,7 +430,10 @@ class JobLoggingService:  # noqa: D101
             state_id: The state ID for which all log files should be deleted.
         """
         for log_path in self.get_all_logs(state_id):
-            log_path.unlink()
+            for segment in self.log_segments(log_path):
+                segment.unlink()
+
+        self.logs_dir(state_id, LOG_INDEX_FILE_NAME).unlink(missing_ok=True)
 
     def legacy_logs_dir(self, state_id, *joinpaths):  # noqa: ANN001, ANN002, ANN201, D102
         job_dir = self.project.dirs.run("elt").joinpath(slugify(state_id), *joinpaths)
@@ -175,46 +449,212 @@ class JobLoggingService:  # noqa: D101
 
         return dirs
 
-    def tail_file(self, file_path: Path, lines: int) -> list[str]:
+    def log_segments(self, log_path: Path) -> list[Path]:
+        """Get the files making up a log, oldest first.
+
+        A rotated log is made up of its numbered backups, which may be
+        compressed, followed by the log file itself, which is compressed once
+        the run finishes if `elt.log_compress` is enabled.
+
+        Args:
+            log_path: Path to the log file, with or without the `.gz` suffix.
+
+        Returns:
+            Paths of the existing files of the log.
+        """
+        log_path = log_path.with_name(log_path.name.removesuffix(GZIP_SUFFIX))
+        backup_pattern = re.compile(
+            rf"{re.escape(log_path.name)}\.(\d+)(?:{re.escape(GZIP_SUFFIX)})?"
+        )
+        backups = sorted(
+            (
+                (int(match.group(1)), path)
+                for path in log_path.parent.glob(f"{log_path.name}.*")
+                if (match := backup_pattern.fullmatch(path.name))
+            ),
+            reverse=True,
+        )
+        segments = [path for _, path in backups]
+
+        if log_path.exists():
+            segments.append(log_path)
+        elif (gz_path := _gzip_path(log_path)).exists():
+            segments.append(gz_path)
+
+        return segments
+
+    def tail_log(
+        self,
+        log_path: Path,
+        lines: int,
+        *,
+        end: int | None = None,
+    ) -> list[str]:
+        """Read the last N lines of a log, across its rotated segments.
+
+        Args:
+            log_path: Path to the log file.
+            lines: Number of lines to read from the end.
+            end: Byte offset to treat as the end of the uncompressed log file.
+
+        Returns:
+            List of the last N lines.
+        """
+        result: list[str] = []
+        for segment in reversed(self.log_segments(log_path)):
+            remaining = lines - len(result)
+            if remaining <= 0:
+                break
+            segment_end = end if segment == log_path else None
+            result[:0] = self.tail_file(segment, remaining, end=segment_end)
+        return result
+
+    def tail_file(
+        self,
+        file_path: Path,
+        lines: int,
+        *,
+        end: int | None = None,
+    ) -> list[str]:
         """Read the last N lines from a file.
 
+        The file is memory-mapped and scanned backwards for line breaks, so only
+        the pages holding the requested lines are touched regardless of the
+        total size of the file. Gzipped files are decompressed on the fly.
+
         Args:
             file_path: Path to the file to read.
             lines: Number of lines to read from the end.
+            end: Byte offset to treat as the end of the file. Defaults to the
+                current size of the file.
 
         Returns:
             List of the last N lines.
         """
-        with file_path.open("rb") as f:
-            # Seek to end of file
-            f.seek(0, 2)
-            file_length = f.tell()
+        if lines <= 0:
+            return []
+
+        if file_path.name.endswith(GZIP_SUFFIX):
+            # Compressed logs can't be scanned backwards, stream them instead
+            with gzip.open(file_path, "rb") as gz:
+                last_lines = deque(gz, maxlen=lines)
+            return [
+                line.removesuffix(b"\n").decode("utf-8", errors="replace")
+                for line in last_lines
+            ]
 
-            # Read file in reverse to find line breaks
-            lines_found: list[bytes] = []
-            block_size = 1024
-            blocks = []
-
-            while len(lines_found) < lines and file_length > 0:
-                # Calculate how much to read
-                block_size = min(block_size, file_length)
+        with file_path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            end = size if end is None else min(end, size)
+            if end == 0:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Ignore the trailing newline, if any
+                stop = end - 1 if mm[end - 1 : end] == b"\n" else end
+                start = stop
+                for _ in range(lines):
+                    pos = mm.rfind(b"\n", 0, start)
+                    if pos == -1:
+                        start = 0
+                        break
+                    start = pos
+                else:
+                    start += 1  # Skip the line break preceding the first line
+
+                content = mm[start:stop]
+
+        return content.decode("utf-8", errors="replace").split("\n")
+
+    def iter_file_chunks(
+        self,
+        file_path: Path,
+        chunk_size: int = LOG_CHUNK_SIZE,
+        *,
+        end: int | None = None,
+    ) -> Iterator[str]:
+        """Stream the contents of a file in chunks.
 
-                # Read block
-                f.seek(file_length - block_size)
-                blocks.append(f.read(block_size))
+        Gzipped files are decompressed on the fly.
 
-                # Count lines in this block
-                all_content = b"".join(reversed(blocks))
-                lines_found = all_content.split(b"\n")
+        Args:
+            file_path: Path to the file to read.
+            chunk_size: Maximum number of bytes to read at a time.
+            end: Byte offset at which to stop reading. Defaults to the end of
+                the file.
 
-                # Remove empty line at end if file ends with newline
-                lines_found = lines_found if lines_found[-1] else lines_found[:-1]
+        Yields:
+            Decoded chunks of the file.
+        """
+        with _open_log(file_path) as f:
+            decoder = _utf8_decoder()
+            while end is None or end > 0:
+                size = chunk_size if end is None else min(chunk_size, end)
+                chunk = f.read(size)
+                if not chunk:
+                    break
+                if end is not None:
+                    end -= len(chunk)
+                if text := decoder.decode(chunk):
+                    yield text
+            if text := decoder.decode(b"", final=True):
+                yield text
+
+    def follow_file(
+        self,
+        file_path: Path,
+        *,
+        offset: int = 0,
+        is_active: Callable[[], bool] = lambda: False,
+        poll_interval: float = FOLLOW_POLL_INTERVAL,
+    ) -> Iterator[str]:
+        """Stream lines appended to a file, similar to `tail -f`.
+
+        The file is polled for new data, since it may live on a filesystem that
+        does not support change notifications. Lines are yielded as soon as
+        they are complete. If the file is rotated, the new file is followed
+        once the rotated one is drained. Once `is_active` returns `False` and
+        no more data is available, any remaining partial line is yielded and
+        iteration stops.
 
-                file_length -= block_size
+        Args:
+            file_path: Path to the file to follow.
+            offset: Byte offset from which to start reading.
+            is_active: Callable returning whether the file may still grow.
+            poll_interval: Seconds to wait between polls when no data is ready.
 
-            # Return the last N lines, ensuring we get exactly N lines (or fewer if file is shorter)  # noqa: E501
-            result_lines = lines_found[-lines:] if lines_found else []
-            return [line.decode("utf-8", errors="replace") for line in result_lines]
+        Yields:
+            Lines appended to the file, without the trailing line break.
+        """
+        f = file_path.open("rb")
+        try:
+            f.seek(offset)
+            decoder = _utf8_decoder()
+            pending = ""
+            while True:
+                if chunk := f.read(LOG_CHUNK_SIZE):
+                    pending += decoder.decode(chunk)
+                    *complete, pending = pending.split("\n")
+                    yield from complete
+                    continue
+
+                if _is_rotated(file_path, f):
+                    f.close()
+                    f = file_path.open("rb")
+                    continue
+
+                if not is_active():
+                    # One last read, in case data was written before the check
+                    pending += decoder.decode(f.read(), final=True)
+                    *complete, pending = pending.split("\n")
+                    yield from complete
+                    if pending:
+                        yield pending
+                    return
+
+                time.sleep(poll_interval)
+        finally:
+            f.close()
 
     def format_job_info(self, job: Job, format_type: str = "text") -> str:
         """Format job information for display.
@@ -307,13 +747,36 @@ class JobLoggingService:  # noqa: D101
             log_exists is True if the log file exists.
         """
         log_file_path = self.get_job_log_path(job)
+        segments = self.log_segments(log_file_path)
 
-        if not log_file_path.exists():
+        if not segments:
             return "", False
 
         if tail_lines:
-            lines = self.tail_file(log_file_path, tail_lines)
+            lines = self.tail_log(log_file_path, tail_lines)
             return "\n".join(lines), True
 
-        with log_file_path.open("r", encoding="utf-8", errors="replace") as f:
-            return f.read(), True
+        return "".join(
+            chunk for segment in segments for chunk in self.iter_file_chunks(segment)
+        ), True
+
+
+def _utf8_decoder() -> codecs.IncrementalDecoder:
+    return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _gzip_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}{GZIP_SUFFIX}")
+
+
+def _open_log(path: Path) -> t.BinaryIO:
+    if path.name.endswith(GZIP_SUFFIX):
+        return t.cast("t.BinaryIO", gzip.open(path, "rb"))
+    return path.open("rb")
+
+
+def _is_rotated(path: Path, f: t.BinaryIO) -> bool:
+    try:
+        return os.stat(path).st_ino != os.fstat(f.fileno()).st_ino  # noqa: PTH116
+    except FileNotFoundError:
+        return False
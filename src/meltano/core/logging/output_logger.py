@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import logging
+import logging.handlers
 import os
+import shutil
 import sys
 import typing as t
 from contextlib import (
@@ -30,17 +33,98 @@ StrPath: t.TypeAlias = str | os.PathLike[str]
 class OutputLogger:
     """Output Logger."""
 
-    def __init__(self, file: StrPath) -> None:
+    def __init__(
+        self,
+        file: StrPath,
+        *,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        compress: bool = False,
+    ) -> None:
         """Instantiate an Output Logger.
 
         Args:
             file: A file to output to.
+            max_bytes: Size in bytes at which the file is rotated. Rotation is
+                disabled when set to 0.
+            backup_count: Number of rotated segments to keep.
+            compress: Whether to gzip rotated segments.
         """
         self.file = file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
         self.stdout = sys.stdout
         self.stderr = sys.stderr
 
         self.outs: dict[str, Out] = {}
+        self._log_handler: logging.FileHandler | None = None
+        # The number of active `Out.redirect_logging` calls of each handler
+        self._redirects: dict[logging.Handler, int] = {}
+
+    @property
+    def log_handler(self) -> logging.FileHandler:
+        """The handler writing log records to the file.
+
+        It is shared by every `Out`, so that a single handler writes to and
+        rotates the file.
+
+        Returns:
+            logging.FileHandler using an uncolorized console formatter, which
+            rotates the file if the `OutputLogger` has a maximum size.
+        """
+        if self._log_handler is not None:
+            return self._log_handler
+
+        formatter = structlog.stdlib.ProcessorFormatter(
+            processor=MeltanoConsoleRenderer(
+                colors=False,
+                exception_formatter=structlog.dev.plain_traceback,
+            ),
+            foreign_pre_chain=get_default_foreign_pre_chain(),
+        )
+        handler: logging.FileHandler
+        if self.max_bytes > 0:
+            handler = logging.handlers.RotatingFileHandler(
+                self.file,
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                delay=True,
+            )
+            if self.compress:
+                handler.namer = _gzip_namer
+                handler.rotator = _gzip_rotator
+        else:
+            handler = logging.FileHandler(self.file, delay=True)
+        handler.setFormatter(formatter)
+        self._log_handler = handler
+        return handler
+
+    def attach_handler(self, handler: logging.Handler) -> None:
+        """Add a handler to the root logger, unless it was already added.
+
+        Args:
+            handler: The handler to add.
+        """
+        if not self._redirects.get(handler):
+            logging.getLogger().addHandler(handler)  # noqa: TID251
+        self._redirects[handler] = self._redirects.get(handler, 0) + 1
+
+    def detach_handler(self, handler: logging.Handler) -> None:
+        """Remove a handler from the root logger once it is not used anymore.
+
+        The handler is then closed, so that the file can be moved or compressed.
+        It reopens the file if it is used again.
+
+        Args:
+            handler: The handler to remove.
+        """
+        self._redirects[handler] -= 1
+        if self._redirects[handler]:
+            return
+        del self._redirects[handler]
+        logging.getLogger().removeHandler(handler)  # noqa: TID251
+        handler.close()
 
     def out(
         self,
@@ -76,6 +160,16 @@ class OutputLogger:
         return out
 
 
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:  # noqa: PTH123
+        shutil.copyfileobj(src, dst)
+    os.remove(source)  # noqa: PTH107
+
+
 class LineWriter:
     """Line Writer."""
 
@@ -179,24 +273,16 @@ class Out:
 
         self.last_line = ""
         self._parser_factory = get_parser_factory()
+        self._enabled_levels: dict[int, bool] = {}
 
     @property
     def redirect_log_handler(self) -> logging.Handler:
-        """Configure a logging.Handler suitable for redirecting logs too.
+        """The logging.Handler suitable for redirecting logs too.
 
         Returns:
-            logging.FileHandler using an uncolorized console formatter
+            The log handler of the `OutputLogger`, shared by all its `Out`s.
         """
-        formatter = structlog.stdlib.ProcessorFormatter(
-            processor=MeltanoConsoleRenderer(
-                colors=False,
-                exception_formatter=structlog.dev.plain_traceback,
-            ),
-            foreign_pre_chain=get_default_foreign_pre_chain(),
-        )
-        handler = logging.FileHandler(self.file, delay=True)
-        handler.setFormatter(formatter)
-        return handler
+        return self.output_logger.log_handler
 
     @contextmanager
     def line_writer(self):  # noqa: ANN201
@@ -218,7 +304,8 @@ class Out:
             With the side-effect of redirecting logging.
         """
         logger = logging.getLogger()  # noqa: TID251
-        logger.addHandler(self.redirect_log_handler)
+        handler = self.redirect_log_handler
+        self.output_logger.attach_handler(handler)
         ignored_errors = (
             KeyboardInterrupt,
             asyncio.CancelledError,
@@ -235,7 +322,7 @@ class Out:
             logger.error(str(err), exc_info=True)  # noqa: G201
             raise
         finally:
-            logger.removeHandler(self.redirect_log_handler)
+            self.output_logger.detach_handler(handler)
 
     @asynccontextmanager
     async def writer(self):  # noqa: ANN201
@@ -279,11 +366,33 @@ class Out:
             with redirect_stderr(stderr):
                 yield
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether the underlying logger would emit a record at a level.
+
+        The result is cached for the lifetime of this instance, since the
+        level of the logger is not expected to change mid-run.
+
+        Args:
+            level: A numeric log level.
+
+        Returns:
+            True if records at the given level are not filtered out.
+        """
+        try:
+            return self._enabled_levels[level]
+        except KeyError:
+            is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+            enabled = is_enabled_for(level) if is_enabled_for else True
+            self._enabled_levels[level] = enabled
+            return enabled
+
     def writeline(self, line: str) -> None:
         """Write a line to the underlying structured logger.
 
         Attempts to parse structured logs if a parser is configured,
-        otherwise falls back to simple line logging.
+        otherwise falls back to simple line logging. Lines below the level of
+        the underlying logger are dropped as early as possible, using the
+        level sniffed by the parser to avoid parsing them at all.
 
         Args:
             line: A line to write.
@@ -294,6 +403,11 @@ class Out:
         if not line:
             return
 
+        if self.log_parser:
+            level = self._parser_factory.sniff_level(line, self.log_parser)
+            if level is not None and not self.is_enabled_for(level):
+                return
+
         # Try to parse the line if we have a parser configured
         if self.log_parser and (
             parsed_record := self._parser_factory.parse_line(
@@ -301,6 +415,9 @@ class Out:
                 self.log_parser,
             )
         ):
+            if not self.is_enabled_for(parsed_record.level):
+                return
+
             # Use the parsed record's level and extra fields
             extra = {"name": self.name, **parsed_record.extra}
 
@@ -318,7 +435,8 @@ class Out:
             return
 
         # Fallback to original behavior for unparsable lines
-        self.logger.log(self.write_level, line, name=self.name)
+        if self.is_enabled_for(self.write_level):
+            self.logger.log(self.write_level, line, name=self.name)
 
     async def _read_from_fd(self, read_fd) -> None:  # noqa: ANN001
         # Since we're redirecting our own stdout and stderr output,
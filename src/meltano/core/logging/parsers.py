@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 import sys
 import typing as t
 from abc import ABC, abstractmethod
@@ -15,8 +15,34 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import override
 
+try:
+    from orjson import loads as json_loads  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)  # noqa: TID251
 
+# Level names as emitted by plugins, e.g. "info" or "INFO", mapped to levels
+_LEVELS_BY_NAME: dict[str, int] = {
+    **{name.lower(): level for name, level in logging._nameToLevel.items()},
+    **logging._nameToLevel,
+}
+
+
+def _level_from_name(name: str) -> int:
+    """Get the level of a log level name in any case, e.g. `Warn` or `warning`.
+
+    Args:
+        name: The level name.
+
+    Returns:
+        The level, or INFO if the name is unknown.
+    """
+    level = _LEVELS_BY_NAME.get(name)
+    if level is None:
+        level = _LEVELS_BY_NAME.get(name.upper(), logging.INFO)
+    return level
+
 
 class LogParser(ABC):
     """Base class for log parsers."""
@@ -32,6 +58,17 @@ class LogParser(ABC):
             ParsedLogRecord if parsing succeeds, None otherwise.
         """
 
+    def sniff_level(self, line: str) -> int | None:  # noqa: ARG002
+        """Cheaply determine the level of a log line without fully parsing it.
+
+        Args:
+            line: Raw log line.
+
+        Returns:
+            The level of the line, or None if it can't be determined.
+        """
+        return None
+
 
 class SingerSDKLogParser(LogParser):
     """Parser for Singer SDK structured JSON logs."""
@@ -47,10 +84,31 @@ class SingerSDKLogParser(LogParser):
         "message",
     }
 
+    # Matches the top-level level field, which the SDK always emits first
+    _level_pattern: t.ClassVar[re.Pattern[str]] = re.compile(
+        r'^\s*\{\s*"level"\s*:\s*"(\w+)"'
+    )
+
+    @override
+    def sniff_level(self, line: str) -> int | None:
+        """Read the level of a Singer SDK log line without decoding the JSON.
+
+        Args:
+            line: Raw JSON log line.
+
+        Returns:
+            The level of the line, or None if it doesn't look like an SDK log.
+        """
+        if match := self._level_pattern.match(line):
+            return _level_from_name(match.group(1))
+        return None
+
     @override
     def parse(self, line: str) -> ParsedLogRecord | None:
         """Parse Singer SDK JSON log line.
 
+        Uses `orjson` to decode the line if it is installed.
+
         Args:
             line: Raw JSON log line.
 
@@ -58,33 +116,34 @@ class SingerSDKLogParser(LogParser):
             ParsedLogRecord with structured data or None if parsing fails.
         """
         line = line.strip()
-        if not line:
-            return None
 
-        # Quick check for JSON structure
-        if not (line.startswith("{") and line.endswith("}")):
+        # Quick check for JSON structure, which also rejects empty lines
+        if not line or line[0] != "{" or line[-1] != "}":
             return None
 
         try:
-            data = json.loads(line)
+            data = json_loads(line)
+        except ValueError:
+            return None
 
-            # Singer SDK logs should have at least these fields
-            if not (isinstance(data, dict) and self.required_fields.issubset(data)):
-                return None
+        # Singer SDK logs should have at least these fields
+        if not isinstance(data, dict) or not self.required_fields <= data.keys():
+            return None
 
-            # Extract core log fields
-            level_name = data.pop("level")
-            level = logging._nameToLevel.get(level_name.upper(), logging.INFO)
+        try:
+            # Extract core log fields, the remaining ones become extras
+            level = _level_from_name(data.pop("level"))
             logger_name = data.pop("logger_name")
             timestamp = data.pop("ts")
             message = data.pop("message")
             exception = data.pop("exception", None)
-            extra = data.pop("extra", {})
+            if extra := data.pop("extra", None):
+                data.update(extra)
 
             return ParsedLogRecord(
                 level=level,
                 message=message,
-                extra={**data, **extra},
+                extra=data,
                 timestamp=str(timestamp) if timestamp else None,
                 logger_name=logger_name,
                 exception=PluginException.from_dict(exception) if exception else None,
@@ -163,16 +222,13 @@ class LogParserFactory:
             ParsedLogRecord or None if no parser could handle the line.
         """
         # Try preferred parser first if specified
-        if (
-            preferred_parser
-            and (parser := self.get_parser(preferred_parser))
-            and (result := parser.parse(line)) is not None
-        ):
+        preferred = self.get_parser(preferred_parser) if preferred_parser else None
+        if preferred and (result := preferred.parse(line)) is not None:
             return result
 
-        # Try all registered parsers
+        # Try all other registered parsers
         for parser in self._parsers.values():
-            if (result := parser.parse(line)) is not None:
+            if parser is not preferred and (result := parser.parse(line)) is not None:
                 return result
 
         # Fall back to default parsers
@@ -182,6 +238,24 @@ class LogParserFactory:
 
         return None
 
+    def sniff_level(
+        self,
+        line: str,
+        preferred_parser: str | None = None,
+    ) -> int | None:
+        """Cheaply determine the level of a log line without fully parsing it.
+
+        Args:
+            line: Raw log line.
+            preferred_parser: Name of the parser expected to handle the line.
+
+        Returns:
+            The level of the line, or None if it can't be determined.
+        """
+        if preferred_parser and (parser := self.get_parser(preferred_parser)):
+            return parser.sniff_level(line)
+        return None
+
 
 # Global parser factory instance
 _parser_factory = LogParserFactory()
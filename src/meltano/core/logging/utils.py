@@ -8,6 +8,7 @@ import logging
 import os
 import sys
 import typing as t
+from dataclasses import dataclass
 from logging import config as logging_config
 from pathlib import Path
 
@@ -320,9 +321,104 @@ class SubprocessOutputWriter(t.Protocol):
         """
 
 
+class AsyncStreamWriter:
+    """Base class for destinations that are written to like a `StreamWriter`.
+
+    Captured output is written to them as bytes, awaiting `drain` so that a slow
+    destination slows down the capture, rather than decoded and passed to
+    `writeline`.
+    """
+
+    def write(self, data: bytes) -> None:
+        """Write data to the stream.
+
+        Args:
+            data: The data to write.
+        """
+        raise NotImplementedError
+
+    async def drain(self) -> None:
+        """Wait until it is appropriate to resume writing to the stream."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the stream."""
+        raise NotImplementedError
+
+    async def wait_closed(self) -> None:
+        """Wait until the stream is closed."""
+        raise NotImplementedError
+
+
+class LineBatchReader(t.Protocol):
+    """An output stream that is read a batch of lines at a time."""
+
+    def at_eof(self) -> bool:
+        """Whether the stream ended and all of it was read."""
+
+    async def readlines(self) -> list[bytes]:
+        """Read all complete lines that are available, waiting for at least one.
+
+        Returns:
+            The lines, or the remaining data without a trailing newline at the
+            end of the stream.
+        """
+
+
+_STREAM_WRITER_TYPES = (asyncio.StreamWriter, AsyncStreamWriter)
+
+
+@dataclass
+class OutputStats:
+    """High-water marks of an output stream, recorded while it is captured."""
+
+    lines: int = 0
+    total_bytes: int = 0
+    largest_line: int = 0
+    oversized_lines: int = 0
+
+    def record(self, line: bytes) -> None:
+        """Record a captured line.
+
+        Args:
+            line: The line.
+        """
+        self.lines += 1
+        self.total_bytes += len(line)
+        self.largest_line = max(self.largest_line, len(line))
+
+
+async def _readline_growing(
+    reader: asyncio.StreamReader,
+    max_line_length: int,
+    stats: OutputStats | None,
+) -> bytes:
+    """Read a line that may be longer than the limit of the reader.
+
+    `StreamReader.readuntil` leaves the data in the buffer when the limit is
+    reached, so a longer line is read in parts and joined, growing the memory
+    used for the stream only for as long as the line is being read.
+    """
+    line = b""
+    while True:
+        try:
+            return line + await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as err:  # noqa: PERF203
+            # The stream ended without a trailing newline
+            return line + err.partial
+        except asyncio.LimitOverrunError as err:
+            if not line and stats is not None:
+                stats.oversized_lines += 1
+            if len(line) + err.consumed > max_line_length:
+                # Like `StreamReader.readline` does, so that the error is handled
+                # the same way
+                raise ValueError(err.args[0]) from err
+            line += await reader.readexactly(err.consumed)
+
+
 async def _write_line_writer(writer: SubprocessOutputWriter, line: bytes) -> bool:
     # StreamWriters like a subprocess's stdin need special consideration
-    if isinstance(writer, asyncio.StreamWriter):
+    if isinstance(writer, _STREAM_WRITER_TYPES):
         try:
             writer.write(line)
             await writer.drain()
@@ -335,9 +431,29 @@ async def _write_line_writer(writer: SubprocessOutputWriter, line: bytes) -> boo
     return True
 
 
+async def _write_lines_writer(
+    writer: SubprocessOutputWriter,
+    lines: list[bytes],
+) -> bool:
+    if isinstance(writer, _STREAM_WRITER_TYPES):
+        try:
+            writer.write(b"".join(lines))
+            await writer.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            await writer.wait_closed()
+            return False
+    else:
+        for line in lines:
+            writer.writeline(line.decode(errors="replace"))
+
+    return True
+
+
 async def capture_subprocess_output(
     reader: asyncio.StreamReader | None,
     *line_writers: SubprocessOutputWriter,
+    max_line_length: int | None = None,
+    stats: OutputStats | None = None,
 ) -> None:
     """Capture in real time the output stream of a subprocess that is run async.
 
@@ -352,13 +468,47 @@ async def capture_subprocess_output(
         reader: `asyncio.StreamReader` object that is the output stream of the
             subprocess.
         line_writers: A `StreamWriter`, or object has a compatible writelines method.
+        max_line_length: If greater than the limit of the `StreamReader`, longer
+            lines are read up to this length instead of raising `ValueError`.
+        stats: High-water marks of the stream to update, if any.
     """
     while reader and not reader.at_eof():
-        line = await reader.readline()
+        if max_line_length is not None and isinstance(reader, asyncio.StreamReader):
+            line = await _readline_growing(reader, max_line_length, stats)
+        else:
+            line = await reader.readline()
         if not line:
             continue
 
+        if stats is not None:
+            stats.record(line)
+
         for writer in line_writers:
             if not await _write_line_writer(writer, line):
                 # If the destination stream is closed, we can stop capturing output.
                 return
+
+
+async def capture_output_batches(
+    reader: LineBatchReader,
+    *line_writers: SubprocessOutputWriter,
+) -> None:
+    """Capture in real time an output stream that is read in batches of lines.
+
+    Unlike `capture_subprocess_output`, all lines read at once are written to
+    each destination before waiting for more output, so that high-volume output
+    does not go through the event loop one line at a time.
+
+    Args:
+        reader: The output stream.
+        line_writers: A `StreamWriter`, or object has a compatible writelines method.
+    """
+    while not reader.at_eof():
+        lines = await reader.readlines()
+        if not lines:
+            continue
+
+        for writer in line_writers:
+            if not await _write_lines_writer(writer, lines):
+                # If the destination stream is closed, we can stop capturing output.
+                return
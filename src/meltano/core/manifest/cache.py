@@ -5,3 +5,53 @@
 # them is fairly simple, but reading is tricker because we need to decide
 # whether we should read a manifest file from disk (if it exists), or generate
 # a new one.
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import typing as t
+from contextlib import suppress
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+# Maps the name of each manifest file in a directory to the hash of the inputs
+# it was compiled from
+INPUTS_INDEX_FILE_NAME = ".meltano-manifest-inputs.json"
+
+
+def read_inputs_index(directory: Path) -> dict[str, str] | None:
+    """Read the hashes of the inputs of the manifests in a directory.
+
+    Args:
+        directory: The directory containing the manifest files.
+
+    Returns:
+        The hash of the inputs of each manifest file by name, or `None` if the
+        directory has no valid index.
+    """
+    try:
+        index = json.loads(directory.joinpath(INPUTS_INDEX_FILE_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    return index if isinstance(index, dict) else None
+
+
+def write_inputs_index(directory: Path, index: dict[str, str]) -> None:
+    """Atomically write the hashes of the inputs of the manifests in a directory.
+
+    Args:
+        directory: The directory containing the manifest files.
+        index: The hash of the inputs of each manifest file by name.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp.json")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(index, tmp_file, indent=2, sort_keys=True)
+        os.replace(tmp_name, directory / INPUTS_INDEX_FILE_NAME)  # noqa: PTH105
+    except Exception:  # pragma: no cover
+        with suppress(OSError):
+            os.unlink(tmp_name)  # noqa: PTH108
+        raise
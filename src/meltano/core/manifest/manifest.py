@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
+import os
 import re
 import typing as t
 from collections import defaultdict
 from collections.abc import Mapping
 from contextlib import suppress
+from dataclasses import dataclass
 from functools import cached_property, reduce
 from importlib import resources
 from operator import getitem
@@ -23,11 +28,14 @@ from meltano.core.plugin.base import PluginType
 from meltano.core.plugin.settings_service import PluginSettingsService
 from meltano.core.plugin_lock_service import PluginLockService
 from meltano.core.utils import (
+    ENV_VAR_PATTERN,
     EnvVarMissingBehavior,
     MergeStrategy,
     deep_merge,
     default_deep_merge_strategies,
     expand_env_vars,
+    get_meltano_version,
+    to_env_var,
     unflatten,
 )
 
@@ -110,6 +118,216 @@ class YamlNoTimestampSafeLoader(
     """A safe YAML loader that leaves timestamps as strings."""
 
 
+@functools.cache
+def _manifest_schema() -> dict[str, t.Any]:
+    with MANIFEST_SCHEMA_PATH.open() as manifest_schema_file:
+        return json.load(manifest_schema_file)
+
+
+@functools.cache
+def _manifest_schema_validator() -> jsonschema.protocols.Validator:
+    """A validator for the manifest schema, shared by every manifest.
+
+    The validator class is automatically determined from the schema's
+    $schema field using jsonschema.validators.validator_for().
+    """
+    manifest_schema = _manifest_schema()
+    validator_cls = jsonschema.validators.validator_for(manifest_schema)
+    validator_cls.check_schema(manifest_schema)
+    return validator_cls(manifest_schema)
+
+
+def validate_manifest(
+    instance_name: str,
+    instance_path: Path,
+    instance_data: dict[str, t.Any],
+) -> None:
+    """Validate data against the manifest schema, logging any errors found.
+
+    Args:
+        instance_name: A description of the data, used in the log message.
+        instance_path: The path of the data, used in the log message.
+        instance_data: The data to validate.
+    """
+    errors = sorted(
+        _manifest_schema_validator().iter_errors(instance_data),
+        key=lambda e: tuple(str(p) for p in e.absolute_path),
+    )
+
+    if errors:
+        error_messages = ["Schema validation errors were encountered."]
+        for error in errors:
+            if error.absolute_path:
+                path = "::$." + ".".join(str(p) for p in error.absolute_path)
+            else:
+                path = "::$"
+            error_messages.append(f"  {instance_path}{path}: {error.message}")
+
+        formatted_errors = "\n".join(error_messages)
+        logger.warning(
+            f"{SCHEMA_VALIDATION_LOG_PREFIX} {instance_name} against Meltano "  # noqa: G004
+            f"manifest schema ({MANIFEST_SCHEMA_PATH}):\n{formatted_errors}",
+        )
+
+
+def _load_project_file(text: str) -> dict[str, t.Any]:
+    return yaml.load(
+        text,
+        t.cast("type[yaml.SafeLoader]", YamlNoTimestampSafeLoader),  # noqa: S506
+    )
+
+
+def _project_plugins(project: Project) -> dict[PluginType, list[ProjectPlugin]]:
+    plugins = project.plugins.plugins_by_type()
+
+    # Remove the 'mappings' category of plugins, since those are created
+    # dynamically at run-time, and shouldn't be represented directly in
+    # `meltano.yml` or in manifest files. For more details, refer to:
+    # https://gitlab.com/meltano/meltano/-/merge_requests/2481#note_832478775
+    with suppress(KeyError):
+        del plugins[PluginType.MAPPINGS]
+
+    return plugins
+
+
+def _locked_plugins(
+    project: Project,
+    plugins: dict[PluginType, list[ProjectPlugin]],
+) -> dict[str, list[Mapping[str, t.Any]]]:
+    lock_service = PluginLockService(project)
+    return {
+        plugin_type.value: [
+            lock_service.get_standalone_data(plugin=plugin) for plugin in plugins
+        ]
+        for (plugin_type, plugins) in plugins.items()
+    }
+
+
+def _setting_env_names(obj: t.Any) -> Iterable[str]:  # noqa: ANN401
+    """Get the custom environment variable names of the settings in `obj`."""
+    if isinstance(obj, Mapping):
+        for key, value in obj.items():
+            if key == "env" and isinstance(value, str):
+                yield value
+            else:
+                yield from _setting_env_names(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _setting_env_names(value)
+
+
+def _manifest_env(
+    texts: Iterable[str],
+    plugins: dict[PluginType, list[ProjectPlugin]],
+    definitions: Iterable[t.Any],
+) -> list[tuple[str, str]]:
+    """Get the environment variables that manifests may depend on.
+
+    These are the Meltano settings, the settings of the project's plugins, and
+    the variables referenced in the project files.
+
+    Args:
+        texts: The text of the project files.
+        plugins: The plugins of the project.
+        definitions: The project files and plugin definitions, which may give
+            custom environment variable names to settings.
+
+    Returns:
+        The sorted names and values of the environment variables.
+    """
+    prefixes = (
+        "MELTANO_",
+        *sorted(
+            {
+                f"{to_env_var(prefix)}_"
+                for plugins_of_type in plugins.values()
+                for plugin in plugins_of_type
+                for prefix in plugin.env_prefixes()
+            },
+        ),
+    )
+    referenced = {
+        match["curly"] or match["normal"]
+        for text in texts
+        for match in ENV_VAR_PATTERN.finditer(text)
+    }
+    referenced.update(
+        name for definition in definitions for name in _setting_env_names(definition)
+    )
+    return sorted(
+        (name, value)
+        for name, value in os.environ.items()
+        if name in referenced or name.startswith(prefixes)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestInputs:
+    """The inputs of a project's manifests which do not depend on the environment.
+
+    Computing these once and sharing them between the manifests of every
+    environment avoids re-parsing the project files and re-reading the plugin
+    lockfiles for each environment. Instances can be pickled, so that manifests
+    can be built in other processes.
+    """
+
+    project_files: dict[str, t.Any]
+    locked_plugins: dict[str, list[Mapping[str, t.Any]]]
+    sha256: str
+
+    @classmethod
+    def from_project(cls, project: Project, *, check_schema: bool) -> ManifestInputs:
+        """Read the environment-independent manifest inputs of a project.
+
+        Args:
+            project: The Meltano project.
+            check_schema: Whether the project files should be validated
+                against the Meltano schema.
+
+        Returns:
+            The manifest inputs of the project.
+        """
+        texts = {
+            path: path.read_text()
+            for path in (
+                project.meltanofile,
+                *project.project_files.include_paths,
+            )
+        }
+        project_files = unflatten(
+            deep_merge(*(_load_project_file(text) for text in texts.values())),
+        )
+        if check_schema:
+            validate_manifest("project files", project.meltanofile, project_files)
+
+        plugins = _project_plugins(project)
+        locked_plugins = _locked_plugins(project, plugins)
+
+        # Everything else that the contents of a manifest may depend on, i.e.
+        # setting values from the environment or the `.env` file
+        dotenv = project.dotenv.read_text() if project.dotenv.exists() else None
+        fingerprint = json.dumps(
+            [
+                get_meltano_version(),
+                [(str(path), text) for path, text in texts.items()],
+                locked_plugins,
+                dotenv,
+                _manifest_env(
+                    texts.values(),
+                    plugins,
+                    (project_files, locked_plugins),
+                ),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return cls(
+            project_files=project_files,
+            locked_plugins=locked_plugins,
+            sha256=hashlib.sha256(fingerprint.encode()).hexdigest(),
+        )
+
+
 class Manifest:
     """A complete unambiguous static representation of a Meltano project."""
 
@@ -120,6 +338,7 @@ class Manifest:
         *,
         check_schema: bool,
         redact_secrets: bool = False,
+        inputs: ManifestInputs | None = None,
     ) -> None:
         """Initialize the manifest.
 
@@ -138,6 +357,9 @@ class Manifest:
                 files should be validated against the Meltano schema.
             redact_secrets: Whether to redact secret values from the generated
                 manifest.
+            inputs: The environment-independent inputs of the manifest, if
+                they have already been read. The project files are assumed to
+                have been validated already if `check_schema` is set.
         """
         self.project = project
         self._project_root_str = str(self.project.root.resolve())
@@ -145,20 +367,14 @@ class Manifest:
         self.path = path
         self.check_schema = check_schema
         self.redact_secrets = redact_secrets
-        with MANIFEST_SCHEMA_PATH.open() as manifest_schema_file:
-            self._manifest_schema = json.load(manifest_schema_file)
+        self.inputs = inputs
+        self._manifest_schema = _manifest_schema()
         self._env_locations = meltano_config_env_locations(self._manifest_schema)
 
-    @cached_property
+    @property
     def _schema_validator(self) -> jsonschema.protocols.Validator:
-        """A cached validator for the manifest schema.
-
-        The validator class is automatically determined from the schema's
-        $schema field using jsonschema.validators.validator_for().
-        """
-        validator_cls = jsonschema.validators.validator_for(self._manifest_schema)
-        validator_cls.check_schema(self._manifest_schema)
-        return validator_cls(self._manifest_schema)
+        """A cached validator for the manifest schema."""
+        return _manifest_schema_validator()
 
     def _validate_against_manifest_schema(
         self,
@@ -166,39 +382,19 @@ class Manifest:
         instance_path: Path,
         instance_data: dict[str, t.Any],
     ) -> None:
-        errors = sorted(
-            self._schema_validator.iter_errors(instance_data),
-            key=lambda e: tuple(str(p) for p in e.absolute_path),
-        )
-
-        if errors:
-            error_messages = ["Schema validation errors were encountered."]
-            for error in errors:
-                if error.absolute_path:
-                    path = "::$." + ".".join(str(p) for p in error.absolute_path)
-                else:
-                    path = "::$"
-                error_messages.append(f"  {instance_path}{path}: {error.message}")
-
-            formatted_errors = "\n".join(error_messages)
-            logger.warning(
-                f"{SCHEMA_VALIDATION_LOG_PREFIX} {instance_name} against Meltano "  # noqa: G004
-                f"manifest schema ({MANIFEST_SCHEMA_PATH}):\n{formatted_errors}",
-            )
+        validate_manifest(instance_name, instance_path, instance_data)
 
     @cached_property
     def _project_files(self) -> dict[str, t.Any]:
+        if self.inputs is not None:
+            # The manifest is built by mutating these in-place
+            return copy.deepcopy(self.inputs.project_files)
+
         project_files = unflatten(
             deep_merge(
-                yaml.load(
-                    self._meltano_file,
-                    t.cast("type[yaml.SafeLoader]", YamlNoTimestampSafeLoader),  # noqa: S506
-                ),
+                _load_project_file(self._meltano_file),
                 *(
-                    yaml.load(
-                        x.read_text(),
-                        t.cast("type[yaml.SafeLoader]", YamlNoTimestampSafeLoader),  # noqa: S506
-                    )
+                    _load_project_file(x.read_text())
                     for x in self.project.project_files.include_paths
                 ),
             ),
@@ -216,16 +412,10 @@ class Manifest:
         plugins: dict[PluginType, list[ProjectPlugin]],
         manifest: dict[str, t.Any],
     ) -> None:
-        lock_service = PluginLockService(self.project)
-        locked_plugins = t.cast(
-            "dict[str, list[Mapping[str, t.Any]]]",
-            {
-                plugin_type.value: [
-                    lock_service.get_standalone_data(plugin=plugin)
-                    for plugin in plugins
-                ]
-                for (plugin_type, plugins) in plugins.items()
-            },
+        locked_plugins = (
+            copy.deepcopy(self.inputs.locked_plugins)
+            if self.inputs is not None
+            else _locked_plugins(self.project, plugins)
         )
 
         # Merge the locked plugins with the root-level plugins from `meltano.yml`:
@@ -378,14 +568,7 @@ class Manifest:
 
         apply_scaffold(manifest, self._env_locations)
 
-        plugins = self.project.plugins.plugins_by_type()
-
-        # Remove the 'mappings' category of plugins, since those are created
-        # dynamically at run-time, and shouldn't be represented directly in
-        # `meltano.yml` or in manifest files. For more details, refer to:
-        # https://gitlab.com/meltano/meltano/-/merge_requests/2481#note_832478775
-        with suppress(KeyError):
-            del plugins[PluginType.MAPPINGS]
+        plugins = _project_plugins(self.project)
 
         # NOTE: `self._merge_plugin_lockfiles` restructures the plugins into a
         #       map from plugin types to maps of plugin IDs to their values.
@@ -433,6 +616,46 @@ class Manifest:
         return manifest
 
 
+def build_manifest_data(
+    root: Path,
+    environment_name: str | None,
+    path: Path,
+    *,
+    inputs: ManifestInputs,
+    redact_secrets: bool,
+    dotenv_file: Path | None = None,
+) -> dict[str, t.Any]:
+    """Build the manifest data of a project for one of its environments.
+
+    This instantiates the project from its root, so that it can be used to build
+    manifests in other processes.
+
+    Args:
+        root: The root directory of the Meltano project.
+        environment_name: The name of the environment, or `None` to build the
+            manifest for when no environment is active.
+        path: The path the manifest will be saved to.
+        inputs: The environment-independent inputs of the manifest.
+        redact_secrets: Whether to redact secret values from the manifest.
+        dotenv_file: The `.env` file of the project, if not the default one.
+
+    Returns:
+        The manifest data.
+    """
+    from meltano.core.project import Project
+
+    project = Project(root, dotenv_file=dotenv_file)
+    if environment_name is not None:
+        project.activate_environment(environment_name)
+    return Manifest(
+        project=project,
+        path=path,
+        check_schema=False,
+        redact_secrets=redact_secrets,
+        inputs=inputs,
+    ).data
+
+
 def _plugins_by_name_by_type(
     plugins_by_type: PluginsByType,
 ) -> PluginsByNameByType:
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 import sys
 import typing as t
 import warnings
 
-from meltano.core.behavior.canonical import Canonical
+from meltano.core.behavior.canonical import Canonical, copy_tree
 from meltano.core.environment import Environment
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.project_plugin import ProjectPlugin
@@ -213,7 +212,7 @@ class MeltanoFile(Canonical):
         """
         mapping_plugins: list[ProjectPlugin] = []
         for mapping in mapper_config.get("mappings", []):
-            raw_mapping_plugin = copy.deepcopy(mapper_config)
+            raw_mapping_plugin = copy_tree(mapper_config)
             raw_mapping_plugin["mapping"] = True
             raw_mapping_plugin["mapping_name"] = mapping.get("name")
             raw_mapping_plugin["config"] = mapping.get("config")
@@ -7,6 +7,8 @@ import typing as t
 
 import click
 import structlog
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import text
 
 from meltano.migrations import LOCK_PATH, MIGRATION_DIR
 
@@ -50,6 +52,31 @@ class MigrationService:
         self.lock_path = lock_path
         self.migration_directory = migration_directory
 
+    def is_up_to_date(self) -> bool:
+        """Check whether the system database is at the locked revision.
+
+        This only reads the revision stored in the database, without loading
+        alembic or the migration scripts, so it is cheap enough to run before
+        every command.
+
+        Returns:
+            Whether the stored revision is the locked one. `False` if either is
+            missing, in which case `upgrade` does the full check.
+        """
+        try:
+            head = self.lock_path.read_text().strip()
+        except FileNotFoundError:
+            return False
+
+        try:
+            with self.engine.connect() as conn:
+                result = conn.execute(text("SELECT version_num FROM alembic_version"))
+                revisions: list[str] = list(result.scalars())
+        except SQLAlchemyError:
+            return False
+
+        return revisions == [head]
+
     def ensure_migration_needed(
         self,
         script: ScriptDirectory,
@@ -83,6 +110,11 @@ class MigrationService:
         Raises:
             MigrationError: If the upgrade fails.
         """
+        if self.is_up_to_date():
+            if not silent:
+                click.secho("System database up-to-date.")
+            return
+
         from alembic import command
         from alembic.config import Config
         from alembic.runtime.migration import MigrationContext
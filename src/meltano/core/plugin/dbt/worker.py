@@ -0,0 +1,357 @@
+"""Long-lived dbt worker processes for `meltano run`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import secrets
+import typing as t
+from pathlib import Path
+
+import structlog
+
+from meltano.core.plugin.dbt import worker_process
+from meltano.core.plugin_invoker import UnknownCommandError
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from meltano.core.logging.utils import SubprocessOutputWriter
+    from meltano.core.plugin_invoker import PluginInvoker
+
+logger = structlog.stdlib.get_logger(__name__)
+
+DBT_EXECUTABLES = frozenset(("dbt", "dbt.exe"))
+
+
+class DbtWorkerError(Exception):
+    """A dbt worker could not be started or stopped unexpectedly."""
+
+
+class DbtWorkerExitedError(DbtWorkerError):
+    """A dbt worker stopped while running a command."""
+
+
+class DbtWorker:
+    """A Python process running dbt commands with the programmatic dbt runner.
+
+    The worker process keeps the dbt manifest it parsed, so that consecutive
+    commands do not need to parse the dbt project again.
+    """
+
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        token: str,
+        env: Mapping[str, str],
+        cwd: str | None,
+    ) -> None:
+        """Initialize the `DbtWorker` instance.
+
+        Args:
+            process: The worker process.
+            token: The token the worker prefixes its responses with.
+            env: The environment the worker was started with.
+            cwd: The working directory the worker was started in.
+        """
+        self.process = process
+        self.env = dict(env)
+        self.cwd = cwd
+        self._token = token.encode()
+        self._stdout_writers: Sequence[SubprocessOutputWriter] = ()
+        self._stderr_writers: Sequence[SubprocessOutputWriter] = ()
+        # The response markers read from stderr, and an empty line once the
+        # worker closed its stderr
+        self._stderr_markers: asyncio.Queue[bytes] = asyncio.Queue()
+        self._stderr_future = asyncio.ensure_future(self._proxy_stderr())
+
+    @classmethod
+    async def start(
+        cls,
+        python: str | Path,
+        env: Mapping[str, str],
+        cwd: str | None = None,
+    ) -> DbtWorker:
+        """Start a worker process.
+
+        Args:
+            python: The Python interpreter dbt is installed for.
+            env: The environment to run dbt commands in.
+            cwd: The directory to run dbt commands in.
+
+        Returns:
+            The started worker.
+
+        Raises:
+            DbtWorkerError: If the worker could not be started, e.g. if the
+                installed version of dbt does not provide the programmatic runner.
+        """
+        token = f"@@meltano-dbt-worker-{secrets.token_hex(8)}@@"
+        try:
+            process = await asyncio.create_subprocess_exec(
+                str(python),
+                worker_process.__file__,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={
+                    **env,
+                    worker_process.TOKEN_ENV: token,
+                    "PYTHONUNBUFFERED": "1",
+                },
+                cwd=cwd,
+            )
+        except OSError as err:
+            msg = f"Cannot start dbt worker: {err}"
+            raise DbtWorkerError(msg) from err
+
+        worker = cls(process, token, env, cwd)
+        try:
+            response = await worker._read_response()
+        except DbtWorkerError:
+            await worker.stop()
+            raise
+
+        if not response.get("ready"):
+            await worker.stop()
+            msg = f"dbt worker is not supported: {response.get('error')}"
+            raise DbtWorkerError(msg)
+
+        return worker
+
+    async def _proxy_stderr(self) -> None:
+        reader = self.process.stderr
+        try:
+            while reader and not reader.at_eof():
+                line = await reader.readline()
+                if not line:
+                    continue
+                if line.startswith(self._token):
+                    self._stderr_markers.put_nowait(line)
+                    continue
+                if not self._stderr_writers:
+                    logger.debug(
+                        "dbt worker output",
+                        line=line.decode(errors="replace"),
+                    )
+                for writer in self._stderr_writers:
+                    writer.writeline(line.decode(errors="replace"))
+        finally:
+            self._stderr_markers.put_nowait(b"")
+
+    async def _wait_stderr(self) -> None:
+        # The worker writes a marker to stderr after the output of each command
+        if not await self._stderr_markers.get():
+            # Keep the closed state for later calls
+            self._stderr_markers.put_nowait(b"")
+
+    async def _read_response(self) -> dict[str, t.Any]:
+        reader = self.process.stdout
+        while reader and not reader.at_eof():
+            line = await reader.readline()
+            if line.startswith(self._token):
+                # Let the stderr output of the command through before returning
+                await self._wait_stderr()
+                return json.loads(line[len(self._token) :])
+            if not line:
+                continue
+            for writer in self._stdout_writers:
+                writer.writeline(line.decode(errors="replace"))
+
+        msg = "dbt worker exited unexpectedly"
+        raise DbtWorkerError(msg)
+
+    async def invoke(
+        self,
+        args: Sequence[str],
+        *,
+        reuse_manifest: bool,
+        stdout: Sequence[SubprocessOutputWriter],
+        stderr: Sequence[SubprocessOutputWriter],
+    ) -> int:
+        """Run a dbt command in the worker.
+
+        Args:
+            args: The dbt command line arguments, without the executable.
+            reuse_manifest: Whether the manifest parsed by previous commands is
+                still valid.
+            stdout: Destinations of the dbt standard output.
+            stderr: Destinations of the dbt standard error.
+
+        Returns:
+            The exit code of the command.
+
+        Raises:
+            DbtWorkerError: If the worker is not running, before the command is
+                sent to it.
+            DbtWorkerExitedError: If the worker stopped while running the command.
+        """
+        if self.process.stdin is None or self.process.returncode is not None:
+            msg = "dbt worker is not running"
+            raise DbtWorkerError(msg)
+
+        request = {"args": list(args), "reuse_manifest": reuse_manifest}
+        self._stdout_writers, self._stderr_writers = stdout, stderr
+        try:
+            try:
+                self.process.stdin.write(json.dumps(request).encode() + b"\n")
+                await self.process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as err:
+                msg = "dbt worker exited unexpectedly"
+                raise DbtWorkerError(msg) from err
+            try:
+                response = await self._read_response()
+            except DbtWorkerError as err:
+                msg = "dbt worker exited while running the command"
+                raise DbtWorkerExitedError(msg) from err
+        finally:
+            self._stdout_writers, self._stderr_writers = (), ()
+
+        return int(response["exit_code"])
+
+    async def stop(self) -> None:
+        """Stop the worker process."""
+        if self.process.returncode is None:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        self._stderr_future.cancel()
+
+
+class DbtWorkerPool:
+    """dbt workers for the length of a `meltano run`, one per dbt plugin.
+
+    Commands of dbt plugins installed in a virtual environment are run in a
+    worker. When a plugin cannot use a worker, its commands are run in a new
+    process instead. A command the worker exits during is not run again, since
+    it may have partly run, but fails.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the `DbtWorkerPool` instance."""
+        self._workers: dict[str, DbtWorker] = {}
+        self._unsupported: set[str] = set()
+        self._last_key: str | None = None
+
+    def invalidate(self) -> None:
+        """Let workers know that the dbt project may have changed."""
+        self._last_key = None
+
+    def supports(self, invoker: PluginInvoker, command: str | None) -> bool:
+        """Check whether a plugin command can run in a worker.
+
+        Args:
+            invoker: The invoker of the plugin.
+            command: The plugin command name, if any.
+
+        Returns:
+            Whether the command runs the `dbt` executable of a plugin installed in
+            a virtual environment that has not failed to use a worker before.
+        """
+        if not invoker.venv or invoker.plugin.name in self._unsupported:
+            return False
+
+        executable = invoker.plugin.executable
+        if command:
+            try:
+                executable = invoker.find_command(command).executable or executable
+            except UnknownCommandError:
+                return False
+
+        return Path(executable).name in DBT_EXECUTABLES
+
+    async def _worker(
+        self,
+        key: str,
+        python: Path,
+        env: Mapping[str, str],
+        cwd: str | None,
+    ) -> DbtWorker:
+        worker = self._workers.get(key)
+        if worker is not None and worker.env == env and worker.cwd == cwd:
+            return worker
+
+        if worker is not None:
+            logger.debug("Restarting dbt worker with new environment", plugin=key)
+            del self._workers[key]
+            self.invalidate()
+            await worker.stop()
+
+        worker = await DbtWorker.start(python, env, cwd)
+        self._workers[key] = worker
+        return worker
+
+    async def invoke(
+        self,
+        invoker: PluginInvoker,
+        popen_args: Sequence[str],
+        popen_env: Mapping[str, str],
+        *,
+        cwd: str | None,
+        stdout: Sequence[SubprocessOutputWriter],
+        stderr: Sequence[SubprocessOutputWriter],
+    ) -> int | None:
+        """Run a plugin command in a worker.
+
+        Args:
+            invoker: The invoker of the plugin.
+            popen_args: The command line of the plugin command.
+            popen_env: The environment of the plugin command.
+            cwd: The working directory of the plugin command.
+            stdout: Destinations of the standard output.
+            stderr: Destinations of the standard error.
+
+        Returns:
+            The exit code of the command, or `None` if it must be run in a new
+            process instead. If the worker exited while running the command,
+            its non-zero exit code.
+        """
+        key = invoker.plugin.name
+        python = invoker.venv.exec_path("python") if invoker.venv else None
+        if python is None or Path(popen_args[0]).name not in DBT_EXECUTABLES:
+            self.invalidate()
+            return None
+
+        reuse_manifest = self._last_key == key
+        self._last_key = None
+        try:
+            worker = await self._worker(key, python, popen_env, cwd)
+            exit_code = await worker.invoke(
+                popen_args[1:],
+                reuse_manifest=reuse_manifest,
+                stdout=stdout,
+                stderr=stderr,
+            )
+        except DbtWorkerExitedError as err:
+            logger.error(  # noqa: TRY400
+                "dbt worker exited while running a command",
+                plugin=key,
+                reason=str(err),
+            )
+            self._unsupported.add(key)
+            failed_worker = self._workers.pop(key)
+            await failed_worker.stop()
+            return failed_worker.process.returncode or 1
+        except DbtWorkerError as err:
+            logger.warning(
+                "Cannot run dbt command in a worker, running it in a new process",
+                plugin=key,
+                reason=str(err),
+            )
+            self._unsupported.add(key)
+            if failed_worker := self._workers.pop(key, None):
+                await failed_worker.stop()
+            return None
+
+        self._last_key = key
+        return exit_code
+
+    async def close(self) -> None:
+        """Stop all workers."""
+        workers, self._workers = self._workers, {}
+        self.invalidate()
+        await asyncio.gather(*(worker.stop() for worker in workers.values()))
@@ -0,0 +1,158 @@
+"""Long-lived dbt invocation worker.
+
+This script is run with the Python interpreter of a dbt plugin's virtual
+environment, so it must not import Meltano. It reads one JSON request per line
+from stdin, runs it with the programmatic dbt runner, and writes the response to
+stdout on a line starting with the token passed in `MELTANO_DBT_WORKER_TOKEN`.
+The token is also written alone on a stderr line before each response. All other
+stdout and stderr output is dbt's own.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import traceback
+import typing as t
+
+TOKEN_ENV = "MELTANO_DBT_WORKER_TOKEN"  # noqa: S105
+
+COMMANDS = frozenset(
+    (
+        "build",
+        "clean",
+        "clone",
+        "compile",
+        "debug",
+        "deps",
+        "docs",
+        "init",
+        "list",
+        "ls",
+        "parse",
+        "retry",
+        "run",
+        "run-operation",
+        "seed",
+        "show",
+        "snapshot",
+        "source",
+        "test",
+    ),
+)
+
+# Commands that can be given a manifest parsed by a previous invocation
+MANIFEST_COMMANDS = frozenset(
+    (
+        "build",
+        "clone",
+        "compile",
+        "docs",
+        "list",
+        "ls",
+        "retry",
+        "run",
+        "run-operation",
+        "seed",
+        "show",
+        "snapshot",
+        "source",
+        "test",
+    ),
+)
+
+# Commands that change the files dbt parses
+INVALIDATING_COMMANDS = frozenset(("clean", "deps", "init"))
+
+# Options that change how the project is parsed
+PARSE_OPTIONS = frozenset(
+    (
+        "--vars",
+        "--target",
+        "-t",
+        "--profile",
+        "--project-dir",
+        "--profiles-dir",
+        "--target-path",
+        "--packages-install-path",
+        "--partial-parse",
+        "--no-partial-parse",
+    ),
+)
+
+
+def respond(token: str, **message: t.Any) -> None:
+    """Write a response to stdout, after the output of dbt.
+
+    The token is also written to stderr, to mark the end of dbt's output there.
+    """
+    sys.stderr.flush()
+    sys.stderr.write(token + "\n")
+    sys.stderr.flush()
+    sys.stdout.flush()
+    sys.stdout.write(token + json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def exit_code(result: t.Any) -> int:  # noqa: ANN401
+    """Get the exit code of the dbt CLI for the result of an invocation."""
+    if result.success:
+        return 0
+    return 1 if result.exception is None else 2
+
+
+def parse(runner_class: type) -> t.Any:  # noqa: ANN401
+    """Parse the dbt project, returning the manifest or `None` on failure."""
+    try:
+        result = runner_class().invoke(["parse", "--quiet"])
+    except Exception:  # noqa: BLE001
+        return None
+    return result.result if result.success else None
+
+
+def main() -> int:
+    """Run dbt commands read from stdin until it is closed."""
+    token = os.environ[TOKEN_ENV]
+    try:
+        from dbt.cli.main import dbtRunner
+    except ImportError as err:
+        respond(token, ready=False, error=str(err))
+        return 1
+
+    respond(token, ready=True)
+
+    manifest = None
+    for line in sys.stdin:
+        request = json.loads(line)
+        args = request["args"]
+        if not request.get("reuse_manifest"):
+            manifest = None
+
+        command = next((arg for arg in args if arg in COMMANDS), None)
+        reusable = command in MANIFEST_COMMANDS and not any(
+            arg.split("=", 1)[0] in PARSE_OPTIONS for arg in args
+        )
+        if reusable and manifest is None:
+            manifest = parse(dbtRunner)
+
+        try:
+            result = dbtRunner(manifest=manifest if reusable else None).invoke(args)
+        except Exception:  # noqa: BLE001
+            traceback.print_exc()
+            code = 2
+        else:
+            code = exit_code(result)
+            if command == "parse" and code == 0:
+                manifest = result.result
+
+        if command in INVALIDATING_COMMANDS:
+            manifest = None
+
+        respond(token, exit_code=code)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 import typing as t
 
 import structlog
 
+from meltano.core.behavior.canonical import copy_tree
 from meltano.core.plugin.base import PluginDefinition, PluginRef, PluginType, Variant
 from meltano.core.plugin.command import Command
 from meltano.core.plugin.factory import base_plugin_factory
@@ -211,7 +211,7 @@ class ProjectPlugin(PluginRef):  # too many attrs and methods
             # instead
             self._fallbacks.update(["namespace", "label"])
 
-        self.config = copy.deepcopy(config or {})
+        self.config = copy_tree(config or {})
         self.extras = extras
 
     def __repr__(self) -> str:
@@ -830,3 +830,40 @@ class ListSelectedExecutor(CatalogExecutor):
         selection = SelectedNode(prop, self.node_selection(node))
 
         self.properties[self._stream].add(selection)
+
+
+def shard_catalog(catalog: CatalogDict, shards: int) -> list[CatalogDict]:
+    """Split the selected streams of a catalog into shards.
+
+    Selected streams are assigned to the shards round-robin, in the order of
+    their stream IDs, so that the assignment is stable across runs as long as
+    the selection does not change. Each shard catalog only contains its own
+    selected streams, as well as the streams that are not selected at all.
+
+    Args:
+        catalog: The catalog, with selection metadata applied.
+        shards: The number of shards.
+
+    Returns:
+        A catalog for every shard, leaving out the shards in excess of the
+        number of selected streams.
+    """
+    list_selected = ListSelectedExecutor()
+    list_selected.visit(catalog)  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
+
+    selected = sorted(
+        stream for stream, selection in list_selected.streams if selection
+    )
+    assignment = {stream: idx % shards for idx, stream in enumerate(selected)}
+
+    return [
+        {
+            **catalog,
+            "streams": [
+                stream
+                for stream in catalog["streams"]
+                if assignment.get(stream["tap_stream_id"], shard) == shard
+            ],
+        }
+        for shard in range(min(shards, len(selected)))
+    ]
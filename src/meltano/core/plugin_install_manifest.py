@@ -0,0 +1,213 @@
+"""Record of the plugin installations of a project."""
+
+from __future__ import annotations
+
+import enum
+import json
+import os
+import shlex
+import sys
+import tempfile
+import typing as t
+from functools import cached_property
+
+from meltano.core.plugin import PluginType
+from meltano.core.plugin_install_plan import plugin_key
+from meltano.core.plugin_install_service import (
+    PluginInstallService,
+    get_pip_install_args,
+)
+from meltano.core.venv_service import VirtualEnv, fingerprint
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    from backports.strenum import StrEnum
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+
+INSTALL_MANIFEST_FILE_NAME = "plugin_install_manifest.json"
+INSTALL_MANIFEST_VERSION = 1
+
+
+class InstallDrift(StrEnum):
+    """Why a plugin needs to be installed."""
+
+    NOT_INSTALLED = enum.auto()
+    REQUIREMENTS_CHANGED = enum.auto()
+    INTERPRETER_CHANGED = enum.auto()
+    NOT_RECORDED = enum.auto()
+    ALWAYS = enum.auto()
+
+    @property
+    def description(self) -> str:
+        """Human-readable description of the drift."""
+        return {
+            InstallDrift.NOT_INSTALLED: "not installed",
+            InstallDrift.REQUIREMENTS_CHANGED: "requirements changed",
+            InstallDrift.INTERPRETER_CHANGED: "Python interpreter changed",
+            InstallDrift.NOT_RECORDED: "not installed by `meltano install`",
+            InstallDrift.ALWAYS: "installed on every run",
+        }[self]
+
+
+def _installs_venv_only(plugin: ProjectPlugin) -> bool:
+    # Installing file bundles and plugins with their own installer does more than
+    # setting up a virtual environment
+    return plugin.type is not PluginType.FILES and not hasattr(plugin, "installer")
+
+
+def _stat_signature(path: os.PathLike[str]) -> list[int] | None:
+    try:
+        stat = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+class PluginInstallManifest:
+    """The fingerprint and Python interpreter of each installed plugin.
+
+    The manifest lets `meltano install` tell which plugins need to be installed by
+    comparing a few file stats, without running the package installer, probing
+    interpreters, or resolving plugin settings (unless `pip_url` references
+    environment variables).
+    """
+
+    def __init__(self, project: Project) -> None:
+        """Initialize the `PluginInstallManifest` instance.
+
+        Args:
+            project: The Meltano project.
+        """
+        self.project = project
+        self.path = project.dirs.run(INSTALL_MANIFEST_FILE_NAME)
+        try:
+            manifest = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            manifest = {}
+
+        self._entries: dict[str, dict[str, t.Any]] = (
+            manifest.get("plugins", {})
+            if manifest.get("version") == INSTALL_MANIFEST_VERSION
+            else {}
+        )
+
+    @cached_property
+    def _project_python(self) -> str | None:
+        return self.project.settings.get("python")
+
+    def _venv(self, plugin: ProjectPlugin) -> VirtualEnv:
+        dirs = self.project.dirs
+        return VirtualEnv(
+            dirs.venvs(plugin.type, plugin.plugin_dir_name, make_dirs=False),
+            python=plugin.python or self._project_python,
+        )
+
+    def _expected_fingerprint(self, plugin: ProjectPlugin) -> str:
+        pip_url = plugin.pip_url or ""
+        if "$" in pip_url:
+            env = PluginInstallService(self.project).plugin_installation_env(plugin)
+            pip_install_args = get_pip_install_args(self.project, plugin, env=env)
+        else:
+            pip_install_args = shlex.split(pip_url)
+        return fingerprint(pip_install_args, plugin.python or self._project_python)
+
+    def drift(self, plugin: ProjectPlugin) -> InstallDrift | None:
+        """Check whether a plugin needs to be installed.
+
+        Args:
+            plugin: The plugin.
+
+        Returns:
+            Why the plugin needs to be installed, or `None` if it is up to date.
+        """
+        if not plugin.is_installable():
+            return None
+
+        if not _installs_venv_only(plugin):
+            return InstallDrift.ALWAYS
+
+        venv = self._venv(plugin)
+        try:
+            installed_fingerprint = venv.plugin_fingerprint_path.read_text()
+        except OSError:
+            return InstallDrift.NOT_INSTALLED
+
+        if installed_fingerprint != self._expected_fingerprint(plugin):
+            return InstallDrift.REQUIREMENTS_CHANGED
+
+        entry = self._entries.get(plugin_key(plugin))
+        if entry is None or entry["fingerprint"] != installed_fingerprint:
+            return InstallDrift.NOT_RECORDED
+
+        if _stat_signature(venv.exec_path("python")) != entry["python_stat"]:
+            return InstallDrift.INTERPRETER_CHANGED
+
+        return None
+
+    def pending(self, plugins: Iterable[ProjectPlugin]) -> list[ProjectPlugin]:
+        """Get the plugins that need to be installed.
+
+        Args:
+            plugins: The plugins to check.
+
+        Returns:
+            The plugins that are not up to date.
+        """
+        return [plugin for plugin in plugins if self.drift(plugin) is not None]
+
+    def record(self, plugins: Iterable[ProjectPlugin]) -> None:
+        """Record the current installation of plugins.
+
+        Plugins whose virtual environment does not match their requirements are
+        forgotten.
+
+        Args:
+            plugins: The plugins that were installed.
+        """
+        for plugin in plugins:
+            key = plugin_key(plugin)
+            if not plugin.is_installable() or not _installs_venv_only(plugin):
+                continue
+
+            venv = self._venv(plugin)
+            expected_fingerprint = self._expected_fingerprint(plugin)
+            try:
+                installed_fingerprint = venv.plugin_fingerprint_path.read_text()
+            except OSError:
+                installed_fingerprint = None
+            python_stat = _stat_signature(venv.exec_path("python"))
+
+            if installed_fingerprint != expected_fingerprint or python_stat is None:
+                self._entries.pop(key, None)
+                continue
+
+            self._entries[key] = {
+                "fingerprint": expected_fingerprint,
+                "python_stat": python_stat,
+            }
+
+    def save(self) -> None:
+        """Write the manifest to its file."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(
+                    {"version": INSTALL_MANIFEST_VERSION, "plugins": self._entries},
+                    tmp_file,
+                    indent=2,
+                    sort_keys=True,
+                )
+            os.replace(tmp_path, self.path)  # noqa: PTH105
+        except BaseException:
+            os.unlink(tmp_path)  # noqa: PTH108
+            raise
@@ -0,0 +1,198 @@
+"""Plan the order in which plugins are installed."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import typing as t
+from dataclasses import dataclass
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+
+INSTALL_DURATIONS_FILE_NAME = "plugin_install_durations.json"
+
+
+def plugin_key(plugin: ProjectPlugin) -> str:
+    """Identify the virtual environment of a plugin.
+
+    Args:
+        plugin: The plugin.
+
+    Returns:
+        A key shared by all plugins that use the same virtual environment.
+    """
+    return f"{plugin.type}/{plugin.plugin_dir_name}"
+
+
+def requirement_keys(pip_install_args: Sequence[str]) -> set[str]:
+    """Get keys identifying the requirements in `pip install` arguments.
+
+    Requirements on the same distribution share a key regardless of the version
+    they specify. Options are ignored, and other arguments (e.g. URLs and paths)
+    are their own key.
+
+    Args:
+        pip_install_args: Arguments for `pip install`.
+
+    Returns:
+        The requirement keys.
+    """
+    keys: set[str] = set()
+    for arg in pip_install_args:
+        if arg.startswith("-"):
+            continue
+        try:
+            keys.add(canonicalize_name(Requirement(arg).name))
+        except InvalidRequirement:
+            keys.add(arg)
+    return keys
+
+
+class InstallDurations:
+    """Durations of previous plugin installations, in seconds."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the `InstallDurations` instance.
+
+        Args:
+            path: The file the durations are stored in.
+        """
+        self.path = path
+        try:
+            self._durations: dict[str, float] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self._durations = {}
+
+    @classmethod
+    def for_project(cls, project: Project) -> InstallDurations:
+        """Get the install durations recorded for a project.
+
+        Args:
+            project: The Meltano project.
+
+        Returns:
+            The recorded install durations.
+        """
+        return cls(project.dirs.run(INSTALL_DURATIONS_FILE_NAME))
+
+    def get(self, plugin: ProjectPlugin) -> float | None:
+        """Get the duration of the last installation of a plugin.
+
+        Args:
+            plugin: The plugin.
+
+        Returns:
+            The duration, or `None` if the plugin was never installed.
+        """
+        return self._durations.get(plugin_key(plugin))
+
+    def record(self, plugin: ProjectPlugin, duration: float) -> None:
+        """Record the duration of an installation of a plugin.
+
+        Args:
+            plugin: The plugin.
+            duration: The duration of the installation, in seconds.
+        """
+        self._durations[plugin_key(plugin)] = round(duration, 3)
+
+    def save(self) -> None:
+        """Write the durations to their file."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(self._durations, tmp_file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)  # noqa: PTH105
+        except BaseException:
+            os.unlink(tmp_path)  # noqa: PTH108
+            raise
+
+
+@dataclass(frozen=True, slots=True)
+class InstallGroup:
+    """Plugins with overlapping requirements, to be installed one after another.
+
+    Installing them in sequence lets the first installation fill the package cache
+    for the others, rather than all of them downloading and building the same
+    packages at the same time.
+    """
+
+    plugins: tuple[ProjectPlugin, ...]
+    estimated_duration: float
+
+
+def plan_installs(
+    plugins: Sequence[ProjectPlugin],
+    requirements: Mapping[ProjectPlugin, Sequence[str]],
+    durations: InstallDurations,
+) -> list[InstallGroup]:
+    """Group and order plugins for installation.
+
+    Plugins whose requirements overlap are grouped together. The plugins of a
+    group, and the groups themselves, are ordered by estimated duration, longest
+    first, so that the longest installations start as early as possible.
+
+    Args:
+        plugins: The plugins to install.
+        requirements: The `pip install` arguments of each plugin. Plugins without
+            an entry are not grouped with others.
+        durations: The durations of previous installations.
+
+    Returns:
+        The install groups, in the order they should be started.
+    """
+    # Union-find over plugin indices, joined through shared requirement keys
+    parents = list(range(len(plugins)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owners: dict[str, int] = {}
+    for index, plugin in enumerate(plugins):
+        for key in requirement_keys(requirements.get(plugin, ())):
+            if key in owners:
+                parents[find(index)] = find(owners[key])
+            else:
+                owners[key] = index
+
+    recorded = [
+        duration
+        for plugin in plugins
+        if (duration := durations.get(plugin)) is not None
+    ]
+    default_duration = sum(recorded) / len(recorded) if recorded else 0.0
+
+    def estimate(plugin: ProjectPlugin) -> float:
+        duration = durations.get(plugin)
+        return default_duration if duration is None else duration
+
+    members: dict[int, list[ProjectPlugin]] = {}
+    for index, plugin in enumerate(plugins):
+        members.setdefault(find(index), []).append(plugin)
+
+    groups = []
+    for group_plugins in members.values():
+        group_plugins.sort(key=estimate, reverse=True)
+        groups.append(
+            InstallGroup(
+                plugins=tuple(group_plugins),
+                estimated_duration=sum(map(estimate, group_plugins)),
+            ),
+        )
+    groups.sort(key=lambda group: group.estimated_duration, reverse=True)
+    return groups
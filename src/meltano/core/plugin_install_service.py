@@ -9,6 +9,7 @@ import logging
 import os
 import shlex
 import sys
+import time
 import typing as t
 from dataclasses import dataclass
 from functools import cached_property
@@ -22,6 +23,7 @@ from meltano.core.error import (
     PluginInstallWarning,
 )
 from meltano.core.plugin.settings_service import PluginSettingsService
+from meltano.core.plugin_install_plan import InstallDurations, plan_installs
 from meltano.core.settings_service import FeatureFlags
 from meltano.core.utils import (
     EnvironmentVariableNotSetError,
@@ -29,7 +31,7 @@ from meltano.core.utils import (
     expand_env_vars,
     noop,
 )
-from meltano.core.venv_service import VirtualEnv, VirtualEnvService
+from meltano.core.venv_service import VenvStore, VirtualEnv, VirtualEnvService
 
 if sys.version_info >= (3, 11):
     from enum import StrEnum
@@ -75,6 +77,7 @@ class PluginInstallState:
     status: Status of plugin install.
     message: Formatted install state message.
     details: Extra details relating to install (including error details if failed).
+    duration: Seconds the plugin took to install, if it was installed.
     """
 
     plugin: ProjectPlugin
@@ -82,6 +85,7 @@ class PluginInstallState:
     status: PluginInstallStatus
     message: str | None = None
     details: str | None = None
+    duration: float | None = None
 
     @cached_property
     def successful(self) -> bool:
@@ -276,13 +280,81 @@ class PluginInstallService:
         for state in states:
             self.status_cb(state)
 
-        installing = [
-            self.install_plugin_async(plugin, reason) for plugin in new_plugins
-        ]
+        durations = InstallDurations.for_project(self.project)
+        groups = plan_installs(
+            new_plugins,
+            self._plan_requirements(new_plugins),
+            durations,
+        )
+        group_durations: list[float] = []
+
+        async def install_group(
+            group_plugins: Sequence[ProjectPlugin],
+        ) -> list[PluginInstallState]:
+            group_states = []
+            group_duration = 0.0
+            for plugin in group_plugins:
+                state = await self.install_plugin_async(plugin, reason)
+                if state.duration is not None:
+                    durations.record(plugin, state.duration)
+                    group_duration += state.duration
+                group_states.append(state)
+            group_durations.append(group_duration)
+            return group_states
+
+        start = time.monotonic()
+        installed = await asyncio.gather(
+            *(install_group(group.plugins) for group in groups),
+        )
+        elapsed = time.monotonic() - start
+
+        # Report the states in the order the plugins were given
+        installed_states = {
+            state.plugin: state for group_states in installed for state in group_states
+        }
+        states.extend(installed_states[plugin] for plugin in new_plugins)
+
+        if any(group_durations):
+            try:
+                durations.save()
+            except OSError:  # pragma: no cover
+                logger.debug("Could not record plugin install durations")
+            logger.log(
+                logging.DEBUG if reason is PluginInstallReason.AUTO else logging.INFO,
+                (
+                    "Installation took %.1fs: %.1fs of plugin installs, "
+                    "with a critical path of %.1fs"
+                ),
+                elapsed,
+                sum(group_durations),
+                max(group_durations),
+            )
+
+        if store := VenvStore.from_project(self.project):
+            store.collect_garbage()
 
-        states.extend(await asyncio.gather(*installing))
         return states
 
+    def _plan_requirements(
+        self,
+        plugins: Iterable[ProjectPlugin],
+    ) -> dict[ProjectPlugin, list[str]]:
+        requirements = {}
+        for plugin in plugins:
+            if not plugin.is_installable():
+                continue
+            try:
+                requirements[plugin] = get_pip_install_args(
+                    self.project,
+                    plugin,
+                    self.plugin_installation_env(plugin),
+                    if_missing=EnvVarMissingBehavior.raise_exception,
+                )
+            except EnvironmentVariableNotSetError:
+                # The plugin is installed on its own
+                continue
+        return requirements
+
     def install_plugin(
         self,
         plugin: ProjectPlugin,
@@ -321,6 +393,8 @@ class PluginInstallService:
         Returns:
             PluginInstallState state instance.
         """
+        # Time the install itself, not the wait for the semaphore
+        start = time.monotonic()
         env = self.plugin_installation_env(plugin)
 
         requires_install, message = self._requires_install(plugin, reason, env=env)
@@ -361,6 +435,7 @@ class PluginInstallService:
                     plugin=plugin,
                     reason=reason,
                     status=PluginInstallStatus.SUCCESS,
+                    duration=time.monotonic() - start,
                 )
                 self.status_cb(state)
                 return state
@@ -35,16 +35,19 @@ else:
     from typing_extensions import override
 
 if t.TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     from sqlalchemy.orm import Session
     from structlog.stdlib import BoundLogger
 
     from meltano.core.block.extract_load import ELBContext
+    from meltano.core.container.container_service import ContainerProcess
     from meltano.core.elt_context import ELTContext, PluginContext
     from meltano.core.logging.utils import SubprocessOutputWriter
     from meltano.core.plugin import PluginRef
     from meltano.core.plugin.command import Command
+    from meltano.core.plugin.dbt.worker import DbtWorkerPool
     from meltano.core.plugin.project_plugin import ProjectPlugin
     from meltano.core.project import Project
 
@@ -250,20 +253,32 @@ class PluginInvoker:
         Args:
             session: Database session.
         """
-        self.plugin_config = self.settings_service.as_dict(
-            extras=False,
-            session=session,
+        # Resolve all settings once, and derive each view of the config from them
+        config_metadata = self.settings_service.config_with_metadata(session=session)
+        plugin_config_metadata = {
+            name: metadata
+            for name, metadata in config_metadata.items()
+            if not metadata["setting"].is_extra
+        }
+        plugin_config_extras_metadata = {
+            name: metadata
+            for name, metadata in config_metadata.items()
+            if metadata["setting"].is_extra
+        }
+
+        self.plugin_config = self.settings_service.dict_from_metadata(
+            plugin_config_metadata,
         )
-        self.plugin_config_processed = self.settings_service.as_dict(
-            extras=False,
+        self.plugin_config_processed = self.settings_service.dict_from_metadata(
+            plugin_config_metadata,
             process=True,
-            session=session,
         )
-        self.plugin_config_extras = self.settings_service.as_dict(
-            extras=True,
-            session=session,
+        self.plugin_config_extras = self.settings_service.dict_from_metadata(
+            plugin_config_extras_metadata,
+        )
+        self.plugin_config_env = self.settings_service.env_from_metadata(
+            config_metadata,
         )
-        self.plugin_config_env = self.settings_service.as_env(session=session)
         async with self.plugin.trigger_hooks("configure", self, session):
             self.plugin_config_service.configure()
             self._prepared = True
@@ -562,6 +577,88 @@ class PluginInvoker:
 
         return info["State"]["ExitCode"]
 
+    async def invoke_container(
+        self,
+        plugin_command: str,
+        *args: t.Any,
+        attach_stdin: bool = False,
+        **kwargs: t.Any,
+    ) -> ContainerProcess:
+        """Start a containerized command with its standard streams attached.
+
+        Args:
+            plugin_command: Plugin command name.
+            args: Command line invocation arguments.
+            attach_stdin: Whether to attach the standard input of the container.
+            kwargs: Command line invocation keyword arguments.
+
+        Returns:
+            The running container.
+
+        Raises:
+            ValueError: If the command doesn't declare a container spec.
+        """
+        command_config = self.find_command(plugin_command)
+
+        if not command_config.container_spec:
+            raise ValueError("Command is missing a container spec")  # noqa: EM101, TRY003
+
+        spec = command_config.container_spec
+        service = ContainerService()
+
+        logger.debug("Starting containerized command", command=plugin_command)
+        async with self._invoke(*args, **kwargs) as (proc_args, _, proc_env):
+            plugin_name = self.plugin.name
+            random_id = uuid7()
+            name = f"meltano-{plugin_name}--{plugin_command}-{random_id}"
+
+            return await service.start_container(
+                spec,
+                name,
+                args=proc_args[1:],
+                env=proc_env,
+                attach_stdin=attach_stdin,
+            )
+
+    async def invoke_dbt_worker(
+        self,
+        workers: DbtWorkerPool,
+        *args: t.Any,
+        stdout: Sequence[SubprocessOutputWriter],
+        stderr: Sequence[SubprocessOutputWriter],
+        **kwargs: t.Any,
+    ) -> int | None:
+        """Invoke a command in a long-lived dbt worker.
+
+        Args:
+            workers: The dbt workers of the run.
+            args: Command line invocation arguments.
+            stdout: Destinations of the standard output.
+            stderr: Destinations of the standard error.
+            kwargs: Command line invocation keyword arguments.
+
+        Returns:
+            The exit code of the command, or `None` if the command cannot run in
+            a worker and must be invoked in a new process instead.
+        """
+        if not workers.supports(self, kwargs.get("command")):
+            workers.invalidate()
+            return None
+
+        async with self._invoke(*args, **kwargs) as (
+            popen_args,
+            popen_options,
+            popen_env,
+        ):
+            return await workers.invoke(
+                self,
+                popen_args,
+                popen_env,
+                cwd=popen_options.get("cwd"),
+                stdout=stdout,
+                stderr=stderr,
+            )
+
     async def dump(self, file_id: str) -> str:
         """Dump a plugin file by ID.
 
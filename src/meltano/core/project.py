@@ -42,6 +42,8 @@ else:
     from typing_extensions import override
 
 if t.TYPE_CHECKING:
+    from ruamel.yaml import CommentedMap
+
     from meltano.core._types import StrPath
     from meltano.core.meltano_file import MeltanoFile as MeltanoFileTypeHint
     from meltano.core.plugin.base import PluginRef
@@ -109,6 +111,8 @@ class Project:
             os.getenv(PROJECT_SYS_DIR_ROOT_ENV, self.root / ".meltano"),
         ).resolve()
         self.dotenv_file = dotenv_file
+        # The merged project files, and the `MeltanoFile` parsed from them
+        self._meltano_memo: tuple[CommentedMap, MeltanoFileTypeHint] | None = None
 
     def refresh(self, **kwargs: t.Any) -> None:
         """Refresh the project instance to reflect external changes.
@@ -309,7 +313,10 @@ class Project:
 
     @property
     def meltano(self) -> MeltanoFileTypeHint:
-        """A copy of the current meltano config.
+        """The current meltano config.
+
+        The parsed config is reused until one of the project files changes on
+        disk, or the project is updated through `meltano_update`.
 
         Raises:
             EmptyMeltanoFileException: The `meltano.yml` file is empty.
@@ -321,7 +328,16 @@ class Project:
             raise EmptyMeltanoFileException
 
         with self._meltano_rw_lock.read_lock():
-            return MeltanoFile.parse(self.project_files.load())
+            loaded = self.project_files.load()
+            # `ProjectFiles.load` returns the same object for as long as none
+            # of the project files change, so the parsed result can be reused.
+            memo = self._meltano_memo
+            if memo is not None and memo[0] is loaded:
+                return memo[1]
+
+            meltano_file = MeltanoFile.parse(loaded)
+            self._meltano_memo = (loaded, meltano_file)
+            return meltano_file
 
     @contextmanager
     def meltano_update(self) -> Generator[MeltanoFileTypeHint]:
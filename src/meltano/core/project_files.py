@@ -12,6 +12,7 @@ import structlog
 from ruamel.yaml import CommentedMap, CommentedSeq, YAMLError
 
 from meltano.core import yaml
+from meltano.core.behavior.canonical import copy_tree
 from meltano.core.utils import deep_merge
 
 if t.TYPE_CHECKING:
@@ -75,6 +76,11 @@ class ProjectFiles:
         self._meltano_file_path = t.cast("InProjectPath", resolved_meltano_file_path)
         self._plugin_file_map: dict[tuple[str, ...], InProjectPath] = {}
         self._raw_contents_map: FilesContent = {}
+        # Copies of the file contents as loaded, which callers cannot mutate
+        self._pristine_contents: dict[
+            InProjectPath,
+            tuple[CommentedMap, CommentedMap],
+        ] = {}
         self._cached_loaded: CommentedMap | None = None
 
     @property
@@ -98,6 +104,7 @@ class ProjectFiles:
         self._raw_contents_map.clear()
         self._raw_contents_map[self._meltano_file_path] = self.meltano
         included_file_contents = self._load_included_files()
+        self._snapshot_contents()
 
         # If the exact same objects are loaded again, use the cached result:
         k = t.TypeVar("k")
@@ -116,6 +123,17 @@ class ProjectFiles:
 
         return self._cached_loaded
 
+    def _snapshot_contents(self) -> None:
+        """Keep a copy of the contents of every file that was (re)loaded.
+
+        The loaded contents are shared with the merged config returned by
+        `load`, so they may be mutated by the caller before `update` is called.
+        """
+        for path, contents in self._raw_contents_map.items():
+            pristine = self._pristine_contents.get(path)
+            if pristine is None or pristine[0] is not contents:
+                self._pristine_contents[path] = (contents, copy_tree(contents))
+
     def update(self, meltano_config: CommentedMap) -> CommentedMap:
         """Update config by overriding current config with new, changed config.
 
@@ -130,13 +148,32 @@ class ProjectFiles:
         """
         file_dicts = self._split_config_dict(meltano_config)
         for file_path, contents in file_dicts.items():
-            self._write_file(file_path, contents)
+            if not self._is_unchanged(file_path, contents):
+                self._write_file(file_path, contents)
 
         unused_files = [fl for fl in self.include_paths if fl not in file_dicts]
         for unused_file_path in unused_files:
-            self._write_file(unused_file_path, BLANK_SUBFILE)
+            if not self._is_unchanged(unused_file_path, BLANK_SUBFILE):
+                self._write_file(unused_file_path, BLANK_SUBFILE)
         return meltano_config
 
+    def _is_unchanged(self, file_path: InProjectPath, contents: Mapping) -> bool:
+        """Check whether a file already holds the given contents.
+
+        Only the files whose contents changed are written on update, so that
+        updating one plugin in a large multi-file project does not re-serialize
+        every included file.
+
+        Args:
+            file_path: The path to the file.
+            contents: The new contents of the file.
+
+        Returns:
+            Whether the contents match those last loaded from the file.
+        """
+        pristine = self._pristine_contents.get(file_path)
+        return pristine is not None and contents == pristine[1]
+
     def _validate_include_path(self, file_path: Path) -> InProjectPath:
         """Validate that a glob match is a real file within the project root.
 
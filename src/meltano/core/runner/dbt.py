@@ -2,18 +2,78 @@ from __future__ import annotations  # noqa: D100
 
 import asyncio
 import asyncio.subprocess
+import hashlib
 import sys
 import typing as t
 
+import structlog
+import yaml
+
 from meltano.core.logging import capture_subprocess_output
 from meltano.core.plugin import PluginType
 
 from . import Runner, RunnerError
 
 if t.TYPE_CHECKING:
+    from pathlib import Path
+
     from meltano.core.elt_context import ELTContext
     from meltano.core.plugin_invoker import PluginInvoker
 
+logger = structlog.stdlib.get_logger(__name__)
+
+DEPS_FINGERPRINT_FILE_NAME = "dbt_deps_fingerprint"
+DEPS_FILE_NAMES = ("packages.yml", "dependencies.yml", "package-lock.yml")
+
+
+def deps_fingerprint(project_dir: Path, pip_url: str | None) -> str:
+    """Compute a fingerprint of the dependencies of a dbt project.
+
+    Args:
+        project_dir: The dbt project directory.
+        pip_url: The `pip_url` of the dbt plugin, as packages may depend on the
+            dbt version.
+
+    Returns:
+        A hash of the dependency files of the project and the `pip_url`.
+    """
+    hasher = hashlib.sha256((pip_url or "").encode())
+    for file_name in DEPS_FILE_NAMES:
+        hasher.update(b"\0" + file_name.encode() + b"\0")
+        try:
+            hasher.update((project_dir / file_name).read_bytes())
+        except FileNotFoundError:
+            hasher.update(b"\0missing")
+    return hasher.hexdigest()
+
+
+def packages_install_path(project_dir: Path) -> Path | None:
+    """Get the directory dbt installs packages into.
+
+    Args:
+        project_dir: The dbt project directory.
+
+    Returns:
+        The packages directory, or `None` if it cannot be determined without
+        rendering `dbt_project.yml`.
+    """
+    try:
+        config = yaml.safe_load((project_dir / "dbt_project.yml").read_text())
+    except (OSError, yaml.YAMLError):
+        return None
+
+    if not isinstance(config, dict):
+        return None
+
+    path = (
+        config.get("packages-install-path")
+        or config.get("modules-path")
+        or "dbt_packages"
+    )
+    if not isinstance(path, str) or "{{" in path:
+        return None
+    return project_dir / path
+
 
 class DbtRunner(Runner):  # noqa: D101
     def __init__(self, elt_context: ELTContext):  # noqa: D107
@@ -60,12 +120,59 @@ class DbtRunner(Runner):  # noqa: D101
                 {PluginType.TRANSFORMERS: exitcode},
             )
 
+    def _deps_up_to_date(
+        self,
+        project_dir: Path,
+        fingerprint_path: Path,
+        fingerprint: str,
+    ) -> bool:
+        """Check whether the installed dbt packages match the project dependencies.
+
+        Args:
+            project_dir: The dbt project directory.
+            fingerprint_path: The file the fingerprint of the installed packages
+                is stored in.
+            fingerprint: The fingerprint of the current dependencies.
+
+        Returns:
+            Whether `dbt clean` and `dbt deps` can be skipped.
+        """
+        if self.context.force_dbt_deps:
+            return False
+
+        try:
+            if fingerprint_path.read_text() != fingerprint:
+                return False
+        except FileNotFoundError:
+            return False
+
+        if not any((project_dir / name).exists() for name in DEPS_FILE_NAMES[:2]):
+            # There are no packages to install
+            return True
+
+        install_path = packages_install_path(project_dir)
+        return install_path is not None and install_path.is_dir()
+
     async def run(self, log=None) -> None:  # noqa: ANN001, D102
         dbt = self.context.transformer_invoker()
 
         async with dbt.prepared(self.context.session):
-            await self.invoke(dbt, log=log, command="clean")
-            await self.invoke(dbt, log=log, command="deps")
+            project_dir = self.project.root / dbt.plugin_config["project_dir"]
+            fingerprint = deps_fingerprint(project_dir, dbt.plugin.pip_url)
+            fingerprint_path = (
+                dbt.plugin_config_service.run_dir / DEPS_FINGERPRINT_FILE_NAME
+            )
+
+            if self._deps_up_to_date(project_dir, fingerprint_path, fingerprint):
+                logger.info(
+                    "dbt dependencies are unchanged, skipping `dbt clean` and "
+                    "`dbt deps`. Use `--force-dbt-deps` to run them anyway.",
+                )
+            else:
+                fingerprint_path.unlink(missing_ok=True)
+                await self.invoke(dbt, log=log, command="clean")
+                await self.invoke(dbt, log=log, command="deps")
+                fingerprint_path.write_text(fingerprint)
 
             cmd = "compile" if self.context.dry_run else "run"
             await self.invoke(dbt, log=log, command=cmd)
@@ -8,7 +8,7 @@ import typing as t
 
 import structlog
 
-from meltano.core.logging import capture_subprocess_output
+from meltano.core.logging import OutputStats, capture_subprocess_output
 from meltano.core.plugin import PluginType
 from meltano.core.runner import Runner, RunnerError
 from meltano.core.utils import human_size
@@ -53,9 +53,16 @@ class SingerRunner(Runner):  # noqa: D101
         # which cannot be set directly:
         # https://github.com/python/cpython/blob/v3.12.7/Lib/asyncio/streams.py#L423-L424
         # https://github.com/python/cpython/blob/v3.12.7/Lib/asyncio/streams.py#L510
-        stream_buffer_size = self.context.project.settings.get("elt.buffer_size")
+        settings = self.context.project.settings
+        stream_buffer_size = settings.get("elt.buffer_size")
         line_length_limit = stream_buffer_size // 2
 
+        # Longer messages are read in parts, up to half the maximum buffer size
+        max_buffer_size = settings.get("elt.max_buffer_size")
+        max_line_length = (
+            max_buffer_size // 2 if max_buffer_size > stream_buffer_size else None
+        )
+
         # Start tap
         try:
             p_tap = await tap.invoke_async(
@@ -82,12 +89,22 @@ class SingerRunner(Runner):  # noqa: D101
         if extractor_out:
             tap_outputs.insert(0, extractor_out)
 
+        tap_stdout_stats = OutputStats()
         tap_stdout_future = asyncio.ensure_future(
             # forward subproc stdout to tap_outputs (i.e. targets stdin)
-            capture_subprocess_output(p_tap.stdout, *tap_outputs),
+            capture_subprocess_output(
+                p_tap.stdout,
+                *tap_outputs,
+                max_line_length=max_line_length,
+                stats=tap_stdout_stats,
+            ),
         )
         tap_stderr_future = asyncio.ensure_future(
-            capture_subprocess_output(p_tap.stderr, extractor_log),
+            capture_subprocess_output(
+                p_tap.stderr,
+                extractor_log,
+                max_line_length=max_line_length,
+            ),
         )
 
         # Process target output
@@ -99,10 +116,18 @@ class SingerRunner(Runner):  # noqa: D101
             target_outputs.insert(0, loader_out)
 
         target_stdout_future = asyncio.ensure_future(
-            capture_subprocess_output(p_target.stdout, *target_outputs),
+            capture_subprocess_output(
+                p_target.stdout,
+                *target_outputs,
+                max_line_length=max_line_length,
+            ),
         )
         target_stderr_future = asyncio.ensure_future(
-            capture_subprocess_output(p_target.stderr, loader_log),
+            capture_subprocess_output(
+                p_target.stderr,
+                loader_log,
+                max_line_length=max_line_length,
+            ),
         )
 
         # Wait for tap or target to complete, or for one of the output handlers
@@ -142,8 +167,11 @@ class SingerRunner(Runner):  # noqa: D101
                 if tap_stdout_future in output_futures_failed:
                     self._handle_tap_line_length_limit_error(
                         tap_stdout_future.exception(),
-                        line_length_limit=line_length_limit,
-                        stream_buffer_size=stream_buffer_size,
+                        line_length_limit=max_line_length or line_length_limit,
+                        stream_buffer_size=max(stream_buffer_size, max_buffer_size),
+                        setting="elt.max_buffer_size"
+                        if max_line_length
+                        else "elt.buffer_size",
                     )
 
                 failed_future = output_futures_failed.pop()
@@ -196,6 +224,15 @@ class SingerRunner(Runner):  # noqa: D101
             # Wait for target to complete
             target_code = await target_process_future
 
+        logger.info(
+            "Extractor output stream completed",
+            messages=tap_stdout_stats.lines,
+            total_bytes=tap_stdout_stats.total_bytes,
+            largest_message_bytes=tap_stdout_stats.largest_line,
+            oversized_messages=tap_stdout_stats.oversized_lines,
+            buffer_size=stream_buffer_size,
+        )
+
         if tap_code and target_code:
             raise RunnerError(  # noqa: TRY003
                 "Extractor and loader failed",  # noqa: EM101
@@ -248,6 +285,7 @@ class SingerRunner(Runner):  # noqa: D101
         exception,  # noqa: ANN001
         line_length_limit,  # noqa: ANN001
         stream_buffer_size,  # noqa: ANN001
+        setting="elt.buffer_size",  # noqa: ANN001
     ) -> None:
         # StreamReader.readline can raise a ValueError wrapping a LimitOverrunError:
         # https://github.com/python/cpython/blob/v3.12.7/Lib/asyncio/streams.py#L577
@@ -258,18 +296,21 @@ class SingerRunner(Runner):  # noqa: D101
         if not isinstance(exception, asyncio.LimitOverrunError):  # pragma: no cover
             return
 
+        size_name = (
+            "maximum buffer size" if setting == "elt.max_buffer_size" else "buffer size"
+        )
         logger.error(
             f"The extractor generated a message exceeding the message size "  # noqa: G004
-            f"limit of {human_size(line_length_limit)} (half the buffer size "
+            f"limit of {human_size(line_length_limit)} (half the {size_name} "
             f"of {human_size(stream_buffer_size)}).",
         )
         logger.error(
-            "To let this message be processed, increase the 'elt.buffer_size' "
+            f"To let this message be processed, increase the '{setting}' "  # noqa: G004
             "setting to at least double the size of the largest expected "
             "message, and try again.",
         )
         logger.error(
-            "To learn more, visit "
-            "https://docs.meltano.com/reference/settings#eltbuffer_size",
+            "To learn more, visit "  # noqa: G004
+            f"https://docs.meltano.com/reference/settings#{setting.replace('.', '')}",
         )
         raise RunnerError("Output line length limit exceeded") from exception  # noqa: EM101, TRY003
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import enum
 import os
 import sys
@@ -28,7 +29,7 @@ else:
     from typing_extensions import override
 
 if t.TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
 
     from meltano.core.project import Project
     from meltano.core.setting_definition import EnvVar, SettingDefinition
@@ -82,6 +83,26 @@ class FeatureNotAllowedException(Exception):
         return f"{self.feature} not enabled."
 
 
+class _SettingDefinitionsIndex:
+    """Lookups over a list of setting definitions."""
+
+    def __init__(self, setting_defs: list[SettingDefinition]) -> None:
+        self.setting_defs = setting_defs
+        self.by_name: dict[str, SettingDefinition] = {}
+        self.extras: list[SettingDefinition] = []
+        self.non_extras: list[SettingDefinition] = []
+        for setting_def in setting_defs:
+            # The first definition with a matching name or alias wins
+            self.by_name.setdefault(setting_def.name, setting_def)
+            for alias in setting_def.aliases:
+                self.by_name.setdefault(alias, setting_def)
+
+            if setting_def.is_extra:
+                self.extras.append(setting_def)
+            else:
+                self.non_extras.append(setting_def)
+
+
 class SettingsService(ABC):
     """Abstract base class for managing settings."""
 
@@ -108,6 +129,7 @@ class SettingsService(ABC):
         self.env_override: dict[str, str] = env_override or {}
         self.config_override = config_override or {}
         self._setting_defs: list[SettingDefinition] | None = None
+        self._setting_defs_index: _SettingDefinitionsIndex | None = None
 
     @property
     @abstractmethod
@@ -208,23 +230,52 @@ class SettingsService(ABC):
         else:
             source_manager = source.manager(self, bulk=True, **kwargs)
 
-        config = {}
-        for setting_def in self.definitions(extras=extras):
-            if prefix and not setting_def.name.startswith(prefix):
-                continue
+        setting_defs = [
+            setting_def
+            for setting_def in self.definitions(extras=extras)
+            if not prefix or setting_def.name.startswith(prefix)
+        ]
+
+        # Extras are expanded with the environment of the regular settings, so
+        # resolve those first and only build their environment once
+        resolved: dict[str, dict[str, t.Any]] = {}
+        extras_env: dict[str, str] | None = None
+        for setting_def in sorted(setting_defs, key=lambda d: d.is_extra):
+            if setting_def.is_extra and extras_env is None:
+                if (
+                    extras is None
+                    and not prefix
+                    and kwargs.get("expand_env_vars", True)
+                ):
+                    extras_env = self.env_from_metadata(
+                        {
+                            name: metadata
+                            for name, metadata in resolved.items()
+                            if not metadata["setting"].is_extra
+                        },
+                    )
+                else:
+                    extras_env = self.as_env(
+                        extras=False,
+                        redacted=kwargs.get("redacted", False),
+                        source=source,
+                        source_manager=source_manager,
+                    )
 
             value, metadata = self.get_with_metadata(
                 setting_def.name,
                 setting_def=setting_def,
                 source=source,
                 source_manager=source_manager,
+                extras_env=extras_env,
                 **kwargs,
             )
+            resolved[setting_def.name] = {**metadata, "value": value}
 
-            config[setting_def.name[len(prefix) :] if prefix else setting_def.name] = {
-                **metadata,
-                "value": value,
-            }
+        config = {}
+        for setting_def in setting_defs:
+            key = setting_def.name[len(prefix) :] if prefix else setting_def.name
+            config[key] = resolved[setting_def.name]
 
         return config
 
@@ -244,20 +295,37 @@ class SettingsService(ABC):
         Returns:
             dict of name-value settings pairs
         """
-        config_metadata = self.config_with_metadata(*args, **kwargs)
+        return self.dict_from_metadata(
+            self.config_with_metadata(*args, **kwargs),
+            process=process,
+        )
 
+    def dict_from_metadata(
+        self,
+        config_metadata: Mapping[str, dict[str, t.Any]],
+        *,
+        process: bool = False,
+    ) -> dict[str, t.Any]:
+        """Return settings resolved by `config_with_metadata` without metadata.
+
+        Args:
+            config_metadata: The result of `config_with_metadata`.
+            process: Whether to process the config. Values are copied first, so
+                the processed config does not share objects with `config_metadata`.
+
+        Returns:
+            dict of name-value settings pairs
+        """
         if process:
             config = {
-                key: metadata["setting"].post_process_value(metadata["value"])
+                key: metadata["setting"].post_process_value(
+                    copy.deepcopy(metadata["value"]),
+                )
                 for key, metadata in config_metadata.items()
             }
-            config = self.process_config(config)
-        else:
-            config = {
-                key: metadata["value"] for key, metadata in config_metadata.items()
-            }
+            return self.process_config(config)
 
-        return config
+        return {key: metadata["value"] for key, metadata in config_metadata.items()}
 
     def as_env(self, *args: t.Any, **kwargs: t.Any) -> dict[str, str]:
         """Return settings as an dictionary of environment variables.
@@ -266,11 +334,25 @@ class SettingsService(ABC):
             *args: args to pass to config_with_metadata
             **kwargs: additional kwargs to pass to config_with_metadata
 
+        Returns:
+            settings as environment variables
+        """
+        return self.env_from_metadata(self.config_with_metadata(*args, **kwargs))
+
+    def env_from_metadata(
+        self,
+        config_metadata: Mapping[str, dict[str, t.Any]],
+    ) -> dict[str, str]:
+        """Return settings resolved by `config_with_metadata` as environment variables.
+
+        Args:
+            config_metadata: The result of `config_with_metadata`.
+
         Returns:
             settings as environment variables
         """
         env = {}
-        for config in self.config_with_metadata(*args, **kwargs).values():
+        for config in config_metadata.values():
             value = config["value"]
             if value is None:
                 continue
@@ -296,6 +378,7 @@ class SettingsService(ABC):
         setting_def: SettingDefinition | None = None,
         expand_env_vars: bool = True,
         redacted_value: str = REDACTED_VALUE,
+        extras_env: Mapping[str, str] | None = None,
         **kwargs: t.Any,
     ) -> tuple[t.Any, dict[str, t.Any]]:
         """Get a setting with associated metadata.
@@ -308,6 +391,8 @@ class SettingsService(ABC):
             setting_def: get this `SettingDefinition` instead of name
             expand_env_vars: Whether to expand nested environment variables
             redacted_value: the value to use when redacting the setting
+            extras_env: The environment of the regular settings, used to expand
+                extras. Resolved from the settings if not provided.
             **kwargs: additional keyword args to pass during
                 `SettingsStoreManager` instantiation
 
@@ -332,7 +417,9 @@ class SettingsService(ABC):
                     redacted=redacted,
                     source=source,
                     source_manager=source_manager,
-                ),
+                )
+                if extras_env is None
+                else extras_env,
             )
 
         manager = source_manager or source.manager(self, **kwargs)
@@ -583,6 +670,14 @@ class SettingsService(ABC):
         Returns:
             list of setting definitions
         """
+        index = self._definitions_index()
+        if extras is True:
+            return index.extras
+        if extras is False:
+            return index.non_extras
+        return index.setting_defs
+
+    def _definitions_index(self) -> _SettingDefinitionsIndex:
         if self._setting_defs is None:
             self._setting_defs = [
                 setting
@@ -590,15 +685,13 @@ class SettingsService(ABC):
                 if not setting.hidden or self.show_hidden
             ]
 
-        if extras is not None:
-            return [
-                setting
-                for setting in self._setting_defs
-                if (extras is True and setting.is_extra)
-                or (extras is False and not setting.is_extra)
-            ]
-
-        return self._setting_defs
+        # `_setting_defs` is reset when custom settings may have been added, so
+        # the index is rebuilt whenever it no longer matches
+        index = self._setting_defs_index
+        if index is None or index.setting_defs is not self._setting_defs:
+            index = _SettingDefinitionsIndex(self._setting_defs)
+            self._setting_defs_index = index
+        return index
 
     def find_setting(self, name: str) -> SettingDefinition | None:
         """Find a setting by name.
@@ -613,14 +706,7 @@ class SettingsService(ABC):
             SettingMissingError: if the setting is not found
 
         """
-        return next(
-            (
-                setting
-                for setting in self.definitions()
-                if setting.name == name or name in setting.aliases
-            ),
-            None,
-        )
+        return self._definitions_index().by_name.get(name)
 
     # TODO: The `for_writing` parameter is unused, but referenced elsewhere.
     # Callers should be updated to not use it, and then it should be removed.
@@ -107,7 +107,7 @@ class PluginsTrackingContext(SelfDescribingJson):
         if isinstance(blk, BlockSet):
             plugins: list[tuple[ProjectPlugin, str]] = [
                 (plugin_block.context.plugin, plugin_block.plugin_args)
-                for plugin_block in blk.blocks
+                for plugin_block in blk.plugin_blocks
             ]
 
             return cls(plugins)
@@ -136,7 +136,7 @@ class PluginsTrackingContext(SelfDescribingJson):
             if isinstance(blk, BlockSet):
                 plugins.extend(
                     (plugin_block.context.plugin, plugin_block.plugin_args)
-                    for plugin_block in blk.blocks
+                    for plugin_block in blk.plugin_blocks
                 )
             elif isinstance(blk, PluginCommandBlock):
                 plugins.append((blk.context.plugin, blk.command))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import sys
 import typing as t
@@ -19,6 +20,8 @@ else:
 
 
 if t.TYPE_CHECKING:
+    from collections import abc
+
     from sqlalchemy.orm.session import Session
 
     from meltano.core.plugin_invoker import PluginInvoker
@@ -146,3 +149,39 @@ class ValidationsRunner(ABC):
             name: Test name.
         """
         raise NotImplementedError
+
+
+async def run_validations(
+    session: Session,
+    runners: abc.Iterable[ValidationsRunner],
+    *,
+    parallelism: int = 1,
+) -> dict[str, dict[str, int]]:
+    """Run the selected validations of several plugins.
+
+    Args:
+        session: A SQLAlchemy ORM session.
+        runners: Validation runners to run.
+        parallelism: Maximum number of plugins whose tests run concurrently. A
+            value lower than 1 means no limit. Tests of a single plugin always run
+            one after another.
+
+    Returns:
+        A mapping of plugin names to mappings of validator names to exit codes,
+        in the order the runners were given.
+    """
+    runners = list(runners)
+    if parallelism == 1:
+        return {runner.plugin_name: await runner.run_all(session) for runner in runners}
+
+    semaphore = asyncio.Semaphore(parallelism if parallelism >= 1 else sys.maxsize)
+
+    async def run(runner: ValidationsRunner) -> dict[str, int]:
+        async with semaphore:
+            return await runner.run_all(session)
+
+    results = await asyncio.gather(*(run(runner) for runner in runners))
+    return {
+        runner.plugin_name: result
+        for runner, result in zip(runners, results, strict=True)
+    }
@@ -6,25 +6,31 @@ import abc
 import asyncio
 import hashlib
 import json
+import os
 import platform
 import shlex
 import shutil
 import subprocess  # ruff:ignore[suspicious-subprocess-import]
 import sys
+import tempfile
 import typing as t
+import uuid
+import weakref
 from asyncio.subprocess import Process
 from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
 from dataclasses import KW_ONLY, dataclass
 from functools import cache, cached_property
+from pathlib import Path
 
+import fasteners
+import platformdirs
 import structlog
 
 from meltano.core.error import AsyncSubprocessError
 
 if t.TYPE_CHECKING:
-    import os
-    from collections.abc import Iterable, Sequence
-    from pathlib import Path
+    from collections.abc import AsyncGenerator, Iterable, Sequence
 
     from meltano.core.plugin.project_plugin import ProjectPlugin
     from meltano.core.project import Project
@@ -85,6 +91,178 @@ def find_uv() -> str:
     return find_uv_bin()
 
 
+PROBE_CACHE_FILE_NAME = "probe_cache.json"
+PROBE_CACHE_VERSION = 1
+
+
+class InterpreterInfo(t.NamedTuple):
+    """The version and ABI of a Python interpreter."""
+
+    version: tuple[int, int, int]
+    abiflags: str
+
+
+def _stat_key(path: str) -> list[int] | None:
+    try:
+        stat = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class ProbeCache:
+    """Persistent cache of Python interpreter and virtual environment probes.
+
+    Interpreters are keyed by their resolved path, and their entries are only used
+    while the modification time and size of the executable are unchanged. The
+    layout of a virtual environment is keyed by its root directory and the
+    interpreter it was created for, and is only used while its site-packages
+    directory exists.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the `ProbeCache` instance.
+
+        Args:
+            path: The file the probe results are stored in.
+        """
+        self.path = path
+        self._interpreters: dict[str, dict[str, t.Any]] = {}
+        self._venvs: dict[str, dict[str, str]] = {}
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") == PROBE_CACHE_VERSION:
+            self._interpreters = data.get("interpreters", {})
+            self._venvs = data.get("venvs", {})
+
+    def interpreter(self, python: str) -> InterpreterInfo:
+        """Get the version and ABI of a Python interpreter.
+
+        Args:
+            python: The path to the Python executable, or name to find on the $PATH.
+
+        Returns:
+            The interpreter info, probed by running the interpreter if it is not
+            cached or the executable changed.
+        """
+        executable = shutil.which(python)
+        resolved = os.path.realpath(executable) if executable else None
+        stat_key = _stat_key(resolved) if resolved else None
+
+        entry = self._interpreters.get(resolved) if resolved else None
+        if entry and entry["stat"] == stat_key:
+            major, minor, micro = entry["version"]
+            return InterpreterInfo((major, minor, micro), entry["abiflags"])
+
+        info = _probe_interpreter(python)
+        if resolved and stat_key:
+            self._interpreters[resolved] = {
+                "stat": stat_key,
+                "version": list(info.version),
+                "abiflags": info.abiflags,
+            }
+            self.save()
+        return info
+
+    def site_packages_dir(self, root: Path, python: str) -> Path | None:
+        """Get the cached site-packages directory of a virtual environment.
+
+        Args:
+            root: The root directory of the virtual environment.
+            python: The Python interpreter of the virtual environment.
+
+        Returns:
+            The site-packages directory, or `None` if it is not cached or no longer
+            exists.
+        """
+        entry = self._venvs.get(str(root))
+        if not entry or entry["python"] != python:
+            return None
+        site_packages_dir = Path(entry["site_packages_dir"])
+        return site_packages_dir if site_packages_dir.is_dir() else None
+
+    def set_site_packages_dir(
+        self,
+        root: Path,
+        python: str,
+        site_packages_dir: Path,
+    ) -> None:
+        """Cache the site-packages directory of a virtual environment.
+
+        Args:
+            root: The root directory of the virtual environment.
+            python: The Python interpreter of the virtual environment.
+            site_packages_dir: The site-packages directory.
+        """
+        self._venvs[str(root)] = {
+            "python": python,
+            "site_packages_dir": str(site_packages_dir),
+        }
+        self.save()
+
+    def save(self) -> None:
+        """Write the probe results to their file.
+
+        Virtual environments that no longer exist are forgotten. Failing to write
+        the file is not an error, as the probes can always be run again.
+        """
+        self._venvs = {
+            root: entry
+            for root, entry in self._venvs.items()
+            if Path(entry["site_packages_dir"]).is_dir()
+        }
+        data = {
+            "version": PROBE_CACHE_VERSION,
+            "interpreters": self._interpreters,
+            "venvs": self._venvs,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent,
+                prefix=f".{self.path.name}.",
+                suffix=".tmp",
+            )
+        except OSError as err:
+            logger.debug("Could not write probe cache", path=self.path, err=err)
+            return
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(data, tmp_file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)  # noqa: PTH105
+        except OSError as err:
+            with suppress(OSError):
+                os.unlink(tmp_path)  # noqa: PTH108
+            logger.debug("Could not write probe cache", path=self.path, err=err)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_path)  # noqa: PTH108
+            raise
+
+
+@cache
+def get_probe_cache() -> ProbeCache:
+    """Get the probe cache shared by all projects of the current user.
+
+    Returns:
+        The probe cache stored in the user cache directory.
+    """
+    return ProbeCache(platformdirs.user_cache_path("meltano") / PROBE_CACHE_FILE_NAME)
+
+
+def _probe_interpreter(python: str) -> InterpreterInfo:
+    stdout = subprocess.run(
+        (python, "-c", "import sys; print(*sys.version_info[:3], sys.abiflags)"),
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout.split()
+    major, minor, micro = (int(x) for x in stdout[:3])
+    abiflags = stdout[3].decode() if len(stdout) > 3 else ""
+    return InterpreterInfo((major, minor, micro), abiflags)
+
+
 class VirtualEnv:
     """Info about a single virtual environment."""
 
@@ -93,6 +271,7 @@ class VirtualEnv:
         root: Path,
         *,
         python: str | None = None,
+        probe_cache: ProbeCache | None = None,
     ):
         """Initialize the `VirtualEnv` instance.
 
@@ -100,6 +279,8 @@ class VirtualEnv:
             root: The root directory of the virtual environment.
             python: The path to the Python executable to use, or name to find on the
                 $PATH. Defaults to the Python executable running Meltano.
+            probe_cache: Where to cache interpreter and layout probes. Defaults to
+                the cache in the user cache directory.
 
         Raises:
             MeltanoError: The current system is not supported.
@@ -108,6 +289,7 @@ class VirtualEnv:
         self.root = root.resolve()
         self.python_path = python or sys.executable
         self.plugin_fingerprint_path = self.root / ".meltano_plugin_fingerprint"
+        self._probe_cache = probe_cache
 
     @cached_property
     def lib_dir(self) -> Path:
@@ -143,27 +325,47 @@ class VirtualEnv:
         if self._system == "Windows":
             return self.lib_dir / "site-packages"
 
-        return (
-            self.lib_dir
-            / f"python{'.'.join(str(x) for x in self.python_version_tuple[:2])}"
-            / "site-packages"
+        if self.python_path != sys.executable and (
+            cached := self.probe_cache.site_packages_dir(self.root, self.python_path)
+        ):
+            return cached
+
+        major, minor, _ = self.python_version_tuple
+        # Free-threaded builds use a separate site-packages directory
+        abi_thread = "t" if "t" in self._interpreter.abiflags else ""
+        site_packages_dir = (
+            self.lib_dir / f"python{major}.{minor}{abi_thread}" / "site-packages"
         )
+        if self.python_path != sys.executable and site_packages_dir.is_dir():
+            self.probe_cache.set_site_packages_dir(
+                self.root,
+                self.python_path,
+                site_packages_dir,
+            )
+        return site_packages_dir
+
+    @property
+    def probe_cache(self) -> ProbeCache:
+        """The cache of interpreter and layout probes."""
+        return self._probe_cache or get_probe_cache()
+
+    @cached_property
+    def _interpreter(self) -> InterpreterInfo:
+        if self.python_path == sys.executable:
+            return InterpreterInfo(
+                (
+                    sys.version_info.major,
+                    sys.version_info.minor,
+                    sys.version_info.micro,
+                ),
+                getattr(sys, "abiflags", ""),
+            )
+        return self.probe_cache.interpreter(self.python_path)
 
     @cached_property
     def python_version_tuple(self) -> tuple[int, int, int]:
         """The Python version tuple of the virtual environment."""
-        if self.python_path == sys.executable:
-            return sys.version_info[:3]
-
-        major, minor, micro = (
-            int(x)
-            for x in subprocess.run(
-                (self.python_path, "-c", "import sys; print(*sys.version_info[:3])"),
-                stdout=subprocess.PIPE,
-                check=True,
-            ).stdout.split()
-        )
-        return major, minor, micro
+        return self._interpreter.version
 
     def get_fingerprint(self, pip_install_args: Sequence[str]) -> str:
         """Compute the fingerprint of the virtual environment.
@@ -300,6 +502,174 @@ def fingerprint(pip_install_args: Iterable[str], interpreter: str | None = None)
     return hashlib.sha256(" ".join(components).encode()).hexdigest()
 
 
+# Serializes work on a store entry within this process. `fasteners` locks only
+# exclude other processes.
+_store_entry_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class VenvStore:
+    """A store of virtual environments shared between plugins and projects.
+
+    Each entry is a virtual environment keyed by the `fingerprint` of its
+    `pip install` arguments and Python interpreter, and is not modified once it has
+    been installed. The virtual environment path of a plugin is a symbolic link to
+    the entry that matches its requirements, so plugins (and projects) with the
+    same requirements share a single installation.
+
+    Each link to an entry is recorded as a reference. An entry that none of its
+    recorded links point to anymore is removed by `collect_garbage`.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the `VenvStore` instance.
+
+        Args:
+            root: The root directory of the store.
+        """
+        self.root = root.resolve()
+
+    @classmethod
+    def from_project(cls, project: Project) -> Self | None:
+        """Get the store configured for a project.
+
+        Args:
+            project: The Meltano project.
+
+        Returns:
+            The store set by the `venv.store_dir` setting, or `None` if the setting
+            is not set.
+        """
+        store_dir = project.settings.get("venv.store_dir")
+        if not store_dir:
+            return None
+        return cls(project.root / Path(store_dir).expanduser())
+
+    def entry_path(self, fingerprint: str) -> Path:
+        """Get the path of a store entry.
+
+        Args:
+            fingerprint: The fingerprint of the entry.
+
+        Returns:
+            The root directory of the virtual environment for the fingerprint.
+        """
+        return self.root / "venvs" / fingerprint
+
+    def _refs_dir(self, fingerprint: str) -> Path:
+        return self.root / "refs" / fingerprint
+
+    def _process_lock(self, fingerprint: str) -> fasteners.InterProcessLock:
+        return fasteners.InterProcessLock(self.root / "locks" / f"{fingerprint}.lock")
+
+    @asynccontextmanager
+    async def lock(self, fingerprint: str) -> AsyncGenerator[None, None]:
+        """Get exclusive access to a store entry.
+
+        Args:
+            fingerprint: The fingerprint of the entry.
+
+        Yields:
+            None, once no other process or task holds the entry.
+        """
+        key = str(self.entry_path(fingerprint))
+        entry_lock = _store_entry_locks.get(key)
+        if entry_lock is None:
+            entry_lock = _store_entry_locks[key] = asyncio.Lock()
+
+        async with entry_lock:
+            process_lock = self._process_lock(fingerprint)
+            await asyncio.to_thread(process_lock.acquire)
+            try:
+                yield
+            finally:
+                process_lock.release()
+
+    def link(self, fingerprint: str, link_path: Path) -> None:
+        """Point a plugin virtual environment path to a store entry.
+
+        Anything at the link path is replaced.
+
+        Args:
+            fingerprint: The fingerprint of the entry.
+            link_path: The virtual environment path of the plugin.
+        """
+        link_path = link_path.parent.resolve() / link_path.name
+        if link_path.is_dir() and not link_path.is_symlink():
+            shutil.rmtree(link_path)
+
+        link_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_link = link_path.with_name(f".{link_path.name}-{uuid.uuid4().hex}")
+        tmp_link.symlink_to(self.entry_path(fingerprint), target_is_directory=True)
+        os.replace(tmp_link, link_path)  # noqa: PTH105
+
+        ref_path = self._refs_dir(fingerprint).joinpath(
+            hashlib.sha256(str(link_path).encode()).hexdigest(),
+        )
+        ref_path.parent.mkdir(parents=True, exist_ok=True)
+        ref_path.write_text(str(link_path))
+
+    def references(self, fingerprint: str) -> list[Path]:
+        """Get the links that point to a store entry.
+
+        Recorded links that no longer point to the entry are forgotten.
+
+        Args:
+            fingerprint: The fingerprint of the entry.
+
+        Returns:
+            The paths linked to the entry.
+        """
+        refs_dir = self._refs_dir(fingerprint)
+        if not refs_dir.is_dir():
+            return []
+
+        entry_path = self.entry_path(fingerprint)
+        links = []
+        for ref_path in refs_dir.iterdir():
+            link_path = Path(ref_path.read_text())
+            if link_path.is_symlink() and link_path.resolve() == entry_path:
+                links.append(link_path)
+            else:
+                ref_path.unlink(missing_ok=True)
+        return links
+
+    def collect_garbage(self) -> list[str]:
+        """Remove the store entries that are not linked to anymore.
+
+        Entries held by another process, e.g. one installing them, are skipped.
+
+        Returns:
+            The fingerprints of the removed entries.
+        """
+        entries_dir = self.root / "venvs"
+        if not entries_dir.is_dir():
+            return []
+
+        removed = []
+        for entry_path in sorted(entries_dir.iterdir()):
+            fingerprint = entry_path.name
+            entry_lock = _store_entry_locks.get(str(entry_path))
+            if entry_lock is not None and entry_lock.locked():
+                continue
+            process_lock = self._process_lock(fingerprint)
+            if not process_lock.acquire(blocking=False):
+                continue
+            try:
+                if self.references(fingerprint):
+                    continue
+                logger.debug(
+                    "Removing unused shared virtual environment %s", fingerprint
+                )
+                shutil.rmtree(entry_path)
+                shutil.rmtree(self._refs_dir(fingerprint), ignore_errors=True)
+                removed.append(fingerprint)
+            finally:
+                process_lock.release()
+        return removed
+
+
 @dataclass(slots=True, frozen=True)
 class PackageManager(abc.ABC):
     """Standalone package manager tool, independent of any virtual environment."""
@@ -473,6 +843,7 @@ class VirtualEnvService:
         namespace: str = "",
         name: str = "",
         backend: VenvBackend,
+        store: VenvStore | None = None,
     ):
         """Initialize the `VenvService`.
 
@@ -483,11 +854,13 @@ class VirtualEnvService:
             namespace: The namespace for the venv, e.g. a Plugin type.
             name: The name of the venv, e.g. a Plugin name.
             backend: The virtualenv-managing backend to use.
+            store: The shared virtual environment store to install into, if any.
         """
         self.project = project
         self.namespace = namespace
         self.name = name
         self._backend = backend
+        self.store = store
 
     @classmethod
     def from_plugin(
@@ -517,6 +890,7 @@ class VirtualEnvService:
             namespace=plugin.type,
             name=plugin.plugin_dir_name,
             backend=backend_class.from_plugin(project, plugin),
+            store=VenvStore.from_project(project),
         )
 
     @property
@@ -647,6 +1021,22 @@ class VirtualEnvService:
             force: Whether to ignore the Python version required by plugins.
             env: Environment variables to pass to the subprocess.
         """
+        if self.store is not None:
+            await self._install_into_store(
+                self.store,
+                pip_install_args,
+                clean=clean,
+                force=force,
+                env=env,
+            )
+            return
+
+        venv_path = self.project.dirs.venvs(self.namespace, self.name, make_dirs=False)
+        if venv_path.is_symlink():
+            # Never install into an entry of a store that is no longer in use
+            venv_path.unlink()
+            self._backend.venv = VirtualEnv(venv_path, python=self.venv.python_path)
+
         if not clean and self.requires_clean_install(pip_install_args):
             logger.debug(
                 "Packages for '%s/%s' have changed so performing a clean install.",
@@ -665,6 +1055,55 @@ class VirtualEnvService:
         )
         self.venv.write_fingerprint(pip_install_args)
 
+    async def _install_into_store(
+        self,
+        store: VenvStore,
+        pip_install_args: Sequence[str],
+        *,
+        clean: bool,
+        force: bool,
+        env: dict[str, str | None] | None,
+    ) -> None:
+        python = self.venv.python_path
+        venv_fingerprint = fingerprint(pip_install_args, python)
+        entry = VirtualEnv(store.entry_path(venv_fingerprint), python=python)
+        self._backend.venv = entry
+
+        async with store.lock(venv_fingerprint):
+            # Other plugins and projects may be linked to, or running from, an
+            # intact entry, so a clean install does not rebuild it
+            if entry.requires_install(pip_install_args):
+                logger.debug(
+                    "Installing shared virtual environment %s for '%s/%s'",
+                    venv_fingerprint,
+                    self.namespace,
+                    self.name,
+                )
+                await self.pip_install(
+                    pip_install_args=pip_install_args,
+                    clean=True,
+                    env=env,
+                    force=force,
+                )
+                entry.write_fingerprint(pip_install_args)
+            else:
+                logger.debug(
+                    "Reusing shared virtual environment %s for '%s/%s'%s",
+                    venv_fingerprint,
+                    self.namespace,
+                    self.name,
+                    " (store entries are not reinstalled by a clean install)"
+                    if clean
+                    else "",
+                )
+
+            store.link(
+                venv_fingerprint,
+                self.project.dirs.venvs(self.namespace, self.name, make_dirs=False),
+            )
+
+        self.clean_run_files()
+
 
 @dataclass
 class VenvBackend(abc.ABC):
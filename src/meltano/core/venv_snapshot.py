@@ -0,0 +1,320 @@
+"""Export and import snapshots of installed plugin virtual environments."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tarfile
+import typing as t
+import uuid
+
+import structlog
+
+from meltano.core.error import MeltanoError
+from meltano.core.plugin import PluginType
+from meltano.core.plugin_install_service import (
+    PluginInstallService,
+    get_pip_install_args,
+)
+from meltano.core.venv_service import VenvStore, VirtualEnv, fingerprint
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+
+logger = structlog.stdlib.get_logger(__name__)
+
+SNAPSHOT_MANIFEST_NAME = "meltano-venv-snapshot.json"
+SNAPSHOT_VERSION = 1
+
+# Files larger than this in a venv `bin` directory are not scripts
+MAX_SCRIPT_SIZE = 1024 * 1024
+
+
+class VenvSnapshotError(MeltanoError):
+    """A virtual environment snapshot could not be read."""
+
+
+def _snapshot_plugins(plugins: Iterable[ProjectPlugin]) -> list[ProjectPlugin]:
+    """Get the plugins whose virtual environment can be part of a snapshot.
+
+    File bundles and plugins with their own installer (e.g. dbt packages) are
+    excluded because installing them also updates project files. Plugins that
+    inherit from another plugin share its virtual environment, so only the first
+    one is kept.
+    """
+    seen = set()
+    selected = []
+    for plugin in plugins:
+        key = (plugin.type, plugin.plugin_dir_name)
+        if (
+            plugin.type is PluginType.FILES
+            or hasattr(plugin, "installer")
+            or not plugin.pip_url
+            or key in seen
+        ):
+            continue
+        seen.add(key)
+        selected.append(plugin)
+    return selected
+
+
+def _venv_path(project: Project, plugin: ProjectPlugin) -> Path:
+    return project.dirs.venvs(plugin.type, plugin.plugin_dir_name, make_dirs=False)
+
+
+def _python(project: Project, plugin: ProjectPlugin) -> str | None:
+    return plugin.python or project.settings.get("python")
+
+
+def _pip_install_args(project: Project, plugin: ProjectPlugin) -> list[str]:
+    env = PluginInstallService(project).plugin_installation_env(plugin)
+    return get_pip_install_args(project, plugin, env=env)
+
+
+def relocate_scripts(venv: VirtualEnv, old_root: str) -> None:
+    """Point the scripts of a moved virtual environment to its new location.
+
+    Entry point scripts and activation scripts embed the absolute path of the
+    virtual environment, e.g. in their shebang.
+
+    Args:
+        venv: The virtual environment, at its new location.
+        old_root: The root directory the virtual environment was installed in.
+    """
+    old = old_root.encode()
+    new = str(venv.root).encode()
+    if old == new or not venv.bin_dir.is_dir():
+        return
+
+    for path in venv.bin_dir.iterdir():
+        if path.is_symlink() or not path.is_file():
+            continue
+        if path.stat().st_size > MAX_SCRIPT_SIZE:
+            continue
+        content = path.read_bytes()
+        if b"\0" in content[:1024] or old not in content:
+            continue
+        path.write_bytes(content.replace(old, new))
+
+
+def export_venv_snapshot(
+    project: Project,
+    plugins: Iterable[ProjectPlugin],
+    path: Path,
+) -> list[ProjectPlugin]:
+    """Write the virtual environments of installed plugins to an archive.
+
+    Only virtual environments that are up to date with the plugin `pip_url` and
+    Python interpreter are exported.
+
+    Args:
+        project: The Meltano project.
+        plugins: The plugins to export the virtual environments of.
+        path: The path of the archive to write.
+
+    Returns:
+        The plugins whose virtual environment was exported.
+    """
+    exported: list[ProjectPlugin] = []
+    venvs: list[dict[str, str]] = []
+
+    tmp_path = path.with_name(f".{path.name}-{uuid.uuid4().hex}")
+    try:
+        with tarfile.open(tmp_path, "w:gz") as archive:
+            for plugin in _snapshot_plugins(plugins):
+                pip_install_args = _pip_install_args(project, plugin)
+                venv = VirtualEnv(
+                    _venv_path(project, plugin),
+                    python=_python(project, plugin),
+                )
+                if venv.requires_install(pip_install_args):
+                    logger.warning(
+                        "Not exporting %s '%s': it is not installed or out of date",
+                        plugin.type.descriptor,
+                        plugin.name,
+                    )
+                    continue
+
+                # With a shared store, the plugin venv path links to a store
+                # entry, whose path is the one embedded in the scripts
+                root = venv.root.resolve()
+                arcname = f"venvs/{plugin.type}/{plugin.plugin_dir_name}"
+                archive.add(root, arcname=arcname)
+                venvs.append(
+                    {
+                        "namespace": str(plugin.type),
+                        "name": plugin.plugin_dir_name,
+                        "fingerprint": venv.get_fingerprint(pip_install_args),
+                        "root": str(root),
+                        "arcname": arcname,
+                    },
+                )
+                exported.append(plugin)
+
+            manifest_path = tmp_path.with_name(f"{tmp_path.name}.json")
+            manifest_path.write_text(
+                json.dumps({"version": SNAPSHOT_VERSION, "venvs": venvs}, indent=2),
+            )
+            try:
+                archive.add(manifest_path, arcname=SNAPSHOT_MANIFEST_NAME)
+            finally:
+                manifest_path.unlink()
+
+        os.replace(tmp_path, path)  # noqa: PTH105
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return exported
+
+
+def _read_manifest(archive: tarfile.TarFile, path: Path) -> list[dict[str, str]]:
+    try:
+        member = archive.extractfile(SNAPSHOT_MANIFEST_NAME)
+    except KeyError:
+        member = None
+    if member is None:
+        raise VenvSnapshotError(  # noqa: TRY003
+            f"'{path}' is not a virtual environment snapshot",  # noqa: EM102
+            "Create one with `meltano install --export-snapshot`",
+        )
+
+    try:
+        manifest = json.load(member)
+    except ValueError as err:
+        raise VenvSnapshotError(  # noqa: TRY003
+            f"Invalid virtual environment snapshot manifest in '{path}'",  # noqa: EM102
+            "Create a new one with `meltano install --export-snapshot`",
+        ) from err
+    if not isinstance(manifest, dict) or manifest.get("version") != SNAPSHOT_VERSION:
+        raise VenvSnapshotError(  # noqa: TRY003
+            f"Unsupported virtual environment snapshot version in '{path}'",  # noqa: EM102
+            "Create a new one with `meltano install --export-snapshot`",
+        )
+    try:
+        return manifest["venvs"]
+    except KeyError as err:
+        raise VenvSnapshotError(  # noqa: TRY003
+            f"Invalid virtual environment snapshot manifest in '{path}'",  # noqa: EM102
+            "Create a new one with `meltano install --export-snapshot`",
+        ) from err
+
+
+def _extract_venv(
+    archive: tarfile.TarFile,
+    arcname: str,
+    target: Path,
+) -> None:
+    """Extract a virtual environment from a snapshot, replacing `target`."""
+    prefix = f"{arcname}/"
+    members = [
+        member
+        for member in archive.getmembers()
+        if member.name == arcname or member.name.startswith(prefix)
+    ]
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = target.with_name(f".{target.name}-{uuid.uuid4().hex}")
+    try:
+        if hasattr(tarfile, "tar_filter"):
+            # Venvs contain symlinks to their base interpreter, which the stricter
+            # "data" filter rejects
+            archive.extractall(tmp_dir, members=members, filter="tar")
+        else:  # pragma: no cover
+            archive.extractall(tmp_dir, members=members)  # noqa: S202
+
+        if target.is_symlink() or target.is_file():
+            target.unlink()
+        elif target.is_dir():
+            shutil.rmtree(target)
+        os.replace(tmp_dir / arcname, target)  # noqa: PTH105
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+async def import_venv_snapshot(
+    project: Project,
+    plugins: Sequence[ProjectPlugin],
+    path: Path,
+) -> list[ProjectPlugin]:
+    """Restore the virtual environments of plugins from an archive.
+
+    A virtual environment is only restored if it was installed for the current
+    `pip_url` and Python interpreter of the plugin, and the restored virtual
+    environment is checked with `VirtualEnv.requires_install`. Plugins that
+    inherit from a restored plugin share its virtual environment.
+
+    Args:
+        project: The Meltano project.
+        plugins: The plugins to restore the virtual environments of.
+        path: The path of the archive.
+
+    Returns:
+        The plugins whose virtual environment was restored.
+
+    Raises:
+        VenvSnapshotError: The archive is not a virtual environment snapshot.
+    """
+    try:
+        archive = tarfile.open(path, "r:*")  # noqa: SIM115
+    except tarfile.TarError as err:
+        raise VenvSnapshotError(  # noqa: TRY003
+            f"'{path}' is not a virtual environment snapshot",  # noqa: EM102
+            "Create one with `meltano install --export-snapshot`",
+        ) from err
+
+    restored_venvs: set[tuple[str, str]] = set()
+    store = VenvStore.from_project(project)
+    with archive:
+        snapshot = {
+            (venv["namespace"], venv["name"]): venv
+            for venv in _read_manifest(archive, path)
+        }
+
+        for plugin in _snapshot_plugins(plugins):
+            entry = snapshot.get((str(plugin.type), plugin.plugin_dir_name))
+            if entry is None:
+                continue
+
+            pip_install_args = _pip_install_args(project, plugin)
+            python = _python(project, plugin)
+            venv_fingerprint = fingerprint(pip_install_args, python)
+            if entry["fingerprint"] != venv_fingerprint:
+                logger.debug(
+                    "Snapshot of %s '%s' is out of date",
+                    plugin.type.descriptor,
+                    plugin.name,
+                )
+                continue
+
+            link_path = _venv_path(project, plugin)
+            if store is None:
+                _extract_venv(archive, entry["arcname"], link_path)
+                relocate_scripts(VirtualEnv(link_path, python=python), entry["root"])
+            else:
+                async with store.lock(venv_fingerprint):
+                    venv = VirtualEnv(store.entry_path(venv_fingerprint), python=python)
+                    if venv.requires_install(pip_install_args):
+                        _extract_venv(archive, entry["arcname"], venv.root)
+                        relocate_scripts(venv, entry["root"])
+                    store.link(venv_fingerprint, link_path)
+
+            if VirtualEnv(link_path, python=python).requires_install(pip_install_args):
+                logger.warning(
+                    "Could not restore %s '%s' from snapshot",
+                    plugin.type.descriptor,
+                    plugin.name,
+                )
+                continue
+
+            restored_venvs.add((plugin.type, plugin.plugin_dir_name))
+
+    return [
+        plugin
+        for plugin in plugins
+        if (plugin.type, plugin.plugin_dir_name) in restored_venvs
+    ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 import typing as t
 import uuid
 from contextlib import suppress
@@ -45,21 +46,45 @@ yaml.representer.add_representer(Decimal, _represent_decimal)
 yaml.representer.add_representer(uuid.UUID, _represent_uuid)
 
 
+# Files modified less than this long before they were read may be modified again
+# without their mtime changing, on file systems with coarse timestamps. Their
+# stat signature is not trusted, and the content hash is checked instead.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
 @dataclass(slots=True)
 class CachedCommentedMap:
     """The hash of the raw bytes of a YAML file, and its parsed content."""
 
     sha256: str
     data: CommentedMap
+    stat_signature: tuple[int, int, int] | None = None
 
 
 cache: dict[os.PathLike[str], CachedCommentedMap] = {}
 
 
+def _stat_signature(stat: os.stat_result) -> tuple[int, int, int] | None:
+    """Get a signature of a file's stat that changes whenever the file is written.
+
+    Parameters:
+        stat: The stat result of the file.
+
+    Returns:
+        The `(mtime_ns, size, inode)` of the file, or `None` if the file was
+        modified too recently for the signature to be trusted.
+    """
+    if time.time_ns() - stat.st_mtime_ns < RACY_MTIME_WINDOW_NS:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
 def load(path: os.PathLike[str]) -> CommentedMap:
     """Load the specified YAML file with caching.
 
-    The cache is used if both the file path and its content hash match what is stored.
+    The cache is used if the file's modification time, size and inode match what
+    is stored, without reading the file. Otherwise, the cache is used if both
+    the file path and its content hash match what is stored.
 
     Parameters:
         path: The path to the YAML file.
@@ -68,16 +93,28 @@ def load(path: os.PathLike[str]) -> CommentedMap:
         The loaded YAML file.
     """
     path = Path(path).resolve()
+    cached = cache.get(path)
+    # Stat before reading, so that a concurrent write results in a stale
+    # signature, which only ever causes the content hash to be checked again.
+    signature = _stat_signature(path.stat())
+    if (
+        cached is not None
+        and signature is not None
+        and cached.stat_signature == signature
+    ):
+        return cached.data
+
     with path.open() as yaml_file:
         hashed = hash_sha256(yaml_file.read())
 
-        if path in cache and cache[path].sha256 == hashed:
-            return cache[path].data
+        if cached is not None and cached.sha256 == hashed:
+            cached.stat_signature = signature
+            return cached.data
 
         yaml_file.seek(0)
         parsed = yaml.load(yaml_file)
 
-    cache[path] = CachedCommentedMap(hashed, parsed)
+    cache[path] = CachedCommentedMap(hashed, parsed, signature)
     return parsed
 
 
@@ -0,0 +1,103 @@
+"""Benchmarks for parsing plugin log lines.
+
+Singer SDK plugins running at DEBUG level can write tens of thousands of
+structured log lines per second to stderr, each of which goes through the
+log parser before being handed to the structured logger.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+
+import pytest
+
+from meltano.core.logging.parsers import LogParserFactory
+
+if t.TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture
+
+
+def generate_sdk_log_lines(count: int = 1_000) -> list[str]:
+    """Generate realistic Singer SDK log lines with mixed levels."""
+    levels = ("debug", "debug", "debug", "info", "warning")
+    return [
+        json.dumps(
+            {
+                "level": levels[i % len(levels)],
+                "pid": 12345,
+                "logger_name": "tap_example.streams",
+                "ts": 1703097600.123456 + i,
+                "thread_name": "MainThread",
+                "app_name": "tap-example",
+                "stream_name": f"stream_{i % 10}",
+                "message": f"Processing record {i}",
+                "extra": {"record_count": i, "partition": {"id": i % 3}},
+            }
+        )
+        for i in range(count)
+    ]
+
+
+class TestLogParserBenchmarks:
+    """Benchmarks for `LogParserFactory` with the Singer SDK parser."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def factory(cls) -> LogParserFactory:
+        return LogParserFactory()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sdk_lines(cls) -> list[str]:
+        return generate_sdk_log_lines()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def plain_lines(cls) -> list[str]:
+        return [f"INFO Processing record {i}" for i in range(1_000)]
+
+    @pytest.mark.benchmark
+    def test_parse_sdk_lines(
+        self,
+        factory: LogParserFactory,
+        sdk_lines: list[str],
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark fully parsing structured Singer SDK log lines."""
+
+        def parse_all() -> None:
+            for line in sdk_lines:
+                factory.parse_line(line, "singer-sdk")
+
+        benchmark(parse_all)
+
+    @pytest.mark.benchmark
+    def test_parse_plain_lines(
+        self,
+        factory: LogParserFactory,
+        plain_lines: list[str],
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark unstructured lines falling back to the passthrough parser."""
+
+        def parse_all() -> None:
+            for line in plain_lines:
+                factory.parse_line(line, "singer-sdk")
+
+        benchmark(parse_all)
+
+    @pytest.mark.benchmark
+    def test_sniff_sdk_lines(
+        self,
+        factory: LogParserFactory,
+        sdk_lines: list[str],
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark reading the level of Singer SDK log lines without parsing."""
+
+        def sniff_all() -> None:
+            for line in sdk_lines:
+                factory.sniff_level(line, "singer-sdk")
+
+        benchmark(sniff_all)
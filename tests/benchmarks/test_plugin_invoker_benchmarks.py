@@ -0,0 +1,74 @@
+"""Benchmarks for preparing plugin invocations.
+
+Every block of `meltano run` and every `meltano invoke` prepares its plugin by
+resolving the plugin settings across all settings stores, and deriving the plain,
+processed, extras and environment views of its configuration. This cost grows
+with the number of settings of the plugin.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import pytest
+
+from meltano.core.plugin import PluginType
+
+if t.TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.plugin_invoker import PluginInvoker
+    from meltano.core.project_add_service import ProjectAddService
+
+NUM_SETTINGS = 200
+
+
+class TestPluginInvokerBenchmarks:
+    """Benchmarks for `PluginInvoker`."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def tap_many_settings(
+        cls,
+        project_add_service: ProjectAddService,
+    ) -> ProjectPlugin:
+        """Add a plugin with many settings, some of them referencing others."""
+        settings = [
+            {"name": f"setting_{i}", "kind": "string" if i % 2 else "integer"}
+            for i in range(NUM_SETTINGS)
+        ]
+        config = {
+            f"setting_{i}": f"value_{i}" if i % 2 else i
+            for i in range(0, NUM_SETTINGS, 3)
+        }
+        config["setting_1"] = "${TAP_MANY_SETTINGS_SETTING_3}"
+        return project_add_service.add(
+            PluginType.EXTRACTORS,
+            "tap-many-settings",
+            inherit_from="tap-mock",
+            settings=settings,
+            config=config,
+        )
+
+    @pytest.mark.benchmark
+    def test_prepare(
+        self,
+        session,
+        tap_many_settings: ProjectPlugin,
+        plugin_invoker_factory: t.Callable[[ProjectPlugin], PluginInvoker],
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark preparing and cleaning up a plugin with many settings."""
+        invoker = plugin_invoker_factory(tap_many_settings)
+
+        async def prepare() -> None:
+            async with invoker.prepared(session):
+                pass
+
+        benchmark.pedantic(
+            lambda: asyncio.run(prepare()),
+            rounds=10,
+            warmup_rounds=2,
+        )
@@ -0,0 +1,88 @@
+"""Benchmarks for reading and updating project files.
+
+Every command reads `meltano.yml` (and its included files) several times, and
+commands like `meltano config set` parse the whole project, update it, and write
+it back. These costs grow with the number of plugins and the size of their
+configuration.
+"""
+
+from __future__ import annotations
+
+import itertools
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from fixtures.utils import cd, tmp_project
+from meltano.core.meltano_file import MeltanoFile
+
+if t.TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture
+
+    from meltano.core.project import Project
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture(scope="class")
+def multifile_project(
+    compatible_copy_tree,
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    with (
+        cd(tmp_path_factory.mktemp("meltano-multifile-benchmark")),
+        tmp_project(
+            "multifile_benchmark",
+            FIXTURES_DIR / "multifile_project",
+            compatible_copy_tree,
+        ) as project,
+    ):
+        yield project
+
+
+@pytest.mark.parametrize(
+    "project_fixture",
+    ("large_config_project", "multifile_project"),
+)
+class TestProjectFileBenchmarks:
+    """Benchmarks for `ProjectFiles` and `MeltanoFile`."""
+
+    @pytest.fixture
+    def subject(self, request: pytest.FixtureRequest, project_fixture: str) -> Project:
+        return request.getfixturevalue(project_fixture)
+
+    @pytest.mark.benchmark
+    def test_load_unchanged(
+        self,
+        subject: Project,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark re-loading project files that did not change."""
+        subject.project_files.load()
+        benchmark(subject.project_files.load)
+
+    @pytest.mark.benchmark
+    def test_parse_meltano_file(
+        self,
+        subject: Project,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark parsing the merged project files into a `MeltanoFile`."""
+        loaded = subject.project_files.load()
+        benchmark(lambda: MeltanoFile(**loaded))
+
+    @pytest.mark.benchmark
+    def test_meltano_update(
+        self,
+        subject: Project,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Benchmark a `meltano config set`-style round trip of one value."""
+        counter = itertools.count()
+
+        def update() -> None:
+            with subject.meltano_update() as meltano:
+                meltano.extras["benchmark_counter"] = next(counter)
+
+        benchmark(update)
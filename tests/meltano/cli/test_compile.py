@@ -13,7 +13,10 @@ from unittest import mock
 import pytest
 
 from meltano.cli import cli
+from meltano.cli import compile as compile_module
 from meltano.core.manifest import manifest
+from meltano.core.manifest.cache import INPUTS_INDEX_FILE_NAME
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.settings_service import REDACTED_VALUE, SettingValueStore
 
 if t.TYPE_CHECKING:
@@ -276,3 +279,95 @@ class TestCompile:
         manifest_filepath = Path(manifest_dir) / "meltano-manifest.json"
         manifest_text = manifest_filepath.read_text()
         assert expected_value in manifest_text
+
+    def test_compile_parallel(
+        self,
+        manifest_dir: Path,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Overrides from the `--log-*` CLI options are applied by the workers too
+        monkeypatch.setitem(
+            ProjectSettingsService.config_override,
+            "cli.log_level",
+            "warning",
+        )
+
+        # Manifests are compiled one at a time in the CLI process by default
+        with mock.patch.object(compile_module, "ProcessPoolExecutor") as executor:
+            result = cli_runner.invoke(cli, ("compile",))
+        assert result.exit_code == 0
+        executor.assert_not_called()
+
+        with mock.patch.object(
+            compile_module,
+            "ProcessPoolExecutor",
+            wraps=compile_module.ProcessPoolExecutor,
+        ) as executor:
+            result = cli_runner.invoke(
+                cli,
+                ("compile", "--parallelism=4", f"--directory={tmp_path}"),
+            )
+        assert result.exit_code == 0, result.exception
+        # Workers configure logging as the CLI does
+        assert executor.call_args.kwargs["initializer"] is compile_module._init_worker
+        for name in (
+            f"meltano-manifest{x}.json" for x in (".dev", ".staging", ".prod", "")
+        ):
+            assert (tmp_path / name).read_text() == (manifest_dir / name).read_text()
+        assert (
+            '"MELTANO_CLI_LOG_LEVEL": "warning"'
+            in (tmp_path / "meltano-manifest.json").read_text()
+        )
+
+    def test_compile_incremental(
+        self,
+        project: Project,
+        manifest_dir: Path,
+        cli_runner: CliRunner,
+    ) -> None:
+        result = cli_runner.invoke(cli, ("compile", "--incremental"))
+        assert result.exit_code == 0
+        assert "Skipped" not in result.stdout
+        assert (manifest_dir / INPUTS_INDEX_FILE_NAME).exists()
+
+        result = cli_runner.invoke(cli, ("compile", "--incremental"))
+        assert result.exit_code == 0
+        assert "Compiled" not in result.stdout
+        assert result.stdout.count("(up to date)") == 4
+
+        # Environment variables that no setting or project file refers to are
+        # not inputs of the manifests
+        with mock.patch.dict("os.environ", {"UNRELATED_INCREMENTAL_TEST": "1"}):
+            result = cli_runner.invoke(cli, ("compile", "--incremental"))
+        assert result.exit_code == 0
+        assert "Compiled" not in result.stdout
+
+        with mock.patch.dict("os.environ", {"MELTANO_INCREMENTAL_TEST": "1"}):
+            result = cli_runner.invoke(
+                cli,
+                ("--environment=dev", "compile", "--incremental"),
+            )
+        assert result.exit_code == 0
+        assert "Compiled" in result.stdout
+
+        # A manifest compiled with other options is compiled again
+        result = cli_runner.invoke(
+            cli,
+            ("--environment=dev", "compile", "--incremental", "--indent=2"),
+        )
+        assert result.exit_code == 0
+        assert "Compiled" in result.stdout
+        check_indent(manifest_dir / "meltano-manifest.dev.json", 2)
+
+        # So is every manifest when the project files change
+        with project.meltano_update() as meltano:
+            meltano.extras["incremental_test"] = True
+        try:
+            result = cli_runner.invoke(cli, ("compile", "--incremental"))
+            assert result.exit_code == 0
+            assert result.stdout.count("Compiled") == 4
+        finally:
+            with project.meltano_update() as meltano:
+                meltano.extras.pop("incremental_test")
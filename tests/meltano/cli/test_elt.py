@@ -785,8 +785,8 @@ class TestCliEltScratchpadOne:
                         None,
                         (
                             "The extractor generated a message exceeding the "
-                            "message size limit of 50.0MiB (half the buffer "
-                            "size of 100.0MiB)."
+                            "message size limit of 512.0MiB (half the maximum "
+                            "buffer size of 1.0GiB)."
                         ),
                         "error",
                     ),
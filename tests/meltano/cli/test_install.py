@@ -8,7 +8,10 @@ import pytest
 
 from asserts import assert_cli_runner
 from meltano.cli import cli
+from meltano.core.behavior.hookable import hook
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.singer import SingerTap
+from meltano.core.plugin_install_manifest import InstallDrift, PluginInstallManifest
 from meltano.core.project_add_service import PluginAlreadyAddedException
 
 
@@ -267,6 +270,170 @@ class TestCliInstall:
             mappers = [m for m in commands[0][1] if m == mapper]
             assert len(mappers) == 1
 
+    @pytest.mark.usefixtures("target", "dbt")
+    def test_install_snapshot(self, project, tap, tap_gitlab, cli_runner, tmp_path):
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+        snapshot_path.touch()
+        with (
+            mock.patch("meltano.cli.install.install_plugins") as install_plugin_mock,
+            mock.patch(
+                "meltano.cli.install.import_venv_snapshot",
+                return_value=[tap],
+            ) as import_mock,
+            mock.patch(
+                "meltano.cli.install.export_venv_snapshot",
+                return_value=[tap, tap_gitlab],
+            ) as export_mock,
+        ):
+            install_plugin_mock.return_value = True
+
+            result = cli_runner.invoke(
+                cli,
+                [
+                    "install",
+                    "extractor",
+                    "tap-mock",
+                    "tap-gitlab",
+                    "--from-snapshot",
+                    str(snapshot_path),
+                    "--export-snapshot",
+                    str(snapshot_path),
+                ],
+            )
+            assert_cli_runner(result)
+
+            import_mock.assert_called_once_with(
+                project,
+                [tap, tap_gitlab],
+                snapshot_path,
+            )
+            install_plugin_mock.assert_called_once_with(
+                project,
+                [tap_gitlab],
+                parallelism=None,
+                clean=False,
+                force=False,
+            )
+            export_mock.assert_called_once_with(
+                project,
+                [tap, tap_gitlab],
+                snapshot_path,
+            )
+
+    def test_install_snapshot_hooks(self, tap, tap_gitlab, cli_runner, tmp_path):
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+        snapshot_path.touch()
+        installed = []
+
+        @hook("after_install")
+        async def after_install(target, install_service, plugin, reason):  # noqa: ARG001
+            installed.append(plugin.name)
+
+        with (
+            mock.patch("meltano.cli.install.install_plugins") as install_plugin_mock,
+            mock.patch(
+                "meltano.cli.install.import_venv_snapshot",
+                return_value=[tap, tap_gitlab],
+            ),
+            mock.patch.object(
+                SingerTap,
+                "__hooks__",
+                {"after_install": [after_install]},
+            ),
+        ):
+            result = cli_runner.invoke(
+                cli,
+                [
+                    "install",
+                    "extractor",
+                    "tap-mock",
+                    "tap-gitlab",
+                    "--from-snapshot",
+                    str(snapshot_path),
+                ],
+            )
+            assert_cli_runner(result)
+
+            # The install hooks of restored plugins run, without pip
+            assert installed == ["tap-mock", "tap-gitlab"]
+            install_plugin_mock.assert_not_called()
+
+    def test_install_snapshot_clean(self, cli_runner, tmp_path):
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+        snapshot_path.touch()
+        result = cli_runner.invoke(
+            cli,
+            ["install", "--clean", "--from-snapshot", str(snapshot_path)],
+        )
+        assert result.exit_code == 2
+        assert "--clean cannot be used with --from-snapshot" in result.output
+
+    @pytest.mark.usefixtures("target", "dbt")
+    def test_install_up_to_date(self, project, tap, tap_gitlab, cli_runner) -> None:
+        def drift(plugin):
+            return InstallDrift.NOT_INSTALLED if plugin == tap_gitlab else None
+
+        with (
+            mock.patch("meltano.cli.install.install_plugins") as install_plugin_mock,
+            mock.patch.object(PluginInstallManifest, "drift", side_effect=drift),
+        ):
+            install_plugin_mock.return_value = True
+
+            result = cli_runner.invoke(cli, ["install", "--plugin-type=extractors"])
+            assert_cli_runner(result)
+            install_plugin_mock.assert_called_once_with(
+                project,
+                [tap_gitlab],
+                parallelism=None,
+                clean=False,
+                force=False,
+            )
+
+            install_plugin_mock.reset_mock()
+            result = cli_runner.invoke(cli, ["install", "tap-mock"])
+            assert_cli_runner(result)
+            install_plugin_mock.assert_not_called()
+
+            # `--clean` reinstalls plugins that are up to date
+            result = cli_runner.invoke(
+                cli, ["install", "--clean", "--plugin-type=extractors"]
+            )
+            assert_cli_runner(result)
+            install_plugin_mock.assert_called_once_with(
+                project,
+                [tap, tap_gitlab],
+                parallelism=None,
+                clean=True,
+                force=False,
+            )
+
+    @pytest.mark.usefixtures("tap", "target", "dbt")
+    def test_install_check(self, tap_gitlab, cli_runner) -> None:
+        def drift(plugin):
+            if plugin == tap_gitlab:
+                return InstallDrift.REQUIREMENTS_CHANGED
+            if plugin.type == PluginType.TRANSFORMERS:
+                return InstallDrift.ALWAYS
+            return None
+
+        with (
+            mock.patch("meltano.cli.install.install_plugins") as install_plugin_mock,
+            mock.patch.object(PluginInstallManifest, "drift", side_effect=drift),
+        ):
+            result = cli_runner.invoke(cli, ["install", "--check"])
+            assert result.exit_code == 1
+            assert "extractor 'tap-gitlab': requirements changed" in result.output
+            assert "1/" in result.output
+            assert "plugins need to be installed" in result.output
+
+            result = cli_runner.invoke(
+                cli, ["install", "--check", "--plugin-type=loaders"]
+            )
+            assert_cli_runner(result)
+            assert "All 1 plugins are up to date" in result.output
+
+            install_plugin_mock.assert_not_called()
+
     @pytest.mark.usefixtures("tap_gitlab", "target")
     def test_install_schedule(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import typing as t
 import uuid
@@ -14,7 +15,10 @@ import pytest
 from meltano.cli import cli
 from meltano.cli.utils import CliError
 from meltano.core.job import Job, State
-from meltano.core.logging.job_logging_service import JobLoggingService
+from meltano.core.logging.job_logging_service import (
+    JobLoggingService,
+    SizeThresholdJobLogException,
+)
 
 if t.TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -299,6 +303,32 @@ class TestLogsShow:
         assert "Log file is large" in result.stdout
         # The large content would be displayed
 
+    def test_show_compressed_log(
+        self,
+        session: Session,
+        cli_runner: MeltanoCliRunner,
+        job_factory: JobFactory,
+    ):
+        """Test showing a log that was compressed once the run finished."""
+        job = job_factory.create(session, log_content="Compressed log content\n")
+        job_logging_service = JobLoggingService(job_factory.project)
+        job_logging_service.compress_log(job_logging_service.get_job_log_path(job))
+
+        with mock.patch(
+            "meltano.cli.logs.project_engine",
+            return_value=(None, lambda: session),
+        ):
+            result = cli_runner.invoke(cli, ["logs", "show", str(job.run_id)])
+            tail_result = cli_runner.invoke(
+                cli,
+                ["logs", "show", str(job.run_id), "--tail", "1"],
+            )
+
+        assert result.exit_code == 0
+        assert "Compressed log content" in result.stdout
+        assert tail_result.exit_code == 0
+        assert "Compressed log content" in tail_result.stdout.splitlines()
+
     def test_json_format_with_log_display(
         self,
         session: Session,
@@ -358,3 +388,208 @@ class TestLogsShow:
 
         log_path = path / "elt" / job.job_name / str(job.run_id) / "elt.log"
         assert log_path.read_text() == "Is this in the right directory?"
+
+    def test_follow_finished_job(
+        self,
+        session: Session,
+        cli_runner: MeltanoCliRunner,
+        job_factory: JobFactory,
+    ):
+        """Test that --follow stops once the job is no longer running."""
+        log_content = "\n".join([f"Line {i}" for i in range(1, 11)])
+        job = job_factory.create(session, log_content=log_content)
+
+        with mock.patch(
+            "meltano.cli.logs.project_engine",
+            return_value=(None, lambda: session),
+        ):
+            result = cli_runner.invoke(
+                cli,
+                ["logs", "show", str(job.run_id), "--tail", "3", "--follow"],
+            )
+
+        assert result.exit_code == 0
+        log_lines = result.stdout.splitlines()
+        assert "Last 3 lines:" in log_lines
+        assert log_lines[-3:] == ["Line 8", "Line 9", "Line 10"]
+
+
+class TestJobLoggingService:
+    """Test reading log files with `JobLoggingService`."""
+
+    @pytest.fixture
+    def service(self, project: Project) -> JobLoggingService:
+        return JobLoggingService(project)
+
+    @pytest.mark.parametrize(
+        ("content", "lines", "expected"),
+        (
+            pytest.param("", 3, [], id="empty"),
+            pytest.param("a\nb\nc\n", 2, ["b", "c"], id="trailing-newline"),
+            pytest.param("a\nb\nc", 2, ["b", "c"], id="no-trailing-newline"),
+            pytest.param("a\nb\nc\n", 10, ["a", "b", "c"], id="fewer-lines"),
+            pytest.param("a\n\nc\n", 2, ["", "c"], id="blank-line"),
+            pytest.param("a\nb\n", 0, [], id="zero-lines"),
+        ),
+    )
+    def test_tail_file(
+        self,
+        service: JobLoggingService,
+        tmp_path: Path,
+        content: str,
+        lines: int,
+        expected: list[str],
+    ):
+        log_path = tmp_path / "elt.log"
+        log_path.write_text(content)
+        assert service.tail_file(log_path, lines) == expected
+
+    def test_tail_file_end(self, service: JobLoggingService, tmp_path: Path):
+        log_path = tmp_path / "elt.log"
+        log_path.write_text("a\nb\nc\nd\n")
+        assert service.tail_file(log_path, 2, end=4) == ["a", "b"]
+
+    def test_iter_file_chunks(self, service: JobLoggingService, tmp_path: Path):
+        log_path = tmp_path / "elt.log"
+        content = "héllo wörld\n" * 10
+        log_path.write_text(content, encoding="utf-8")
+        chunks = list(service.iter_file_chunks(log_path, chunk_size=5))
+        assert len(chunks) > 1
+        assert "".join(chunks) == content
+
+    def test_follow_file(self, service: JobLoggingService, tmp_path: Path):
+        log_path = tmp_path / "elt.log"
+        log_path.write_text("old line\n")
+        offset = log_path.stat().st_size
+        appended = iter(["new line 1\nnew ", "line 2\nlast"])
+
+        def is_active() -> bool:
+            try:
+                chunk = next(appended)
+            except StopIteration:
+                return False
+            with log_path.open("a") as f:
+                f.write(chunk)
+            return True
+
+        lines = service.follow_file(
+            log_path,
+            offset=offset,
+            is_active=is_active,
+            poll_interval=0,
+        )
+        assert list(lines) == ["new line 1", "new line 2", "last"]
+
+    def test_log_index(self, service: JobLoggingService):
+        state_id = f"dev:tap-mock-to-target-mock-{uuid.uuid4()}"
+        run_ids = [str(uuid.uuid4()) for _ in range(3)]
+        for run_id in run_ids:
+            log_path = service.register_log(state_id, run_id)
+            log_path.write_text(f"Log for {run_id}")
+
+        # Indexed logs are returned most recent first, regardless of ctime
+        assert [path.parent.name for path in service.get_all_logs(state_id)] == [
+            *reversed(run_ids)
+        ]
+        assert service.get_latest_log(state_id) == f"Log for {run_ids[-1]}"
+
+        # Missing logs are skipped
+        service.generate_log_name(state_id, run_ids[-1]).unlink()
+        assert service.get_latest_log(state_id) == f"Log for {run_ids[-2]}"
+
+        service.delete_all_logs(state_id)
+        assert service.get_all_logs(state_id) == []
+        assert not service.logs_dir(state_id, "logs.index").exists()
+
+    def test_log_index_bootstrap(self, service: JobLoggingService):
+        state_id = f"dev:tap-mock-to-target-mock-{uuid.uuid4()}"
+        old_run_id = str(uuid.uuid4())
+        new_run_id = str(uuid.uuid4())
+
+        # A log written before the index existed
+        service.generate_log_name(state_id, old_run_id).write_text("old")
+
+        service.register_log(state_id, new_run_id).write_text("new")
+        index = service.logs_dir(state_id, "logs.index").read_text().splitlines()
+        assert index == [f"{old_run_id}/elt.log", f"{new_run_id}/elt.log"]
+        assert service.get_latest_log(state_id) == "new"
+
+    def test_finalize_log(
+        self,
+        service: JobLoggingService,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setenv("MELTANO_ELT_LOG_COMPRESS", "true")
+        monkeypatch.setenv("MELTANO_ELT_LOG_RETENTION", "2")
+        state_id = f"dev:tap-mock-to-target-mock-{uuid.uuid4()}"
+        run_ids = [str(uuid.uuid4()) for _ in range(3)]
+        for run_id in run_ids:
+            service.register_log(state_id, run_id).write_text(f"Log for {run_id}\n")
+            service.finalize_log(state_id, run_id)
+
+        logs = service.get_all_logs(state_id)
+        assert [path.parent.name for path in logs] == run_ids[:0:-1]
+        assert all(path.name == "elt.log.gz" for path in logs)
+        assert not service.logs_dir(state_id, run_ids[0], make_dirs=False).exists()
+        assert service.get_latest_log(state_id) == f"Log for {run_ids[-1]}\n"
+
+    def test_log_index_rebuild_compressed(
+        self,
+        service: JobLoggingService,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setenv("MELTANO_ELT_LOG_COMPRESS", "true")
+        state_id = f"dev:tap-mock-to-target-mock-{uuid.uuid4()}"
+        run_ids = [str(uuid.uuid4()) for _ in range(2)]
+        for run_id in run_ids:
+            service.register_log(state_id, run_id).write_text(f"Log for {run_id}\n")
+            service.finalize_log(state_id, run_id)
+
+        # The index is rebuilt from the compressed logs
+        service.logs_dir(state_id, "logs.index").unlink()
+        logs = service.get_all_logs(state_id)
+        assert [path.parent.name for path in logs] == run_ids[::-1]
+        assert all(path.name == "elt.log.gz" for path in logs)
+        assert service.get_latest_log(state_id) == f"Log for {run_ids[-1]}\n"
+        index = service.logs_dir(state_id, "logs.index").read_text().splitlines()
+        assert index == [f"{run_id}/elt.log" for run_id in run_ids]
+
+    def test_latest_log_size_threshold(
+        self,
+        service: JobLoggingService,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setenv("MELTANO_ELT_LOG_COMPRESS", "true")
+        monkeypatch.setattr(
+            "meltano.core.logging.job_logging_service.MAX_FILE_SIZE",
+            100,
+        )
+        state_id = f"dev:tap-mock-to-target-mock-{uuid.uuid4()}"
+        run_id = str(uuid.uuid4())
+        service.register_log(state_id, run_id).write_text("x" * 1000)
+        service.finalize_log(state_id, run_id)
+
+        # The compressed log is below the limit, its contents are not
+        (log_path,) = service.get_all_logs(state_id)
+        assert log_path.stat().st_size <= 100
+        with pytest.raises(SizeThresholdJobLogException):
+            service.get_latest_log(state_id)
+
+    def test_rotated_log_segments(self, service: JobLoggingService, tmp_path: Path):
+        log_path = tmp_path / "elt.log"
+        with gzip.open(tmp_path / "elt.log.2.gz", "wt") as f:
+            f.write("Line 1\nLine 2\n")
+        (tmp_path / "elt.log.1").write_text("Line 3\nLine 4\n")
+        log_path.write_text("Line 5\n")
+
+        assert service.log_segments(log_path) == [
+            tmp_path / "elt.log.2.gz",
+            tmp_path / "elt.log.1",
+            log_path,
+        ]
+        assert service.tail_log(log_path, 4) == ["Line 2", "Line 3", "Line 4", "Line 5"]
+        assert "".join(
+            chunk
+            for segment in service.log_segments(log_path)
+            for chunk in service.iter_file_chunks(segment)
+        ) == "".join(f"Line {i}\n" for i in range(1, 6))
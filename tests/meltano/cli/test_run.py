@@ -19,6 +19,7 @@ from meltano.core.project_plugins_service import (
     AmbiguousMappingName,
     PluginAlreadyAddedException,
 )
+from meltano.core.state_service import StateService
 
 if t.TYPE_CHECKING:
     from fixtures.cli import MeltanoCliRunner
@@ -544,6 +545,65 @@ class TestCliRunScratchpadOne:
             assert completion_events[1]["success"]
             assert completion_events[1]["duration_seconds"] > 0
 
+    @pytest.mark.backend("sqlite")
+    @pytest.mark.usefixtures("use_test_log_config", "job_logging_service")
+    def test_run_fan_out(
+        self,
+        cli_runner,
+        project: Project,
+        tap,
+        target,
+        alternative_target,
+        tap_process,
+        target_process,
+        process_mock_factory,
+        worker_id: str,
+    ) -> None:
+        alternative_target_process = process_mock_factory(alternative_target)
+        alternative_target_process.stdout.at_eof.side_effect = (False, False, True)
+        alternative_target_process.stdout.readline = AsyncMock(
+            side_effect=(b'{"line": 1}\n', b'{"line": 2}\n'),
+        )
+        alternative_target_process.stderr.at_eof.side_effect = (True,)
+        create_subprocess_exec = AsyncMock(
+            side_effect=(tap_process, target_process, alternative_target_process),
+        )
+
+        args = [
+            "run",
+            tap.name,
+            f"{target.name},{alternative_target.name}",
+            "--state-id-suffix",
+            worker_id,
+        ]
+        with (
+            mock.patch.object(SingerTap, "discover_catalog"),
+            mock.patch.object(SingerTap, "apply_catalog_rules"),
+            mock.patch("meltano.core.plugin_invoker.asyncio") as asyncio_mock,
+        ):
+            asyncio_mock.create_subprocess_exec = create_subprocess_exec
+            result = cli_runner.invoke(cli, args, catch_exceptions=False)
+            assert result.exit_code == 0
+
+        # The output of the tap is loaded into both targets
+        for process in (target_process, alternative_target_process):
+            lines = [call.args[0] for call in process.stdin.writeline.call_args_list]
+            assert lines == ["SCHEMA\n", "RECORD\n", "STATE\n"]
+            process.stdin.close.assert_called_once()
+
+        completion_event = EventMatcher(result.stderr).find_first_event(
+            "Block run completed",
+        )
+        assert completion_event is not None
+        assert completion_event["success"]
+
+        # Only states emitted by both targets are persisted
+        state_id = (
+            f"dev:{tap.name}-to-{target.name},{alternative_target.name}:{worker_id}"
+        )
+        state_service = StateService(project)
+        assert state_service.get_state(state_id) == {"singer_state": {"line": 2}}
+
     @pytest.mark.backend("sqlite")
     @pytest.mark.usefixtures(
         "use_test_log_config",
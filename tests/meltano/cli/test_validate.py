@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+import typing as t
+
+import pytest
+
+from meltano.cli import cli
+from meltano.core.plugin import PluginType
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from click.testing import CliRunner
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+    from meltano.core.project_add_service import ProjectAddService
+
+# Prints a few lines slowly, so that concurrent tests would interleave them
+TEST_SCRIPT = """
+import sys
+import time
+
+name, exit_code = sys.argv[1], int(sys.argv[2])
+for line in range(3):
+    print(f"{name} line {line}", flush=True)
+    time.sleep(0.2)
+sys.exit(exit_code)
+"""
+
+
+class TestCliTest:
+    @pytest.fixture
+    def test_plugins(
+        self,
+        project: Project,
+        project_add_service: ProjectAddService,
+        tmp_path: Path,
+    ) -> Iterator[list[ProjectPlugin]]:
+        script = tmp_path / "test_script.py"
+        script.write_text(textwrap.dedent(TEST_SCRIPT))
+
+        plugins = [
+            project_add_service.add(
+                PluginType.UTILITIES,
+                name,
+                namespace=name.replace("-", "_"),
+                executable=sys.executable,
+                commands={"test": f"{script} {name} {exit_code}"},
+            )
+            for name, exit_code in (("test-alpha", 0), ("test-beta", 1))
+        ]
+        try:
+            yield plugins
+        finally:
+            for plugin in plugins:
+                project.plugins.remove_from_file(plugin)
+
+    @pytest.mark.usefixtures("test_plugins")
+    def test_parallel(self, cli_runner: CliRunner) -> None:
+        result = cli_runner.invoke(
+            cli,
+            ["test", "-p", "2", "--no-install", "test-alpha:test", "test-beta:test"],
+        )
+
+        # One of the tests failed
+        assert result.exit_code == 1, result.output
+        assert "1 test(s) successful. 1 test(s) failed." in result.output
+
+        # The output of each test is printed at once, after its title
+        lines = result.output.splitlines()
+        for name in ("test-alpha", "test-beta"):
+            title = next(i for i, line in enumerate(lines) if f"{name}:test" in line)
+            assert lines[title + 1 : title + 4] == [
+                f"{name} line {line}" for line in range(3)
+            ]
@@ -6,7 +6,7 @@ from textwrap import dedent
 import pytest
 from ruamel.yaml.comments import CommentedMap
 
-from meltano.core.behavior.canonical import Canonical
+from meltano.core.behavior.canonical import Canonical, copy_tree
 from meltano.core.yaml import yaml
 
 definition = {
@@ -174,3 +174,35 @@ class TestCanonical:
             assert obj.annotations
         assert obj.z == -1
         assert obj.canonical() == original
+
+    def test_copy_tree(self) -> None:
+        contents = """\
+            object:
+              # Comment in an object
+              key: value # Comment in a nested value
+              number: 1.50
+
+            array:
+            # Comment in an array
+            - value # Comment in an array element
+            - nested: [1, 2]
+        """
+        contents = dedent(contents)
+        mapping = yaml.load(io.StringIO(contents))
+        copied = copy_tree(mapping)
+
+        assert copied == mapping
+        assert copied["object"] is not mapping["object"]
+        assert copied["array"][1]["nested"] is not mapping["array"][1]["nested"]
+        # Immutable leaves are shared
+        assert copied["object"]["number"] is mapping["object"]["number"]
+
+        # The copy is independent, including its comments
+        copied["array"].insert(0, "first")
+        copied["object"]["key"] = "other"
+        assert mapping["array"][0] == "value"
+        assert mapping["object"]["key"] == "value"
+
+        out_stream = io.StringIO()
+        yaml.dump(mapping, out_stream)
+        assert out_stream.getvalue() == contents
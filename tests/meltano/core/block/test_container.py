@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from meltano.core.block.container import ContainerBlock
+from meltano.core.container.container_service import ContainerOutput
+from meltano.core.runner import RunnerError
+
+
+class LineCollector:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def writeline(self, line: str) -> None:
+        self.lines.append(line)
+
+
+class TestContainerBlock:
+    @pytest.fixture
+    def container_process(self):
+        process = mock.Mock()
+        process.stdout = ContainerOutput()
+        process.stderr = ContainerOutput()
+        process.stdin = None
+        process.wait = AsyncMock(return_value=0)
+        return process
+
+    @pytest.fixture
+    def invoker(self, container_process, tap):
+        invoker = mock.Mock()
+        invoker.plugin = tap
+        invoker.output_handlers = None
+        invoker.invoke_container = AsyncMock(return_value=container_process)
+        return invoker
+
+    def make_block(self, project, invoker) -> ContainerBlock:
+        return ContainerBlock(
+            block_ctx=mock.Mock(),
+            project=project,
+            plugin_invoker=invoker,
+            plugin_args=(),
+            plugin_command="containerized",
+        )
+
+    @pytest.mark.asyncio
+    async def test_start(self, project, invoker, container_process) -> None:
+        block = self.make_block(project, invoker)
+        await block.start()
+
+        invoker.invoke_container.assert_awaited_once_with(
+            "containerized",
+            attach_stdin=False,
+        )
+        assert block.process_handle is container_process
+
+        stdout, stderr = LineCollector(), LineCollector()
+        block.stdout_link(stdout)
+        block.stderr_link(stderr)
+        for chunk in (b"out1\nou", b"t2\n", None):
+            await container_process.stdout.feed(chunk)
+        for chunk in (b"err1\nerr2\n", None):
+            await container_process.stderr.feed(chunk)
+
+        await asyncio.gather(*block.proxy_io())
+        assert stdout.lines == ["out1\n", "out2\n"]
+        assert stderr.lines == ["err1\n", "err2\n"]
+
+    @pytest.mark.asyncio
+    async def test_start_failure(self, project, invoker) -> None:
+        invoker.invoke_container.side_effect = ValueError(
+            "Command is missing a container spec",
+        )
+        block = self.make_block(project, invoker)
+
+        with pytest.raises(RunnerError, match="missing a container spec"):
+            await block.start()
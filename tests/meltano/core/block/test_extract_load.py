@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import tempfile
 import typing as t
 import uuid
+from contextlib import nullcontext
 from pathlib import Path
 from unittest import mock
 from unittest.mock import AsyncMock
 
 import pytest
 
+from meltano.core.block.block_parser import BlockParser
 from meltano.core.block.blockset import BlockSetValidationError
+from meltano.core.block.container import ContainerBlock
 from meltano.core.block.extract_load import (
     ELBContext,
     ELBContextBuilder,
     ExtractLoadBlocks,
+    ShardedExtractLoadBlocks,
     generate_state_id,
 )
 from meltano.core.block.ioblock import IOBlock
@@ -118,6 +123,22 @@ class TestELBContextBuilder:
         assert block.consumer
         assert not block.producer
 
+    def test_make_block_containers(self, project, session, tap, target) -> None:
+        """Ensure that plugin commands only run in containers when enabled."""
+        builder = ELBContextBuilder(project)
+        builder.session = session
+
+        block = builder.make_block(tap, command="containerized")
+        assert not isinstance(block, ContainerBlock)
+
+        builder.with_containers(containers=True)
+        block = builder.make_block(tap, command="containerized")
+        assert isinstance(block, ContainerBlock)
+        assert block.plugin_command == "containerized"
+        assert block.string_id == tap.name
+
+        assert not isinstance(builder.make_block(target), ContainerBlock)
+
     def test_make_block_tracks_envs(self, project, session, tap, target) -> None:
         """Ensure that calling make_block correctly stacks env vars."""
         builder = ELBContextBuilder(project)
@@ -434,6 +455,146 @@ class TestExtractLoadBlocks:
             first_write = target_process.stdin.writeline.call_args_list[0]
             assert "mapper" in first_write[0][0]
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("session", "subject", "log")
+    async def test_extract_load_block_sample(
+        self,
+        tap_config_dir,
+        target_config_dir,
+        tap,
+        target,
+        tap_process,
+        target_process,
+        plugin_invoker_factory,
+        elb_context,
+    ) -> None:
+        def record(stream: str, id_: int) -> bytes:
+            message = {"type": "RECORD", "stream": stream, "record": {"id": id_}}
+            return b"%b\n" % json.dumps(message).encode()
+
+        tap_config_dir.joinpath("tap.properties.json").write_text(
+            json.dumps(
+                {
+                    "streams": [
+                        {
+                            "tap_stream_id": "users",
+                            "stream": "users",
+                            "schema": {},
+                            "metadata": [
+                                {"breadcrumb": [], "metadata": {"selected": True}},
+                            ],
+                        },
+                    ],
+                },
+            ),
+        )
+        tap_process.stderr.at_eof.side_effect = (True,)
+        tap_process.stdout.at_eof.side_effect = (False, False, False, True)
+        tap_process.stdout.readline = AsyncMock(
+            side_effect=(
+                b"%b\n" % json.dumps({"type": "SCHEMA", "stream": "users"}).encode(),
+                record("users", 1),
+                record("users", 2),
+            ),
+        )
+        # The extractor is ended with SIGTERM once every stream is sampled
+        tap_process.wait = AsyncMock(return_value=-15)
+        target_process.stderr.at_eof.side_effect = (True,)
+        target_process.stdout.at_eof.side_effect = (True,)
+
+        elb_context.max_records_per_stream = 1
+        tap_invoker = plugin_invoker_factory(tap, config_dir=tap_config_dir)
+        target_invoker = plugin_invoker_factory(target, config_dir=target_config_dir)
+
+        invoke_async = AsyncMock(side_effect=(tap_process, target_process))
+        with mock.patch.object(PluginInvoker, "invoke_async", new=invoke_async):
+            blocks = (
+                SingerBlock(
+                    block_ctx=elb_context,
+                    project=elb_context.project,
+                    plugin_invoker=tap_invoker,
+                    plugin_args=[],
+                ),
+                SingerBlock(
+                    block_ctx=elb_context,
+                    project=elb_context.project,
+                    plugin_invoker=target_invoker,
+                    plugin_args=[],
+                ),
+            )
+
+            elb = ExtractLoadBlocks(elb_context, blocks)
+            await elb.run()
+
+        tap_process.terminate.assert_called_once()
+        assert [
+            json.loads(call.args[0])["type"]
+            for call in target_process.stdin.writeline.call_args_list
+        ] == ["SCHEMA", "RECORD"]
+        assert elb.sampler is not None
+        assert elb.sampler.records == {"users": 1}
+        assert elb.sampler.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_start_blocks_prepares_concurrently(self, elb_context) -> None:
+        events: list[str] = []
+        target_prepared = asyncio.Event()
+
+        def mock_block(name: str) -> mock.Mock:
+            block = mock.Mock(spec=IOBlock, string_id=name)
+            block.start = AsyncMock(side_effect=lambda: events.append(f"start {name}"))
+            block.stop = AsyncMock()
+            block.post = AsyncMock()
+            return block
+
+        async def tap_pre(_context) -> None:
+            # The tap only finishes preparing once the target is prepared
+            await target_prepared.wait()
+            events.append("pre tap")
+
+        async def target_pre(_context) -> None:
+            events.append("pre target")
+            target_prepared.set()
+
+        tap, target = mock_block("tap"), mock_block("target")
+        tap.pre = AsyncMock(side_effect=tap_pre)
+        target.pre = AsyncMock(side_effect=target_pre)
+
+        elb = ExtractLoadBlocks(elb_context, (tap, target))
+        async with elb._start_blocks():
+            pass
+
+        assert events == ["pre target", "pre tap", "start tap", "start target"]
+        tap.post.assert_awaited_once()
+        target.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_start_blocks_failure_stops_started_blocks(
+        self,
+        elb_context,
+    ) -> None:
+        tap = mock.Mock(spec=IOBlock, string_id="tap")
+        tap.pre = AsyncMock()
+        tap.start = AsyncMock()
+        tap.stop = AsyncMock()
+        tap.post = AsyncMock()
+
+        target = mock.Mock(spec=IOBlock, string_id="target")
+        target.pre = AsyncMock()
+        target.start = AsyncMock(side_effect=RunnerError("boom"))
+        target.stop = AsyncMock()
+        target.post = AsyncMock()
+
+        elb = ExtractLoadBlocks(elb_context, (tap, target))
+        with pytest.raises(RunnerError, match="boom"):
+            async with elb._start_blocks():
+                pass  # pragma: no cover
+
+        tap.stop.assert_awaited_once_with(kill=True)
+        target.stop.assert_not_awaited()
+        tap.post.assert_awaited_once()
+        target.post.assert_awaited_once()
+
     @pytest.mark.asyncio
     @pytest.mark.usefixtures("session", "subject")
     async def test_elb_validation(
@@ -625,6 +786,125 @@ class TestExtractLoadBlocks:
         assert extract_load_blocks.context.job.run_id == run_id
 
 
+class TestShardedExtractLoadBlocks:
+    @pytest.fixture
+    def catalog(self) -> dict[str, t.Any]:
+        return {
+            "streams": [
+                {
+                    "tap_stream_id": stream,
+                    "schema": {"type": "object", "properties": {}},
+                    "metadata": [{"breadcrumb": [], "metadata": {"selected": True}}],
+                }
+                for stream in ("users", "events", "accounts")
+            ],
+        }
+
+    @pytest.fixture
+    def elb(self, project_with_environment, tap, target) -> ShardedExtractLoadBlocks:
+        parser = BlockParser(
+            mock.Mock(),
+            project_with_environment,
+            [tap.name, target.name],
+            shards=2,
+        )
+        (elb,) = parser.find_blocks()
+        assert isinstance(elb, ShardedExtractLoadBlocks)
+        return elb
+
+    @pytest.mark.asyncio
+    async def test_run(self, elb, catalog) -> None:
+        state_service = elb.state_service
+        state_id = elb.context.job.job_name
+        state_service.set_state(
+            state_id,
+            json.dumps(
+                {
+                    "singer_state": {
+                        "bookmarks": {"users": 0, "events": 0, "accounts": 0},
+                    },
+                },
+            ),
+        )
+
+        seeded = {}
+
+        def run_shard(shard: ExtractLoadBlocks, stream: str) -> AsyncMock:
+            async def run() -> None:
+                shard_state_id = shard.context.job.job_name
+                seeded[shard_state_id] = state_service.get_state(shard_state_id)
+
+                catalog_path = shard.head.invoker.settings_service.config_override[
+                    "_catalog"
+                ]
+                shard_catalog = json.loads(Path(catalog_path).read_text())  # noqa: ASYNC240
+                assert stream in {s["tap_stream_id"] for s in shard_catalog["streams"]}
+
+                # Taps emit the bookmarks of every stream they know about
+                state_service.set_state(
+                    shard_state_id,
+                    json.dumps(
+                        {
+                            "singer_state": {
+                                "bookmarks": {
+                                    "users": 0,
+                                    "events": 0,
+                                    "accounts": 0,
+                                    stream: 1,
+                                },
+                            },
+                        },
+                    ),
+                )
+
+            return AsyncMock(side_effect=run)
+
+        first, second = elb.shards
+        first.run = run_shard(first, "users")
+        second.run = run_shard(second, "events")
+
+        with (
+            mock.patch.object(elb.head.invoker, "prepared", return_value=nullcontext()),
+            mock.patch.object(
+                elb.head.invoker,
+                "dump",
+                AsyncMock(return_value=json.dumps(catalog)),
+            ),
+        ):
+            await elb.run()
+
+        first.run.assert_awaited_once()
+        second.run.assert_awaited_once()
+
+        # Shards are seeded with the state of their own streams...
+        assert seeded == {
+            first.context.job.job_name: {
+                "singer_state": {"bookmarks": {"users": 0, "accounts": 0}},
+            },
+            second.context.job.job_name: {
+                "singer_state": {"bookmarks": {"events": 0}},
+            },
+        }
+        # ...and only the state of their own streams is merged back, so that a
+        # shard does not revert the bookmarks of the others
+        assert state_service.get_state(state_id) == {
+            "singer_state": {"bookmarks": {"users": 1, "events": 1, "accounts": 0}},
+        }
+
+    @pytest.mark.asyncio
+    async def test_run_without_catalog(self, elb) -> None:
+        with (
+            mock.patch.object(elb.head.invoker, "prepared", return_value=nullcontext()),
+            mock.patch.object(
+                elb.head.invoker,
+                "dump",
+                AsyncMock(side_effect=FileNotFoundError("tap.properties.json")),
+            ),
+            pytest.raises(RunnerError, match="Cannot shard the streams of tap-mock"),
+        ):
+            await elb.run()
+
+
 class TestExtractLoadUtils:
     def test_generate_state_id(self) -> None:
         block1 = mock.Mock(spec=IOBlock)
@@ -645,6 +925,10 @@ class TestExtractLoadUtils:
             generate_state_id(project, "suffix", block1, block2)
             == "test:block1-to-block2:suffix"
         )
+        assert (
+            generate_state_id(project, "suffix", block1, block2, shard="shard-1-of-2")
+            == "test:block1-to-block2:suffix:shard-1-of-2"
+        )
 
     def test_generate_state_id_no_environment(self) -> None:
         block1 = mock.Mock(spec=IOBlock)
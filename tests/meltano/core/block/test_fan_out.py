@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from meltano.core.block.fan_out import FanOutBlock, StateGate, TeeWriter
+from meltano.core.logging.utils import AsyncStreamWriter
+from meltano.core.plugin.singer.target import BookmarkWriter
+from meltano.core.plugin_invoker import PluginInvoker
+
+
+class CollectingWriter(AsyncStreamWriter):
+    def __init__(self) -> None:
+        self.data = b""
+        self.closed = False
+        self.resume = asyncio.Event()
+        self.resume.set()
+
+    def write(self, data: bytes) -> None:
+        if self.closed:
+            raise BrokenPipeError
+        self.data += data
+
+    async def drain(self) -> None:
+        await self.resume.wait()
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+class LineCollector:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def writeline(self, line: str) -> None:
+        self.lines.append(line)
+
+
+def make_consumer(stdin: CollectingWriter) -> mock.Mock:
+    block = mock.Mock()
+    block.string_id = "target"
+    block.stdin = stdin
+
+    async def close_stdin() -> None:
+        stdin.close()
+
+    block.close_stdin = AsyncMock(side_effect=close_stdin)
+    return block
+
+
+class TestTeeWriter:
+    @pytest.mark.asyncio
+    async def test_relay(self) -> None:
+        first, second = CollectingWriter(), CollectingWriter()
+        tee = TeeWriter([make_consumer(first), make_consumer(second)], 1024)
+
+        for line in (b"SCHEMA\n", b"RECORD\n", b"STATE\n"):
+            tee.write(line)
+            await tee.drain()
+        tee.close()
+        await tee.wait_closed()
+
+        assert first.data == second.data == b"SCHEMA\nRECORD\nSTATE\n"
+        assert first.closed
+        assert second.closed
+
+    @pytest.mark.asyncio
+    async def test_bounded_buffer(self) -> None:
+        fast, slow = CollectingWriter(), CollectingWriter()
+        slow.resume.clear()
+        tee = TeeWriter([make_consumer(fast), make_consumer(slow)], 8)
+
+        tee.write(b"RECORD 1\n")
+        drain = asyncio.ensure_future(tee.drain())
+        done, _ = await asyncio.wait([drain], timeout=0.1)
+
+        # The producer waits for the slow consumer to catch up
+        assert not done
+        assert fast.data == b"RECORD 1\n"
+
+        slow.resume.set()
+        await drain
+        tee.close()
+        await tee.wait_closed()
+        assert slow.data == b"RECORD 1\n"
+
+    @pytest.mark.asyncio
+    async def test_closed_consumer(self) -> None:
+        healthy, closed = CollectingWriter(), CollectingWriter()
+        closed.closed = True
+        tee = TeeWriter([make_consumer(healthy), make_consumer(closed)], 1024)
+
+        tee.write(b"RECORD 1\n")
+        await tee.drain()
+        await asyncio.sleep(0)
+        tee.write(b"RECORD 2\n")
+        await tee.drain()
+        tee.close()
+        await tee.wait_closed()
+
+        assert healthy.data == b"RECORD 1\nRECORD 2\n"
+
+        tee = TeeWriter([make_consumer(closed)], 1024)
+        tee.write(b"RECORD 1\n")
+        await tee.drain()
+        await tee.wait_closed()
+        with pytest.raises(BrokenPipeError):
+            tee.write(b"RECORD 2\n")
+
+
+class TestStateGate:
+    def test_acknowledge(self) -> None:
+        writer = LineCollector()
+        gate = StateGate(writer, ["target-a", "target-b"])
+
+        gate.acknowledge(0, '{"bookmarks": 1}')
+        gate.acknowledge(0, '{"bookmarks": 2}')
+        assert not writer.lines
+
+        gate.acknowledge(1, '{"bookmarks": 2}')
+        assert writer.lines == ['{"bookmarks": 2}']
+
+        # States that were superseded are not persisted anymore
+        gate.acknowledge(1, '{"bookmarks": 1}')
+        gate.acknowledge(1, '{"bookmarks": 3}')
+        gate.acknowledge(0, '{"bookmarks":3}')
+        assert writer.lines == ['{"bookmarks": 2}', '{"bookmarks":3}']
+
+        gate.acknowledge(0, "not json")
+        assert len(writer.lines) == 2
+
+    def test_acknowledge_discards_unreachable_states(self) -> None:
+        writer = LineCollector()
+        gate = StateGate(writer, ["target-a", "target-b", "target-c"])
+
+        for bookmark in range(1, 5):
+            gate.acknowledge(0, f'{{"bookmarks": {bookmark}}}')
+        gate.acknowledge(1, '{"bookmarks": 2}')
+        gate.acknowledge(2, '{"bookmarks": 3}')
+
+        # No consumer can acknowledge the first state after the second anymore
+        assert len(gate._pending) == 3
+        assert not writer.lines
+
+        gate.acknowledge(1, '{"bookmarks": 3}')
+        assert writer.lines == ['{"bookmarks": 3}']
+        assert len(gate._pending) == 1
+
+    def test_acknowledge_silent_consumer(self) -> None:
+        writer = LineCollector()
+        gate = StateGate(writer, ["target-a", "target-b"], max_pending=3)
+
+        with capture_logs() as cap_logs:
+            for bookmark in range(1, 11):
+                gate.acknowledge(0, f'{{"bookmarks": {bookmark}}}')
+
+        # The states kept for the consumer that does not emit states are bounded
+        assert len(gate._pending) == 3
+        assert not writer.lines
+        assert [log["loaders"] for log in cap_logs if "loaders" in log] == [
+            ["target-b"],
+        ]
+
+        gate.acknowledge(1, '{"bookmarks": 10}')
+        assert writer.lines == ['{"bookmarks": 10}']
+        assert not gate._pending
+
+
+class TestFanOutBlock:
+    def make_target(self, exit_code: int) -> mock.Mock:
+        block = mock.Mock()
+        block.process_future = asyncio.ensure_future(asyncio.sleep(0, exit_code))
+        block.stop = AsyncMock()
+        block.invoker.StdioSource = PluginInvoker.StdioSource
+        block.invoker.output_handlers = None
+        return block
+
+    @pytest.mark.asyncio
+    async def test_process_future(self, project) -> None:
+        subject = FanOutBlock(project, [self.make_target(0), self.make_target(0)])
+        assert await subject.process_future == 0
+
+    @pytest.mark.asyncio
+    async def test_process_future_failure(self, project) -> None:
+        failed, running = self.make_target(1), self.make_target(0)
+        running.process_future = asyncio.ensure_future(asyncio.sleep(10, 0))
+        subject = FanOutBlock(project, [failed, running])
+
+        assert await subject.process_future == 1
+        running.stop.assert_awaited_once()
+        failed.stop.assert_not_awaited()
+        running.process_future.cancel()
+
+    @pytest.mark.asyncio
+    async def test_start_gates_state(self, project) -> None:
+        blocks = [self.make_target(0), self.make_target(0)]
+        bookmark_writers = []
+        for block in blocks:
+            block.start = AsyncMock()
+            block.stdin = CollectingWriter()
+            block.close_stdin = AsyncMock()
+            bookmark_writer = mock.Mock(spec=BookmarkWriter)
+            bookmark_writers.append(bookmark_writer)
+            block.invoker.output_handlers = {
+                PluginInvoker.StdioSource.STDOUT: [bookmark_writer],
+            }
+
+        subject = FanOutBlock(project, blocks)
+        await subject.start()
+        assert subject.stdin is not None
+        assert subject.state_gate is not None
+
+        first, second = (
+            block.invoker.output_handlers[PluginInvoker.StdioSource.STDOUT][0]
+            for block in blocks
+        )
+        first.writeline('{"bookmarks": 1}')
+        bookmark_writers[1].writeline.assert_not_called()
+        second.writeline('{"bookmarks": 1}')
+        bookmark_writers[1].writeline.assert_called_once_with('{"bookmarks": 1}')
+        bookmark_writers[0].writeline.assert_not_called()
+
+        await subject.close_stdin()
@@ -1,9 +1,63 @@
 from __future__ import annotations
 
-from meltano.core.block.block_parser import is_command_block
+import click
+import pytest
+import structlog
+
+from meltano.core.block.block_parser import BlockParser, is_command_block
+from meltano.core.block.extract_load import ShardedExtractLoadBlocks
+from meltano.core.block.fan_out import FanOutBlock
 
 
 class TestParserUtils:
     def test_is_command_block(self, tap, dbt) -> None:
         assert not is_command_block(tap)
         assert is_command_block(dbt)
+
+
+class TestBlockParser:
+    @pytest.fixture
+    def log(self) -> structlog.BoundLogger:
+        return structlog.get_logger()
+
+    def test_fan_out(self, log, project, tap, target, alternative_target) -> None:
+        parser = BlockParser(
+            log,
+            project,
+            [tap.name, f"{target.name},{alternative_target.name}"],
+        )
+        assert parser.plugins == [tap, target, alternative_target]
+
+        (elb,) = parser.find_blocks()
+        assert isinstance(elb.tail, FanOutBlock)
+        assert elb.tail.string_id == f"{target.name},{alternative_target.name}"
+        assert [block.string_id for block in elb.plugin_blocks] == [
+            tap.name,
+            target.name,
+            alternative_target.name,
+        ]
+
+    def test_fan_out_not_loader(self, log, project, tap, target) -> None:
+        with pytest.raises(click.ClickException, match="is not a loader"):
+            BlockParser(log, project, [tap.name, f"{target.name},{tap.name}"])
+
+    def test_shards(self, log, project_with_environment, tap, target) -> None:
+        project = project_with_environment
+        parser = BlockParser(log, project, [tap.name, target.name], shards=2)
+
+        (elb,) = parser.find_blocks()
+        assert isinstance(elb, ShardedExtractLoadBlocks)
+        elb.validate_set()
+
+        state_id = f"{project.environment.name}:{tap.name}-to-{target.name}"
+        assert elb.context.job.job_name == state_id
+        assert [shard.context.job.job_name for shard in elb.shards] == [
+            f"{state_id}:shard-1-of-2",
+            f"{state_id}:shard-2-of-2",
+        ]
+        assert [
+            shard.head.invoker.plugin_config_service.run_dir for shard in elb.shards
+        ] == [
+            project.dirs.run(tap.name, "shard-1-of-2"),
+            project.dirs.run(tap.name, "shard-2-of-2"),
+        ]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import typing as t
+from unittest import mock
+
+import pytest
+
+from meltano.core.block.sample import RecordSampler, selected_streams
+from meltano.core.logging.utils import AsyncStreamWriter
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+class LineCollector:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def writeline(self, line: str) -> None:
+        self.lines.append(line)
+
+
+class ClosedWriter(AsyncStreamWriter):
+    def write(self, data: bytes) -> None:  # noqa: ARG002
+        raise BrokenPipeError
+
+    async def drain(self) -> None:
+        pass
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+def message(type_: str, stream: str) -> bytes:
+    return b"%b\n" % json.dumps({"type": type_, "stream": stream}).encode()
+
+
+def test_selected_streams(tmp_path: Path) -> None:
+    catalog_path = tmp_path / "tap.properties.json"
+    assert selected_streams(catalog_path) is None
+
+    catalog_path.write_text(
+        json.dumps(
+            {
+                "streams": [
+                    {
+                        "tap_stream_id": f"public-{stream}",
+                        "stream": stream,
+                        "metadata": [
+                            {"breadcrumb": [], "metadata": {"selected": selected}},
+                        ],
+                    }
+                    for stream, selected in (("users", True), ("audit", False))
+                ],
+            },
+        ),
+    )
+    assert selected_streams(catalog_path) == {"users"}
+
+
+class TestRecordSampler:
+    @pytest.mark.asyncio
+    async def test_sample(self) -> None:
+        writer = LineCollector()
+        on_sampled = mock.Mock()
+        sampler = RecordSampler(writer, 2, {"users", "events"}, on_sampled)
+
+        sampler.write(message("SCHEMA", "users") + message("RECORD", "users"))
+        await sampler.drain()
+        for _ in range(3):
+            sampler.write(message("RECORD", "users"))
+            await sampler.drain()
+        on_sampled.assert_not_called()
+
+        for _ in range(2):
+            sampler.write(message("RECORD", "events"))
+            await sampler.drain()
+        on_sampled.assert_called_once()
+        assert sampler.sampled
+
+        sampler.write(message("STATE", "events"))
+        await sampler.drain()
+
+        assert [json.loads(line)["type"] for line in writer.lines] == [
+            "SCHEMA",
+            "RECORD",
+            "RECORD",
+            "RECORD",
+            "RECORD",
+            "STATE",
+        ]
+        assert sampler.records == {"users": 2, "events": 2}
+        assert sampler.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_sample_unknown_streams(self) -> None:
+        on_sampled = mock.Mock()
+        sampler = RecordSampler(LineCollector(), 1, None, on_sampled)
+
+        for _ in range(2):
+            sampler.write(message("RECORD", "users"))
+            await sampler.drain()
+
+        on_sampled.assert_not_called()
+        assert sampler.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_consumer(self) -> None:
+        sampler = RecordSampler(ClosedWriter(), 1, None, mock.Mock())
+
+        sampler.write(message("RECORD", "users"))
+        with pytest.raises(BrokenPipeError):
+            await sampler.drain()
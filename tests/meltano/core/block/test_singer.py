@@ -217,7 +217,14 @@ class TestSingerBlocks:
                 {"name": "stderr", "event": "err3", "log_level": "info"},
             ]
 
-            assert cap_logs == expected_lines
+            assert [line for line in cap_logs if "name" in line] == expected_lines
+
+        # The high-water marks of stdout are tracked
+        stats = producer.stdout_stats
+        assert stats.lines == 3
+        assert stats.total_bytes == 15
+        assert stats.largest_line == 5
+        assert stats.oversized_lines == 0
 
     @pytest.mark.asyncio
     async def test_singer_block_close_stdin(
@@ -0,0 +1,493 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import struct
+import typing as t
+from contextlib import asynccontextmanager, suppress
+
+import pytest
+
+from meltano.core.container.container_service import (
+    OUTPUT_QUEUE_SIZE,
+    STDIN_CHUNK_SIZE,
+    ContainerOutput,
+    ContainerService,
+    ContainerStdin,
+)
+from meltano.core.container.container_spec import ContainerSpec
+from meltano.core.logging import capture_output_batches
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+pytest.importorskip("aiodocker")
+
+FRAME_HEADER = struct.Struct(">BxxxL")
+
+
+class FakeContainer:
+    """A container of the fake Docker API, running one of the fake images."""
+
+    def __init__(self, config: dict[str, t.Any]) -> None:
+        self.config = config
+        self.stdin: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self.frames: list[bytes] = []
+        self.output_changed = asyncio.Condition()
+        self.exit_code: int | None = None
+        self.exited = asyncio.Event()
+        self.signals: list[str] = []
+        self.deleted = False
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._run())
+
+    async def emit(self, stream: int, data: bytes) -> None:
+        async with self.output_changed:
+            self.frames.append(FRAME_HEADER.pack(stream, len(data)) + data)
+            self.output_changed.notify_all()
+
+    async def _run(self) -> None:
+        image = self.config["Image"]
+        try:
+            self.exit_code = await getattr(self, f"_run_{image.split('/')[-1]}")()
+        except asyncio.CancelledError:
+            self.exit_code = 137
+        async with self.output_changed:
+            self.exited.set()
+            self.output_changed.notify_all()
+
+    async def _run_tap(self) -> int:
+        # Chunks do not line up with lines
+        records = b"".join(
+            b'{"type": "RECORD", "stream": "s", "record": {"id": %d}}\n' % i
+            for i in range(int(self.config["Cmd"][-1]))
+        )
+        for start in range(0, len(records), 1000):
+            await self.emit(1, records[start : start + 1000])
+        await self.emit(2, b"tap log 1\ntap log 2\n")
+        return 0
+
+    async def _run_target(self) -> int:
+        data = bytearray()
+        while (chunk := await self.stdin.get()) is not None:
+            data += chunk
+        await self.emit(2, b"target log\n")
+        await self.emit(
+            1,
+            json.dumps({"lines": data.count(b"\n"), "env": self.config["Env"]}).encode()
+            + b"\n",
+        )
+        return 3 if b"fail" in data else 0
+
+    async def _run_sleep(self) -> int:
+        await asyncio.Event().wait()
+        return 0  # pragma: no cover
+
+    def kill(self, sig: str) -> None:
+        self.signals.append(sig)
+        if self._task is not None:
+            self._task.cancel()
+
+
+class FakeDocker:
+    """A minimal Docker Engine API, served on a unix socket."""
+
+    def __init__(self, socket_path: Path) -> None:
+        self.socket_path = socket_path
+        self.containers: dict[str, FakeContainer] = {}
+        self.attach_queries: list[str] = []
+        self.stdin_writes: list[bytes] = []
+
+    @property
+    def url(self) -> str:
+        return f"unix://{self.socket_path}"
+
+    @asynccontextmanager
+    async def serve(self) -> AsyncGenerator[FakeDocker, None]:
+        server = await asyncio.start_unix_server(
+            self._handle,
+            path=str(self.socket_path),
+        )
+        try:
+            yield self
+        finally:
+            server.close()
+            for container in self.containers.values():
+                container.kill("SIGKILL")
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: str,
+        body: t.Any = None,
+    ) -> None:
+        payload = b"" if body is None else json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n".encode()
+            + payload,
+        )
+        await writer.drain()
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        with suppress(ConnectionError, asyncio.IncompleteReadError):
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                request_line, *header_lines = head.decode().split("\r\n")
+                method, target, _ = request_line.split(" ")
+                headers = {
+                    name.lower(): value
+                    for name, _, value in (
+                        line.partition(": ") for line in header_lines if line
+                    )
+                }
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                if not await self._route(method, target, body, reader, writer):
+                    break
+        writer.close()
+
+    async def _route(
+        self,
+        method: str,
+        target: str,
+        body: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        path, _, query = target.partition("?")
+        if path == "/version":
+            await self._respond(writer, "200 OK", {"ApiVersion": "1.43"})
+            return True
+
+        if path == "/v1.43/containers/create":
+            container_id = f"container{len(self.containers)}"
+            self.containers[container_id] = FakeContainer(json.loads(body))
+            await self._respond(writer, "201 Created", {"Id": container_id})
+            return True
+
+        match = re.fullmatch(r"/v1\.43/containers/(\w+)(?:/(\w+))?", path)
+        assert match, target
+        container = self.containers[match[1]]
+        action = match[2]
+        if action == "start":
+            container.start()
+            await self._respond(writer, "204 No Content")
+        elif action == "json":
+            await self._respond(
+                writer,
+                "200 OK",
+                {"Id": match[1], "Config": {"Tty": False}},
+            )
+        elif action == "attach":
+            self.attach_queries.append(query)
+            writer.write(
+                b"HTTP/1.1 101 UPGRADED\r\n"
+                b"Content-Type: application/vnd.docker.raw-stream\r\n"
+                b"Connection: Upgrade\r\nUpgrade: tcp\r\n\r\n",
+            )
+            await writer.drain()
+            if "stdin=1" in query:
+                await self._attach_stdin(container, reader)
+            else:
+                await self._attach_output(container, writer)
+            return False
+        elif action == "wait":
+            await container.exited.wait()
+            await self._respond(writer, "200 OK", {"StatusCode": container.exit_code})
+        elif action == "kill":
+            container.kill(query.removeprefix("signal="))
+            await self._respond(writer, "204 No Content")
+        elif method == "DELETE":
+            container.deleted = True
+            await self._respond(writer, "204 No Content")
+        else:  # pragma: no cover
+            await self._respond(writer, "404 Not Found", {"message": target})
+        return True
+
+    async def _attach_stdin(
+        self,
+        container: FakeContainer,
+        reader: asyncio.StreamReader,
+    ) -> None:
+        while chunk := await reader.read(2**20):
+            self.stdin_writes.append(chunk)
+            await container.stdin.put(chunk)
+        await container.stdin.put(None)
+
+    async def _attach_output(
+        self,
+        container: FakeContainer,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        sent = 0
+        while True:
+            async with container.output_changed:
+                await container.output_changed.wait_for(
+                    lambda sent=sent: (
+                        len(container.frames) > sent or container.exited.is_set()
+                    ),
+                )
+                frames = container.frames[sent:]
+                done = container.exited.is_set()
+            sent += len(frames)
+            writer.write(b"".join(frames))
+            await writer.drain()
+            if done and sent == len(container.frames):
+                return
+
+
+class LineCollector:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def writeline(self, line: str) -> None:
+        self.lines.append(line)
+
+
+class FakeStream:
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+        self.closed = False
+
+    async def write_in(self, data: bytes) -> None:
+        self.writes.append(data)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestContainerOutput:
+    @pytest.mark.asyncio
+    async def test_readline(self) -> None:
+        subject = ContainerOutput()
+        for chunk in (b"a\nb", b"c", b"\nd\n", b"e", None):
+            await subject.feed(chunk)
+
+        assert [await subject.readline() for _ in range(4)] == [
+            b"a\n",
+            b"bc\n",
+            b"d\n",
+            b"e",
+        ]
+        assert subject.at_eof()
+        assert await subject.readline() == b""
+
+    @pytest.mark.asyncio
+    async def test_readlines(self) -> None:
+        subject = ContainerOutput()
+        for chunk in (b"a\nb", b"c", b"\nd\ne", None):
+            await subject.feed(chunk)
+
+        assert await subject.readlines() == [b"a\n"]
+        # All complete lines of the buffered chunks are read at once
+        assert await subject.readlines() == [b"bc\n", b"d\n"]
+        assert await subject.readlines() == [b"e"]
+        assert subject.at_eof()
+
+    @pytest.mark.asyncio
+    async def test_feed_waits_for_reader(self) -> None:
+        subject = ContainerOutput()
+        for _ in range(OUTPUT_QUEUE_SIZE - 1):
+            await subject.feed(b"line\n")
+
+        feed = asyncio.ensure_future(subject.feed(b"line\n"))
+        await asyncio.sleep(0)
+        assert not feed.done()
+
+        await subject.readline()
+        await asyncio.wait_for(feed, timeout=1)
+
+        # Once released, chunks are buffered without waiting
+        subject.release()
+        for _ in range(OUTPUT_QUEUE_SIZE * 2):
+            await asyncio.wait_for(subject.feed(b"line\n"), timeout=1)
+
+
+class TestContainerStdin:
+    @pytest.mark.asyncio
+    async def test_batches_writes(self) -> None:
+        stream = FakeStream()
+        subject = ContainerStdin(stream)  # type: ignore[arg-type]
+
+        for _ in range(3):
+            subject.write(b"small\n")
+            await subject.drain()
+        assert not stream.writes
+
+        # Small writes are sent together once the flush interval elapsed
+        await asyncio.sleep(0.1)
+        assert stream.writes == [b"small\n" * 3]
+
+        subject.write(b"x" * STDIN_CHUNK_SIZE)
+        await subject.drain()
+        assert stream.writes[-1] == b"x" * STDIN_CHUNK_SIZE
+
+        subject.write(b"last\n")
+        subject.close()
+        await subject.wait_closed()
+        assert stream.writes[-1] == b"last\n"
+        assert stream.closed
+
+        with pytest.raises(BrokenPipeError):
+            subject.write(b"more\n")
+
+
+class TestContainerService:
+    @pytest.fixture
+    def socket_path(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        # Unix socket paths are limited in length, so `tmp_path` may be too long
+        return tmp_path_factory.mktemp("docker", numbered=True) / "d.sock"
+
+    @pytest.mark.asyncio
+    async def test_start_container_producer(self, socket_path: Path) -> None:
+        async with FakeDocker(socket_path).serve() as docker:
+            subject = ContainerService(url=docker.url)
+            spec = ContainerSpec(image="fake/tap")
+
+            process = await subject.start_container(
+                spec,
+                "meltano-tap",
+                args=["--config", "config.json", "500"],
+            )
+            assert process.stdin is None
+
+            stdout, stderr = LineCollector(), LineCollector()
+            await asyncio.gather(
+                capture_output_batches(process.stdout, stdout),
+                capture_output_batches(process.stderr, stderr),
+                process.wait(),
+            )
+
+            assert process.returncode == 0
+            assert await process.wait() == 0
+            assert len(stdout.lines) == 500
+            assert json.loads(stdout.lines[-1])["record"] == {"id": 499}
+            assert stderr.lines == ["tap log 1\n", "tap log 2\n"]
+
+            (container,) = docker.containers.values()
+            assert container.config["Cmd"] == ["--config", "config.json", "500"]
+            assert not container.config["OpenStdin"]
+            assert container.deleted
+            assert docker.attach_queries == [
+                "detachKeys=&logs=1&stdin=0&stdout=1&stderr=1&stream=1",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_start_container_consumer(self, socket_path: Path) -> None:
+        async with FakeDocker(socket_path).serve() as docker:
+            subject = ContainerService(url=docker.url)
+            producer = await subject.start_container(
+                ContainerSpec(image="fake/tap"),
+                "meltano-tap",
+                args=["1000"],
+            )
+            consumer = await subject.start_container(
+                ContainerSpec(image="fake/target", command="target"),
+                "meltano-target",
+                args=["ignored"],
+                env={"TARGET_SETTING": "value"},
+                attach_stdin=True,
+            )
+            assert consumer.stdin is not None
+
+            state = LineCollector()
+
+            async def pipe() -> None:
+                await capture_output_batches(producer.stdout, consumer.stdin)
+                await consumer.stdin.wait_closed()
+
+            await asyncio.gather(
+                pipe(),
+                capture_output_batches(producer.stderr, LineCollector()),
+                capture_output_batches(consumer.stdout, state),
+                capture_output_batches(consumer.stderr, LineCollector()),
+                producer.wait(),
+                consumer.wait(),
+            )
+
+            assert consumer.returncode == 0
+            (line,) = state.lines
+            result = json.loads(line)
+            assert result["lines"] == 1000
+            assert "TARGET_SETTING=value" in result["env"]
+
+            target = docker.containers["container1"]
+            assert target.config["Cmd"] == ["target"]
+            assert target.config["OpenStdin"]
+            assert target.config["StdinOnce"]
+            # The records were sent in batches, not line by line
+            assert 0 < len(docker.stdin_writes) < 100
+
+    @pytest.mark.asyncio
+    async def test_start_container_consumer_without_input(
+        self,
+        socket_path: Path,
+    ) -> None:
+        async with FakeDocker(socket_path).serve() as docker:
+            subject = ContainerService(url=docker.url)
+            consumer = await subject.start_container(
+                ContainerSpec(image="fake/target"),
+                "meltano-target",
+                attach_stdin=True,
+            )
+            assert consumer.stdin is not None
+            consumer.stdin.close()
+
+            state = LineCollector()
+            await asyncio.gather(
+                capture_output_batches(consumer.stdout, state),
+                capture_output_batches(consumer.stderr, LineCollector()),
+                consumer.wait(),
+            )
+            assert json.loads(state.lines[0])["lines"] == 0
+
+    @pytest.mark.asyncio
+    async def test_start_container_attach_error(
+        self,
+        socket_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def write_in(self, data: bytes) -> None:  # noqa: ARG001
+            raise ConnectionResetError
+
+        monkeypatch.setattr("aiodocker.stream.Stream.write_in", write_in)
+        async with FakeDocker(socket_path).serve() as docker:
+            subject = ContainerService(url=docker.url)
+            with pytest.raises(ConnectionResetError):
+                await subject.start_container(
+                    ContainerSpec(image="fake/target"),
+                    "meltano-target",
+                    attach_stdin=True,
+                )
+
+            # The container that could not be attached to is removed
+            (container,) = docker.containers.values()
+            assert container.deleted
+
+    @pytest.mark.asyncio
+    async def test_kill(self, socket_path: Path) -> None:
+        async with FakeDocker(socket_path).serve() as docker:
+            subject = ContainerService(url=docker.url)
+            process = await subject.start_container(
+                ContainerSpec(image="fake/sleep"),
+                "meltano-sleep",
+            )
+            process.terminate()
+            assert await asyncio.wait_for(process.wait(), timeout=5) == 137
+
+            (container,) = docker.containers.values()
+            assert container.signals == ["SIGTERM"]
+            assert container.deleted
+
+            # Signals to a removed container are ignored
+            process.kill()
+            await asyncio.sleep(0.05)
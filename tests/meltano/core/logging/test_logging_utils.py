@@ -12,6 +12,7 @@ import time_machine
 from meltano.core.logging.utils import (
     LEVELS,
     LogFormat,
+    OutputStats,
     SafeStreamHandler,
     capture_subprocess_output,
     default_config,
@@ -49,6 +50,70 @@ async def test_capture_subprocess_output() -> None:
     assert output_lines == ["LINE\n", "LINE 2\n", "�\n"]
 
 
+class TestCaptureSubprocessOutputLineLength:
+    class LineWriter:
+        def __init__(self) -> None:
+            self.lines: list[str] = []
+
+        def writeline(self, line: str) -> None:
+            self.lines.append(line)
+
+    def reader(self, data: bytes) -> asyncio.StreamReader:
+        reader = asyncio.StreamReader(limit=16)
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    @pytest.mark.asyncio
+    async def test_limit(self) -> None:
+        reader = self.reader(b"short\n" + b"x" * 40 + b"\n")
+        writer = self.LineWriter()
+
+        with pytest.raises(ValueError) as excinfo:  # noqa: PT011
+            await capture_subprocess_output(reader, writer)
+
+        assert isinstance(excinfo.value.__context__, asyncio.LimitOverrunError)
+        assert writer.lines == ["short\n"]
+
+    @pytest.mark.asyncio
+    async def test_max_line_length(self) -> None:
+        long_line = b"x" * 40 + b"\n"
+        reader = self.reader(b"short\n" + long_line + b"y" * 100 + b"\nend")
+        writer = self.LineWriter()
+        stats = OutputStats()
+
+        await capture_subprocess_output(
+            reader,
+            writer,
+            max_line_length=128,
+            stats=stats,
+        )
+
+        assert writer.lines == [
+            "short\n",
+            long_line.decode(),
+            "y" * 100 + "\n",
+            "end",
+        ]
+        assert stats == OutputStats(
+            lines=4,
+            total_bytes=6 + 41 + 101 + 3,
+            largest_line=101,
+            oversized_lines=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_max_line_length_exceeded(self) -> None:
+        reader = self.reader(b"short\n" + b"x" * 200 + b"\n")
+        writer = self.LineWriter()
+
+        with pytest.raises(ValueError) as excinfo:  # noqa: PT011
+            await capture_subprocess_output(reader, writer, max_line_length=128)
+
+        assert isinstance(excinfo.value.__context__, asyncio.LimitOverrunError)
+        assert writer.lines == ["short\n"]
+
+
 @pytest.mark.parametrize(
     ("log_format", "force_color", "no_color", "isatty", "expected"),
     (
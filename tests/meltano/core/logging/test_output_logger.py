@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import logging.handlers
 import platform
 import sys
 import tempfile
@@ -302,6 +304,77 @@ class TestOutputLogger:
         assert log_content.get("event") == "exception"
         assert log_content.get("exc_info")
 
+    def test_redirect_log_handler_default(self, subject: OutputLogger) -> None:
+        handler = subject.out("logging").redirect_log_handler
+        assert type(handler) is logging.FileHandler
+        handler.close()
+
+    @pytest.mark.parametrize("compress", (False, True))
+    def test_redirect_log_handler_rotation(
+        self,
+        tmp_path: Path,
+        compress: bool,  # noqa: FBT001
+    ) -> None:
+        log_path = tmp_path / "elt.log"
+        output_logger = OutputLogger(
+            log_path,
+            max_bytes=100,
+            backup_count=2,
+            compress=compress,
+        )
+        handler = output_logger.out("logging").redirect_log_handler
+        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+
+        test_logger = logging.getLogger("test_redirect_log_handler_rotation")  # noqa: TID251
+        test_logger.propagate = False
+        test_logger.addHandler(handler)
+        try:
+            for i in range(20):
+                test_logger.warning("Line %d", i)
+        finally:
+            test_logger.removeHandler(handler)
+            handler.close()
+
+        suffix = ".gz" if compress else ""
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "elt.log",
+            f"elt.log.1{suffix}",
+            f"elt.log.2{suffix}",
+        ]
+        assert "Line 19" in log_path.read_text()
+        if compress:
+            with gzip.open(tmp_path / "elt.log.1.gz", "rt") as f:
+                assert "Line" in f.read()
+
+    def test_redirect_log_handler_shared(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "elt.log"
+        output_logger = OutputLogger(log_path, max_bytes=100, backup_count=2)
+        first, second = output_logger.out("first"), output_logger.out("second")
+
+        # A single handler writes to and rotates the file
+        handler = first.redirect_log_handler
+        assert second.redirect_log_handler is handler
+
+        root_logger = logging.getLogger()  # noqa: TID251
+        with first.redirect_logging():
+            with second.redirect_logging():
+                assert root_logger.handlers.count(handler) == 1
+                for i in range(10):
+                    logging.warning("Line %d", i)
+            assert handler in root_logger.handlers
+            for i in range(10, 20):
+                logging.warning("Line %d", i)
+        assert handler not in root_logger.handlers
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "elt.log",
+            "elt.log.1",
+            "elt.log.2",
+        ]
+        assert "Line 19" in log_path.read_text()
+        # Every rotated segment is within the size limit
+        assert all(path.stat().st_size <= 100 for path in tmp_path.iterdir())
+
     def test_writeline_with_singer_sdk_parser(
         self,
         subject: OutputLogger,
@@ -443,8 +516,10 @@ class TestOutputLogger:
         subject: OutputLogger,
         log_output: LogCapture,
         valid_singer_sdk_log: dict[str, t.Any],
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test writeline with Singer SDK logs at different levels."""
+        caplog.set_level(logging.DEBUG)
         out = subject.out("test_levels", log_parser="singer-sdk")
 
         # Test different log levels
@@ -464,6 +539,45 @@ class TestOutputLogger:
             assert entry["log_level"] == level.lower()
             assert entry["name"] == "test_levels"
 
+    @pytest.mark.parametrize(
+        "line_level",
+        (
+            pytest.param("debug", id="sniffed"),
+            pytest.param(None, id="parsed"),
+        ),
+    )
+    def test_writeline_drops_lines_below_level(
+        self,
+        subject: OutputLogger,
+        log_output: LogCapture,
+        valid_singer_sdk_log: dict[str, t.Any],
+        caplog: pytest.LogCaptureFixture,
+        line_level: str | None,
+    ) -> None:
+        """Test that lines below the logger level are dropped before parsing."""
+        caplog.set_level(logging.WARNING)
+        out = subject.out("test_drop", log_parser="singer-sdk")
+
+        if line_level:
+            log_line = json.dumps(valid_singer_sdk_log | {"level": line_level})
+        else:
+            # The level is not the first field, so it can't be sniffed
+            log = valid_singer_sdk_log | {"level": "debug"}
+            log_line = json.dumps({"pid": log.pop("pid"), **log})
+
+        with mock.patch.object(
+            out._parser_factory,
+            "parse_line",
+            wraps=out._parser_factory.parse_line,
+        ) as parse_line:
+            out.writeline(log_line)
+            out.writeline("Unparsable line at the default INFO level")
+            out.writeline(json.dumps(valid_singer_sdk_log | {"level": "error"}))
+
+        assert parse_line.call_count == (2 if line_level else 3)
+        assert [entry["log_level"] for entry in log_output.entries] == ["error"]
+        assert out.last_line.startswith("{")
+
     def test_writeline_with_custom_write_level(
         self,
         subject: OutputLogger,
@@ -619,6 +733,7 @@ class TestOutputLogger:
             logger_name="mocked.logger",
         )
         mock_parser.parse_line.return_value = mock_parsed_record
+        mock_parser.sniff_level.return_value = None
 
         mock_factory.return_value = mock_parser
 
@@ -650,6 +765,7 @@ class TestOutputLogger:
             # Setup mock parser that returns None (parsing failed)
             mock_parser = mock.Mock()
             mock_parser.parse_line.return_value = None
+            mock_parser.sniff_level.return_value = None
             mock_factory.return_value = mock_parser
 
             out = subject.out("test_parse_none", log_parser="failing-parser")
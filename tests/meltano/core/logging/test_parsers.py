@@ -235,6 +235,40 @@ class TestSingerSDKLogParser:
         result = self.parser.parse("missing opening brace}")
         assert result is None
 
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        (
+            pytest.param("debug", logging.DEBUG, id="debug"),
+            pytest.param("WARNING", logging.WARNING, id="warning-upper"),
+            pytest.param("Warning", logging.WARNING, id="warning-mixed"),
+            pytest.param("warn", logging.WARNING, id="warn"),
+            pytest.param("Error", logging.ERROR, id="error-mixed"),
+            pytest.param("unknown", logging.INFO, id="unknown"),
+        ),
+    )
+    def test_sniff_level(self, log: dict[str, t.Any], level: str, expected: int):
+        """Test reading the level of a log line without parsing it."""
+        log["level"] = level
+        assert self.parser.sniff_level(json.dumps(log)) == expected
+
+    def test_sniff_level_not_sdk_log(self):
+        """Test sniffing the level of lines that are not SDK logs."""
+        assert self.parser.sniff_level("INFO - Some log message") is None
+        assert self.parser.sniff_level('{"message": "x", "level": "info"}') is None
+
+    def test_parse_does_not_retry_preferred_parser(self):
+        """Test that a failing preferred parser is not tried twice."""
+        factory = LogParserFactory()
+        with patch.object(
+            SingerSDKLogParser,
+            "parse",
+            autospec=True,
+            return_value=None,
+        ) as mock_parse:
+            factory.parse_line("Not JSON", "singer-sdk")
+
+        assert mock_parse.call_count == 1
+
 
 class TestPassthroughLogParser:
     """Test PassthroughLogParser class."""
@@ -21,6 +21,7 @@ from meltano.core.plugin.singer.catalog import (
     path_property,
     select_filter_metadata_rules,
     select_metadata_rules,
+    shard_catalog,
     visit,
 )
 from meltano.core.plugin.singer.catalog import property_breadcrumb as bc
@@ -1870,6 +1871,48 @@ class TestListExecutor:
         }
 
 
+class TestShardCatalog:
+    @pytest.fixture
+    def catalog(self):
+        def stream(stream_id: str, *, selected: bool) -> dict[str, t.Any]:
+            return {
+                "tap_stream_id": stream_id,
+                "stream": stream_id,
+                "schema": {"type": "object", "properties": {}},
+                "metadata": [{"breadcrumb": [], "metadata": {"selected": selected}}],
+            }
+
+        return {
+            "streams": [
+                stream("users", selected=True),
+                stream("events", selected=True),
+                stream("audit", selected=False),
+                stream("accounts", selected=True),
+            ],
+        }
+
+    def test_shard_catalog(self, catalog) -> None:
+        first, second = shard_catalog(catalog, 2)
+
+        assert [stream["tap_stream_id"] for stream in first["streams"]] == [
+            "users",
+            "audit",
+            "accounts",
+        ]
+        assert [stream["tap_stream_id"] for stream in second["streams"]] == [
+            "events",
+            "audit",
+        ]
+
+    def test_shard_catalog_excess_shards(self, catalog) -> None:
+        shards = shard_catalog(catalog, 5)
+        assert len(shards) == 3
+
+        deselect = SelectExecutor(["!*.*"])
+        deselect.visit(catalog)
+        assert shard_catalog(catalog, 2) == []
+
+
 class TestSelectPattern:
     def test_parse(self) -> None:
         parse = SelectPattern.parse
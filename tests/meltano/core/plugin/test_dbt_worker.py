@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import os
+import sys
+import textwrap
+import typing as t
+from unittest import mock
+
+import pytest
+
+from meltano.core.plugin.dbt.worker import (
+    DbtWorker,
+    DbtWorkerError,
+    DbtWorkerExitedError,
+    DbtWorkerPool,
+)
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+
+FAKE_DBT_RUNNER = """
+import os
+import sys
+
+
+class Result:
+    def __init__(self, success, result=None):
+        self.success = success
+        self.result = result
+        self.exception = None
+
+
+class dbtRunner:
+    parses = 0
+
+    def __init__(self, manifest=None):
+        self.manifest = manifest
+
+    def invoke(self, args):
+        if args[0] == "parse":
+            dbtRunner.parses += 1
+            return Result(True, result=f"manifest-{dbtRunner.parses}")
+        print(f"{' '.join(args)}: {self.manifest}")
+        print("dbt stderr", file=sys.stderr)
+        if "crash" in args:
+            sys.stdout.flush()
+            os._exit(3)
+        return Result("fail" not in args)
+"""
+
+
+class LineCollector:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def writeline(self, line: str) -> None:
+        self.lines.append(line.rstrip("\n"))
+
+
+class TestDbtWorker:
+    @pytest.fixture
+    def fake_dbt_path(self, tmp_path: Path) -> Path:
+        cli_dir = tmp_path / "dbt" / "cli"
+        cli_dir.mkdir(parents=True)
+        (tmp_path / "dbt" / "__init__.py").touch()
+        (cli_dir / "__init__.py").touch()
+        (cli_dir / "main.py").write_text(textwrap.dedent(FAKE_DBT_RUNNER))
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_invoke(self, fake_dbt_path: Path) -> None:
+        env = {**os.environ, "PYTHONPATH": str(fake_dbt_path)}
+        worker = await DbtWorker.start(sys.executable, env)
+
+        async def invoke(*args: str, reuse_manifest: bool = True) -> tuple[int, str]:
+            stdout, stderr = LineCollector(), LineCollector()
+            exit_code = await worker.invoke(
+                args,
+                reuse_manifest=reuse_manifest,
+                stdout=[stdout],
+                stderr=[stderr],
+            )
+            assert stdout.lines
+            # All of the stderr output of the command is relayed before it ends
+            assert stderr.lines == ["dbt stderr"]
+            return exit_code, stdout.lines[-1]
+
+        try:
+            assert await invoke("run", reuse_manifest=False) == (0, "run: manifest-1")
+            assert await invoke("test") == (0, "test: manifest-1")
+            assert await invoke("--log-format", "json", "run", "fail") == (
+                1,
+                "--log-format json run fail: manifest-1",
+            )
+
+            # Options that change how the project is parsed
+            assert await invoke("run", "--vars={}") == (0, "run --vars={}: None")
+            assert await invoke("run") == (0, "run: manifest-1")
+
+            # Commands that change the project files
+            assert await invoke("deps") == (0, "deps: None")
+            assert await invoke("run") == (0, "run: manifest-2")
+
+            assert await invoke("run", reuse_manifest=False) == (0, "run: manifest-3")
+        finally:
+            await worker.stop()
+
+        assert worker.process.returncode == 0
+
+    @pytest.mark.asyncio
+    async def test_exit_during_command(self, fake_dbt_path: Path) -> None:
+        env = {**os.environ, "PYTHONPATH": str(fake_dbt_path)}
+        worker = await DbtWorker.start(sys.executable, env)
+
+        stdout = LineCollector()
+        try:
+            with pytest.raises(DbtWorkerExitedError, match="while running"):
+                await worker.invoke(
+                    ["run", "crash"],
+                    reuse_manifest=False,
+                    stdout=[stdout],
+                    stderr=[],
+                )
+        finally:
+            await worker.stop()
+
+        assert stdout.lines == ["run crash: manifest-1"]
+        assert worker.process.returncode == 3
+
+        # The worker is not running anymore, so commands are not sent to it
+        with pytest.raises(DbtWorkerError, match="not running") as excinfo:
+            await worker.invoke(["run"], reuse_manifest=False, stdout=[], stderr=[])
+        assert not isinstance(excinfo.value, DbtWorkerExitedError)
+
+    @pytest.mark.asyncio
+    async def test_start_unsupported(self, tmp_path: Path) -> None:
+        env = {**os.environ, "PYTHONPATH": str(tmp_path)}
+        with pytest.raises(DbtWorkerError, match="not supported"):
+            await DbtWorker.start(sys.executable, env)
+
+
+class TestDbtWorkerPool:
+    def test_supports(
+        self,
+        dbt: ProjectPlugin,
+        tap: ProjectPlugin,
+        plugin_invoker_factory,
+    ) -> None:
+        subject = DbtWorkerPool()
+        dbt_invoker = plugin_invoker_factory(dbt)
+        assert subject.supports(dbt_invoker, None)
+        assert not subject.supports(dbt_invoker, "unknown")
+        assert not subject.supports(plugin_invoker_factory(tap), None)
+
+    @pytest.mark.asyncio
+    async def test_fallback(
+        self,
+        session,
+        dbt: ProjectPlugin,
+        plugin_invoker_factory,
+    ) -> None:
+        subject = DbtWorkerPool()
+        invoker = plugin_invoker_factory(dbt)
+
+        with mock.patch.object(
+            DbtWorker,
+            "start",
+            side_effect=DbtWorkerError("dbt worker is not supported"),
+        ) as start:
+            async with invoker.prepared(session):
+                assert (
+                    await invoker.invoke_dbt_worker(subject, stdout=[], stderr=[])
+                    is None
+                )
+                start.assert_called_once()
+
+                # Commands of the plugin are not tried in a worker again
+                assert not subject.supports(invoker, None)
+                assert (
+                    await invoker.invoke_dbt_worker(subject, stdout=[], stderr=[])
+                    is None
+                )
+                start.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_exit_during_command(
+        self,
+        session,
+        dbt: ProjectPlugin,
+        plugin_invoker_factory,
+    ) -> None:
+        subject = DbtWorkerPool()
+        invoker = plugin_invoker_factory(dbt)
+
+        worker = mock.Mock(
+            invoke=mock.AsyncMock(side_effect=DbtWorkerExitedError("exited")),
+            stop=mock.AsyncMock(),
+        )
+        worker.process.returncode = -9
+
+        with mock.patch.object(DbtWorker, "start", return_value=worker) as start:
+            async with invoker.prepared(session):
+                # The command fails instead of being run again in a new process
+                assert (
+                    await invoker.invoke_dbt_worker(subject, stdout=[], stderr=[]) == -9
+                )
+                start.assert_called_once()
+                worker.invoke.assert_called_once()
+                worker.stop.assert_called_once()
+
+                # Later commands of the plugin are run in a new process
+                assert not subject.supports(invoker, None)
@@ -1109,6 +1109,31 @@ class TestPluginSettingsService:
         subject.set("aliased_3", "value_3")
         assert subject.get("aliased") == "value_3"
 
+    def test_find_setting_index(self, tap, plugin_settings_service_factory) -> None:
+        subject = plugin_settings_service_factory(tap)
+        aliased = subject.find_setting("aliased")
+        assert aliased is not None
+        assert subject.find_setting("aliased_3") is aliased
+
+        definitions = list(subject.definitions())
+        assert subject.definitions(extras=True) == [
+            setting_def for setting_def in definitions if setting_def.is_extra
+        ]
+        assert subject.definitions(extras=False) == [
+            setting_def for setting_def in definitions if not setting_def.is_extra
+        ]
+
+        # Custom settings added to `meltano.yml` are picked up
+        assert subject.find_setting("custom_setting") is None
+        with pytest.warns(RuntimeWarning, match="Unknown setting"):
+            subject.set("custom_setting", "value")
+        try:
+            custom_setting = subject.find_setting("custom_setting")
+            assert custom_setting is not None
+            assert custom_setting in subject.definitions(extras=False)
+        finally:
+            subject.unset("custom_setting")
+
     @pytest.mark.order(-1)
     def test_strict_env_var_mode_on_raises_error(self, subject) -> None:
         subject.project_settings_service.set(
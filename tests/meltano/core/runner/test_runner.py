@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 import typing as t
 from unittest import mock
 from unittest.mock import AsyncMock
@@ -10,6 +11,8 @@ from meltano.core._state import StateStrategy
 from meltano.core.job import Job, Payload, State
 from meltano.core.logging.utils import capture_subprocess_output
 from meltano.core.plugin_invoker import PluginInvoker
+from meltano.core.runner import RunnerError
+from meltano.core.runner.dbt import DbtRunner
 from meltano.core.runner.singer import SingerRunner
 
 if t.TYPE_CHECKING:
@@ -290,3 +293,77 @@ class TestSingerRunner:
                 extractor_out=None,
                 loader_out=None,
             )
+
+
+class TestDbtRunner:
+    @pytest.fixture
+    def subject(self, session, tap, target, dbt, elt_context_builder):  # noqa: ARG002
+        job = Job(job_name="pytest_test_runner")
+        elt_context = (
+            elt_context_builder.with_session(session)
+            .with_extractor(tap.name)
+            .with_job(job)
+            .with_loader(target.name)
+            .with_transform("run")
+            .context()
+        )
+        return DbtRunner(elt_context)
+
+    @pytest.fixture
+    def project_dir(self, project):
+        project_dir = project.root / "transform"
+        project_dir.mkdir(exist_ok=True)
+        project_dir.joinpath("dbt_project.yml").write_text(
+            "name: my_meltano_project\npackages-install-path: dbt_packages\n",
+        )
+        project_dir.joinpath("packages.yml").write_text("packages: []\n")
+        yield project_dir
+        shutil.rmtree(project_dir)
+        shutil.rmtree(project.dirs.run("dbt"), ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_run_skips_deps(self, subject, project_dir: Path) -> None:
+        def commands(invoke) -> list[str]:
+            return [call.kwargs["command"] for call in invoke.call_args_list]
+
+        with mock.patch.object(DbtRunner, "invoke", new=AsyncMock()) as invoke:
+            await subject.run()
+            assert commands(invoke) == ["clean", "deps", "run"]
+
+            # `dbt deps` did not create the packages directory
+            invoke.reset_mock()
+            await subject.run()
+            assert commands(invoke) == ["clean", "deps", "run"]
+
+            invoke.reset_mock()
+            project_dir.joinpath("dbt_packages").mkdir()
+            await subject.run()
+            assert commands(invoke) == ["run"]
+
+            invoke.reset_mock()
+            project_dir.joinpath("packages.yml").write_text(
+                "packages:\n  - package: dbt-labs/dbt_utils\n",
+            )
+            await subject.run()
+            assert commands(invoke) == ["clean", "deps", "run"]
+
+            invoke.reset_mock()
+            subject.context.force_dbt_deps = True
+            await subject.run()
+            assert commands(invoke) == ["clean", "deps", "run"]
+
+    @pytest.mark.asyncio
+    async def test_run_deps_failed(self, subject, project_dir: Path) -> None:  # noqa: ARG002
+        with mock.patch.object(DbtRunner, "invoke", new=AsyncMock()) as invoke:
+            invoke.side_effect = [None, RunnerError("`dbt deps` failed")]
+            with pytest.raises(RunnerError):
+                await subject.run()
+
+            invoke.side_effect = None
+            invoke.reset_mock()
+            await subject.run()
+            assert [call.kwargs["command"] for call in invoke.call_args_list] == [
+                "clean",
+                "deps",
+                "run",
+            ]
@@ -3,11 +3,13 @@ from __future__ import annotations
 import typing as t
 from dataclasses import dataclass
 from textwrap import dedent
+from unittest import mock
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 from meltano.core.migration_service import MigrationError, MigrationService
+from meltano.migrations import LOCK_PATH, MIGRATION_DIR
 
 if t.TYPE_CHECKING:
     import sys
@@ -131,3 +133,45 @@ class TestMigrationService:
             migration_service.upgrade()
 
         assert isinstance(exc.value.__cause__, ZeroDivisionError)
+
+    def test_is_up_to_date(self, engine: Engine, tmp_path: Path) -> None:
+        lock_path = tmp_path / "db.lock"
+        lock_path.write_text("000000000002\n")
+        migration_service = MigrationService(
+            engine=engine,
+            lock_path=lock_path,
+            migration_directory=tmp_path,
+        )
+
+        # No `alembic_version` table yet
+        assert not migration_service.is_up_to_date()
+
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE alembic_version (version_num TEXT)"))
+            conn.execute(text("INSERT INTO alembic_version VALUES ('000000000001')"))
+        assert not migration_service.is_up_to_date()
+
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE alembic_version SET version_num='000000000002'"))
+        assert migration_service.is_up_to_date()
+
+        # Alembic and the migration scripts are not loaded
+        with mock.patch.object(
+            MigrationService,
+            "ensure_migration_needed",
+        ) as ensure_migration_needed:
+            migration_service.upgrade()
+        ensure_migration_needed.assert_not_called()
+
+        lock_path.unlink()
+        assert not migration_service.is_up_to_date()
+
+
+def test_lock_is_head() -> None:
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    cfg = Config()
+    cfg.set_main_option("script_location", str(MIGRATION_DIR))
+    script = ScriptDirectory.from_config(cfg)
+    assert script.get_current_head() == LOCK_PATH.read_text().strip()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import typing as t
+
+import pytest
+
+from meltano.core.plugin import PluginType
+from meltano.core.plugin_install_manifest import InstallDrift, PluginInstallManifest
+from meltano.core.project_plugins_service import PluginAlreadyAddedException
+from meltano.core.venv_service import VirtualEnv
+
+if t.TYPE_CHECKING:
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+    from meltano.core.project_add_service import ProjectAddService
+
+
+class TestPluginInstallManifest:
+    @pytest.fixture
+    def venv(self, project: Project, tap: ProjectPlugin):
+        root = project.dirs.venvs(tap.type, tap.plugin_dir_name, make_dirs=False)
+        shutil.rmtree(root, ignore_errors=True)
+        venv = VirtualEnv(root)
+        venv.bin_dir.mkdir(parents=True)
+        venv.exec_path("python").symlink_to(sys.executable)
+        venv.write_fingerprint([tap.pip_url])
+        yield venv
+        shutil.rmtree(root, ignore_errors=True)
+        project.dirs.run("plugin_install_manifest.json").unlink(missing_ok=True)
+
+    def test_drift(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        venv: VirtualEnv,
+    ) -> None:
+        subject = PluginInstallManifest(project)
+        assert subject.drift(tap) is InstallDrift.NOT_RECORDED
+        assert subject.pending([tap]) == [tap]
+
+        subject.record([tap])
+        subject.save()
+
+        subject = PluginInstallManifest(project)
+        assert subject.drift(tap) is None
+        assert subject.pending([tap]) == []
+
+        venv.write_fingerprint(["something-else"])
+        assert subject.drift(tap) is InstallDrift.REQUIREMENTS_CHANGED
+
+        venv.write_fingerprint([tap.pip_url])
+        python = venv.exec_path("python")
+        python.unlink()
+        python.symlink_to(os.devnull)
+        assert subject.drift(tap) is InstallDrift.INTERPRETER_CHANGED
+
+        shutil.rmtree(venv.root)
+        assert subject.drift(tap) is InstallDrift.NOT_INSTALLED
+
+    def test_record_forgets_outdated(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        venv: VirtualEnv,
+    ) -> None:
+        subject = PluginInstallManifest(project)
+        subject.record([tap])
+        assert subject.drift(tap) is None
+
+        venv.write_fingerprint(["something-else"])
+        subject.record([tap])
+        venv.write_fingerprint([tap.pip_url])
+        assert subject.drift(tap) is InstallDrift.NOT_RECORDED
+
+    def test_always_installed(
+        self,
+        project: Project,
+        project_add_service: ProjectAddService,
+    ) -> None:
+        try:
+            files = project_add_service.add(PluginType.FILES, "docker-compose")
+        except PluginAlreadyAddedException as err:
+            files = err.plugin
+        subject = PluginInstallManifest(project)
+        assert subject.drift(files) is InstallDrift.ALWAYS
+        assert subject.pending([files]) == [files]
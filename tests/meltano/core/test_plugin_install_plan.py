@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from meltano.core.plugin import PluginType
+from meltano.core.plugin.project_plugin import ProjectPlugin
+from meltano.core.plugin_install_plan import (
+    InstallDurations,
+    plan_installs,
+    requirement_keys,
+)
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_requirement_keys() -> None:
+    assert requirement_keys(
+        [
+            "Tap_Foo==1.0",
+            "singer-sdk[faker]>=0.40",
+            "--upgrade",
+            "git+https://github.com/example/tap-bar.git",
+        ],
+    ) == {"tap-foo", "singer-sdk", "git+https://github.com/example/tap-bar.git"}
+
+
+def test_install_durations(tmp_path: Path) -> None:
+    tap = ProjectPlugin(PluginType.EXTRACTORS, name="tap-foo")
+    path = tmp_path / "durations.json"
+
+    durations = InstallDurations(path)
+    assert durations.get(tap) is None
+
+    durations.record(tap, 12.3456)
+    durations.save()
+    assert InstallDurations(path).get(tap) == pytest.approx(12.346)
+
+    path.write_text("not json")
+    assert InstallDurations(path).get(tap) is None
+
+
+def test_plan_installs(tmp_path: Path) -> None:
+    plugins = {
+        name: ProjectPlugin(PluginType.EXTRACTORS, name=name)
+        for name in ("tap-a", "tap-b", "tap-c", "tap-d", "tap-e")
+    }
+    requirements = {
+        plugins["tap-a"]: ["tap-a", "singer-sdk==0.40"],
+        plugins["tap-b"]: ["tap-b"],
+        plugins["tap-c"]: ["tap-c", "singer-sdk>=0.41"],
+        plugins["tap-d"]: ["tap-d", "--upgrade"],
+    }
+    durations = InstallDurations(tmp_path / "durations.json")
+    durations.record(plugins["tap-a"], 10)
+    durations.record(plugins["tap-b"], 30)
+    durations.record(plugins["tap-c"], 25)
+
+    groups = plan_installs(list(plugins.values()), requirements, durations)
+
+    # tap-a and tap-c share singer-sdk, and plugins without recorded durations are
+    # estimated with the average of the others
+    assert [[plugin.name for plugin in group.plugins] for group in groups] == [
+        ["tap-c", "tap-a"],
+        ["tap-b"],
+        ["tap-d"],
+        ["tap-e"],
+    ]
+    assert [group.estimated_duration for group in groups] == pytest.approx(
+        [35, 30, 65 / 3, 65 / 3],
+    )
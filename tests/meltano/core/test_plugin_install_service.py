@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import platform
 import re
@@ -391,3 +393,55 @@ class TestPluginInstallService:
         assert state.status == PluginInstallStatus.ERROR
         assert state.message == error_message
         assert state.verb == "Installation failed"
+
+    async def test_install_plugins_records_durations(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        target: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        subject = PluginInstallService(project, parallelism=2)
+        monkeypatch.setattr(
+            "meltano.core.plugin_install_service.install_pip_plugin",
+            AsyncMock(),
+        )
+        durations_path = project.dirs.run("plugin_install_durations.json")
+        durations_path.unlink(missing_ok=True)
+
+        states = await subject.install_plugins([target, tap])
+
+        assert [state.plugin for state in states] == [target, tap]
+        assert all(state.status == PluginInstallStatus.SUCCESS for state in states)
+        assert sorted(json.loads(durations_path.read_text())) == [
+            f"{tap.type}/{tap.plugin_dir_name}",
+            f"{target.type}/{target.plugin_dir_name}",
+        ]
+
+    async def test_install_plugins_durations_exclude_queueing(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        target: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        subject = PluginInstallService(project, parallelism=1)
+
+        async def install(**kwargs: t.Any) -> None:  # noqa: ARG001
+            await asyncio.sleep(0.2)
+
+        monkeypatch.setattr(
+            "meltano.core.plugin_install_service.install_pip_plugin",
+            install,
+        )
+        durations_path = project.dirs.run("plugin_install_durations.json")
+        durations_path.unlink(missing_ok=True)
+
+        states = await subject.install_plugins([target, tap])
+
+        # The plugin waiting for the other one to install is not charged for it
+        assert all(0.2 <= state.duration < 0.4 for state in states)
+        assert all(
+            duration < 0.4
+            for duration in json.loads(durations_path.read_text()).values()
+        )
@@ -83,6 +83,48 @@ class TestPluginInvoker:
             == environment_context.data["context_uuid"]
         )
 
+    @pytest.mark.asyncio
+    async def test_prepare_config(
+        self,
+        tap,
+        session,
+        plugin_invoker_factory,
+    ) -> None:
+        subject = plugin_invoker_factory(tap)
+        settings = subject.settings_service
+        settings.set("object", {"nested": {"key": "value"}})
+        settings.set("_state", "$TAP_MOCK_TEST.json")
+        try:
+            async with subject.prepared(session):
+                assert subject.plugin_config == settings.as_dict(
+                    extras=False,
+                    session=session,
+                )
+                assert subject.plugin_config_processed == settings.as_dict(
+                    extras=False,
+                    process=True,
+                    session=session,
+                )
+                assert subject.plugin_config_extras == settings.as_dict(
+                    extras=True,
+                    session=session,
+                )
+                assert subject.plugin_config_env == settings.as_env(session=session)
+
+                # Extras are expanded with the environment of the other settings
+                assert subject.plugin_config_extras["_state"] == (
+                    f"{subject.plugin_config['test']}.json"
+                )
+
+                # The processed config does not share objects with the plain one
+                assert (
+                    subject.plugin_config_processed["object"]
+                    is not subject.plugin_config["object"]
+                )
+        finally:
+            settings.unset("object")
+            settings.unset("_state")
+
     @pytest.mark.asyncio
     async def test_environment_env(
         self,
@@ -139,6 +139,23 @@ class TestProject:
         assert contents.startswith("# Please don't delete me :)\n")
         assert "a_new_key: New Key" in contents
 
+    def test_meltano_is_memoized(self, project: Project) -> None:
+        meltano = project.meltano
+        assert project.meltano is meltano
+
+        # Writing through `meltano_update` invalidates the parsed config
+        with project.meltano_update() as updated:
+            updated.extras["memoized"] = "yes"
+        assert project.meltano is not meltano
+        assert project.meltano.extras["memoized"] == "yes"
+
+        # So does an external change to a project file
+        meltano = project.meltano
+        contents = project.meltanofile.read_text()
+        project.meltanofile.write_text(f"{contents}\nexternal: change\n")
+        assert project.meltano is not meltano
+        assert project.meltano.extras["external"] == "change"
+
     def test_refresh_preserves_dotenv_file(self, project: Project, tmp_path) -> None:
         env_file = tmp_path / "custom.env"
         env_file.write_text("SOME_VAR=value\n")
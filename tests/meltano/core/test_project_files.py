@@ -180,6 +180,34 @@ class TestProjectFiles:
         project_files = ProjectFiles(root=root_yml.parent, meltano_file_path=root_yml)
         assert not project_files.include_paths
 
+    def test_update_writes_changed_files_only(self, tmp_path: Path) -> None:
+        include_yml = tmp_path / "inc.meltano.yml"
+        include_yml.write_text(
+            "plugins:\n  loaders:\n  - name: target-included\n",
+        )
+        root_yml = tmp_path / "meltano.yml"
+        root_yml.write_text(
+            "include_paths:\n- ./*.meltano.yml\n"
+            "plugins:\n  extractors:\n  - name: tap-root\n",
+        )
+        project_files = ProjectFiles(root=root_yml.parent, meltano_file_path=root_yml)
+        included_inode = include_yml.stat().st_ino
+
+        meltano_config = project_files.load()
+        # Mutates the contents loaded from `meltano.yml` in place
+        meltano_config["plugins"]["extractors"][0]["pip_url"] = "tap-root"
+        project_files.update(meltano_config)
+
+        assert "pip_url: tap-root" in root_yml.read_text()
+        assert include_yml.stat().st_ino == included_inode
+
+        meltano_config = project_files.load()
+        meltano_config["plugins"]["loaders"][0]["pip_url"] = "target-included"
+        project_files.update(meltano_config)
+
+        assert "pip_url: target-included" in include_yml.read_text()
+        assert include_yml.stat().st_ino != included_inode
+
     def test_include_path_not_a_file(self, tmp_path: Path) -> None:
         include_yml = tmp_path / "inc.meltano.yml"
         include_yml.mkdir()
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
+from contextlib import asynccontextmanager
 from unittest.mock import Mock
 
 import pytest
 
 from meltano.core.plugin import PluginType
-from meltano.core.validation_service import ValidationOutcome, ValidationsRunner
+from meltano.core.validation_service import (
+    ValidationOutcome,
+    ValidationsRunner,
+    run_validations,
+)
 
 if t.TYPE_CHECKING:
     from meltano.core.project import Project
@@ -17,6 +23,30 @@ class MockValidationsRunner(ValidationsRunner):
         return 1
 
 
+class ConcurrencyTrackingRunner(ValidationsRunner):
+    running = 0
+    max_running = 0
+
+    async def run_test(self, name: str) -> int:
+        cls = type(self)
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+        return 0 if name == "pass" else 1
+
+
+def tracking_runner(plugin_name: str) -> ConcurrencyTrackingRunner:
+    @asynccontextmanager
+    async def prepared(session):  # noqa: ARG001
+        yield
+
+    invoker = Mock()
+    invoker.plugin.name = plugin_name
+    invoker.prepared = prepared
+    return ConcurrencyTrackingRunner(invoker, {"pass": True, "fail": True})
+
+
 class TestValidationsRunner:
     @pytest.mark.asyncio
     async def test_run_all(self, session, dbt, plugin_invoker_factory) -> None:
@@ -67,3 +97,23 @@ class TestValidationsRunner:
 
         outcome = ValidationOutcome.FAILURE
         assert outcome.color == "red"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("parallelism", "expected_max_running"),
+    ((1, 1), (2, 2), (0, 4)),
+)
+async def test_run_validations(
+    session,
+    parallelism: int,
+    expected_max_running: int,
+) -> None:
+    ConcurrencyTrackingRunner.max_running = 0
+    runners = [tracking_runner(f"plugin-{i}") for i in range(4)]
+
+    results = await run_validations(session, runners, parallelism=parallelism)
+
+    assert list(results) == ["plugin-0", "plugin-1", "plugin-2", "plugin-3"]
+    assert all(result == {"pass": 0, "fail": 1} for result in results.values())
+    assert ConcurrencyTrackingRunner.max_running == expected_max_running
@@ -13,7 +13,9 @@ from meltano.core.error import AsyncSubprocessError
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.project_plugin import ProjectPlugin
 from meltano.core.venv_service import (
+    ProbeCache,
     UvBackend,
+    VenvStore,
     VirtualEnv,
     VirtualenvBackend,
     VirtualEnvService,
@@ -73,12 +75,79 @@ class TestVirtualEnv:
     async def test_site_packages(self, tmp_path: Path) -> None:
         proc = subprocess.CompletedProcess([], returncode=0, stdout=b"3 99 42")
         with mock.patch("subprocess.run", return_value=proc):
-            subject = VirtualEnv(tmp_path / "venv", python="python3.9")
+            subject = VirtualEnv(
+                tmp_path / "venv",
+                python="python3.9",
+                probe_cache=ProbeCache(tmp_path / "probe_cache.json"),
+            )
             assert subject.site_packages_dir.parts[-2:] == (
                 "python3.99",
                 "site-packages",
             )
 
+    @pytest.mark.skipif(
+        platform.system() == "Windows",
+        reason="the fake interpreter is a shell script",
+    )
+    def test_probe_cache(self, tmp_path: Path) -> None:
+        python = tmp_path / "python"
+        python.write_text("#!/bin/sh\necho 3 99 1 t\n")
+        python.chmod(0o755)
+        cache_path = tmp_path / "probe_cache.json"
+
+        subject = VirtualEnv(
+            tmp_path / "venv",
+            python=str(python),
+            probe_cache=ProbeCache(cache_path),
+        )
+        assert subject.python_version_tuple == (3, 99, 1)
+        site_packages_dir = subject.lib_dir / "python3.99t" / "site-packages"
+        assert subject.site_packages_dir == site_packages_dir
+
+        # Other processes reuse the probes without running the interpreter
+        site_packages_dir.mkdir(parents=True)
+        subject = VirtualEnv(
+            tmp_path / "venv",
+            python=str(python),
+            probe_cache=ProbeCache(cache_path),
+        )
+        assert subject.site_packages_dir == site_packages_dir
+        with mock.patch("subprocess.run") as run_mock:
+            subject = VirtualEnv(
+                tmp_path / "venv",
+                python=str(python),
+                probe_cache=ProbeCache(cache_path),
+            )
+            assert subject.site_packages_dir == site_packages_dir
+            assert subject.python_version_tuple == (3, 99, 1)
+            run_mock.assert_not_called()
+
+        # Changing the interpreter invalidates its probe
+        python.write_text("#!/bin/sh\necho 3 100 0\n")
+        subject = VirtualEnv(
+            tmp_path / "venv",
+            python=str(python),
+            probe_cache=ProbeCache(cache_path),
+        )
+        assert subject.python_version_tuple == (3, 100, 0)
+
+    def test_probe_cache_save_error(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "probe_cache.json"
+        probe_cache = ProbeCache(cache_path)
+
+        # Failing to write the file is not an error
+        with mock.patch("os.replace", side_effect=PermissionError):
+            probe_cache.save()
+        assert list(tmp_path.iterdir()) == []
+
+        # Other errors are raised, without leaving the temporary file behind
+        with (
+            mock.patch("json.dump", side_effect=TypeError),
+            pytest.raises(TypeError),
+        ):
+            probe_cache.save()
+        assert list(tmp_path.iterdir()) == []
+
 
 @pytest.fixture
 def venv(tmp_path: Path) -> VirtualEnv:
@@ -278,6 +347,107 @@ class TestVirtualEnvService:
         subject.venv.python_path = original_python
         assert not subject.requires_clean_install(["example"])
 
+    @pytest.mark.asyncio
+    async def test_install_into_store(self, project: Project, tmp_path: Path) -> None:
+        store = VenvStore(tmp_path / "store")
+
+        def make_service(name: str) -> VirtualEnvService:
+            venv = VirtualEnv(project.dirs.venvs("namespace", name, make_dirs=False))
+            return VirtualEnvService(
+                project=project,
+                namespace="namespace",
+                name=name,
+                backend=UvBackend(venv=venv, log_path=tmp_path / "install.log"),
+                store=store,
+            )
+
+        await make_service("first").install(["example"])
+
+        second = make_service("second")
+        with mock.patch.object(VirtualEnvService, "pip_install") as pip_install:
+            await second.install(["example"])
+        pip_install.assert_not_called()
+
+        first_path = project.dirs.venvs("namespace", "first", make_dirs=False)
+        second_path = project.dirs.venvs("namespace", "second", make_dirs=False)
+        entry_path = store.entry_path(fingerprint(["example"]))
+        assert first_path.is_symlink()
+        assert second_path.is_symlink()
+        assert first_path.resolve() == second_path.resolve() == entry_path
+        assert sorted(store.references(fingerprint(["example"]))) == [
+            first_path,
+            second_path,
+        ]
+        assert not second.venv.requires_install(["example"])
+
+        # A clean install leaves the entry other plugins are linked to intact
+        marker = entry_path / "in-use"
+        marker.touch()
+        with mock.patch.object(VirtualEnvService, "pip_install") as pip_install:
+            await make_service("first").install(["example"], clean=True)
+        pip_install.assert_not_called()
+        assert marker.exists()
+        assert second_path.resolve() == entry_path
+        assert not second.venv.requires_install(["example"])
+
+        # Without a store, a plugin gets its own virtual environment again
+        second.store = None
+        await second.install(["example"])
+        assert not second_path.is_symlink()
+        assert second_path.is_dir()
+        assert entry_path.is_dir()
+
+
+class TestVenvStore:
+    @pytest.fixture
+    def subject(self, tmp_path: Path) -> VenvStore:
+        store = VenvStore(tmp_path / "store")
+        store.entry_path("abc").mkdir(parents=True)
+        store.entry_path("def").mkdir(parents=True)
+        return store
+
+    def test_link(self, subject: VenvStore, tmp_path: Path) -> None:
+        link_path = tmp_path / "plugin" / "venv"
+        link_path.mkdir(parents=True)
+
+        subject.link("abc", link_path)
+        assert link_path.is_symlink()
+        assert link_path.resolve() == subject.entry_path("abc")
+        assert subject.references("abc") == [link_path]
+
+        subject.link("def", link_path)
+        assert link_path.resolve() == subject.entry_path("def")
+        assert subject.references("abc") == []
+        assert subject.references("def") == [link_path]
+
+    def test_collect_garbage(self, subject: VenvStore, tmp_path: Path) -> None:
+        first_link = tmp_path / "first" / "venv"
+        second_link = tmp_path / "second" / "venv"
+        subject.link("abc", first_link)
+        subject.link("abc", second_link)
+
+        assert subject.collect_garbage() == ["def"]
+        assert not subject.entry_path("def").exists()
+
+        first_link.unlink()
+        assert subject.collect_garbage() == []
+        assert subject.references("abc") == [second_link]
+
+        second_link.unlink()
+        assert subject.collect_garbage() == ["abc"]
+        assert not subject.entry_path("abc").exists()
+
+    def test_from_project(self, project: Project) -> None:
+        assert VenvStore.from_project(project) is None
+
+        project.settings.set("venv.store_dir", "shared-venvs")
+        try:
+            store = VenvStore.from_project(project)
+        finally:
+            project.settings.unset("venv.store_dir")
+        assert store is not None
+        assert store.root == project.root.resolve() / "shared-venvs"
+
 
 class TestVenvBackend:
     @pytest.mark.parametrize("backend", ("virtualenv", "uv"))
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import sys
+import tarfile
+import typing as t
+
+import pytest
+
+from meltano.core.venv_service import VenvStore, VirtualEnv
+from meltano.core.venv_snapshot import (
+    VenvSnapshotError,
+    _pip_install_args,
+    export_venv_snapshot,
+    import_venv_snapshot,
+    relocate_scripts,
+)
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+
+
+def make_venv(root: Path, pip_install_args: list[str]) -> VirtualEnv:
+    """Create a minimal virtual environment without installing anything."""
+    venv = VirtualEnv(root)
+    venv.bin_dir.mkdir(parents=True)
+    venv.exec_path("python").symlink_to(sys.executable)
+    venv.exec_path("tap-mock").write_text(f"#!{venv.root}/bin/python\nprint('hi')\n")
+    venv.write_fingerprint(pip_install_args)
+    return venv
+
+
+def test_relocate_scripts(tmp_path: Path) -> None:
+    venv = make_venv(tmp_path / "new" / "venv", [])
+    old_root = str(tmp_path / "old" / "venv")
+    script = venv.exec_path("tap-mock")
+    script.write_text(f"#!{old_root}/bin/python\nprint('hi')\n")
+
+    relocate_scripts(venv, old_root)
+
+    assert script.read_text() == f"#!{venv.root}/bin/python\nprint('hi')\n"
+    assert venv.exec_path("python").is_symlink()
+
+
+class TestVenvSnapshot:
+    @pytest.fixture
+    def venv(self, project: Project, tap: ProjectPlugin):
+        root = project.dirs.venvs(tap.type, tap.plugin_dir_name, make_dirs=False)
+        shutil.rmtree(root, ignore_errors=True)
+        yield make_venv(root, _pip_install_args(project, tap))
+        if root.is_symlink():
+            root.unlink()
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_export_import(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        venv: VirtualEnv,
+        tmp_path: Path,
+    ) -> None:
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+        assert export_venv_snapshot(project, [tap], snapshot_path) == [tap]
+
+        shutil.rmtree(venv.root)
+        assert venv.requires_install(_pip_install_args(project, tap))
+
+        assert await import_venv_snapshot(project, [tap], snapshot_path) == [tap]
+        assert not venv.requires_install(_pip_install_args(project, tap))
+        assert venv.exec_path("tap-mock").read_text().startswith(f"#!{venv.root}")
+
+    @pytest.mark.asyncio
+    async def test_import_into_store(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        venv: VirtualEnv,
+        tmp_path: Path,
+    ) -> None:
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+        export_venv_snapshot(project, [tap], snapshot_path)
+        shutil.rmtree(venv.root)
+
+        project.settings.set("venv.store_dir", str(tmp_path / "store"))
+        try:
+            assert await import_venv_snapshot(project, [tap], snapshot_path) == [tap]
+        finally:
+            project.settings.unset("venv.store_dir")
+
+        link_path = project.dirs.venvs(tap.type, tap.plugin_dir_name, make_dirs=False)
+        entry = VirtualEnv(link_path)
+        store = VenvStore(tmp_path / "store")
+        assert link_path.is_symlink()
+        assert entry.root.parent == store.root / "venvs"
+        assert entry.exec_path("tap-mock").read_text().startswith(f"#!{entry.root}")
+
+    @pytest.mark.asyncio
+    async def test_export_from_store(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        venv: VirtualEnv,
+        tmp_path: Path,
+    ) -> None:
+        pip_install_args = _pip_install_args(project, tap)
+        store = VenvStore(tmp_path / "store")
+        venv_fingerprint = venv.get_fingerprint(pip_install_args)
+        link_path = project.dirs.venvs(tap.type, tap.plugin_dir_name, make_dirs=False)
+        shutil.rmtree(link_path)
+        entry = make_venv(store.entry_path(venv_fingerprint), pip_install_args)
+        store.link(venv_fingerprint, link_path)
+
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+        assert export_venv_snapshot(project, [tap], snapshot_path) == [tap]
+
+        with tarfile.open(snapshot_path) as archive:
+            member = archive.getmember(f"venvs/{tap.type}/{tap.plugin_dir_name}")
+            assert member.isdir()
+            manifest = json.load(archive.extractfile("meltano-venv-snapshot.json"))
+        assert manifest["venvs"][0]["root"] == str(entry.root)
+
+        link_path.unlink()
+        assert await import_venv_snapshot(project, [tap], snapshot_path) == [tap]
+        assert not link_path.is_symlink()
+        restored = VirtualEnv(link_path)
+        assert (
+            restored.exec_path("tap-mock")
+            .read_text()
+            .startswith(
+                f"#!{restored.root}/bin/python",
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_out_of_date(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        venv: VirtualEnv,
+        tmp_path: Path,
+    ) -> None:
+        snapshot_path = tmp_path / "snapshot.tar.gz"
+
+        venv.write_fingerprint(["outdated"])
+        assert export_venv_snapshot(project, [tap], snapshot_path) == []
+
+        venv.write_fingerprint(_pip_install_args(project, tap))
+        assert export_venv_snapshot(project, [tap], snapshot_path) == [tap]
+
+        # A snapshot made for another Python interpreter is not restored
+        project.settings.set("python", "/path/to/another/python")
+        try:
+            assert await import_venv_snapshot(project, [tap], snapshot_path) == []
+        finally:
+            project.settings.unset("python")
+
+    @pytest.mark.asyncio
+    async def test_not_a_snapshot(
+        self,
+        project: Project,
+        tap: ProjectPlugin,
+        tmp_path: Path,
+    ) -> None:
+        not_an_archive = tmp_path / "snapshot.tar.gz"
+        not_an_archive.write_text("not an archive")
+        with pytest.raises(VenvSnapshotError, match="not a virtual environment"):
+            await import_venv_snapshot(project, [tap], not_an_archive)
+
+        empty_archive = tmp_path / "empty.tar.gz"
+        with tarfile.open(empty_archive, "w:gz"):
+            pass
+        with pytest.raises(VenvSnapshotError, match="not a virtual environment"):
+            await import_venv_snapshot(project, [tap], empty_archive)
+
+        malformed = tmp_path / "malformed.tar.gz"
+        with tarfile.open(malformed, "w:gz") as archive:
+            content = json.dumps({"version": 1}).encode()
+            info = tarfile.TarInfo("meltano-venv-snapshot.json")
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+        with pytest.raises(VenvSnapshotError, match="Invalid virtual environment"):
+            await import_venv_snapshot(project, [tap], malformed)
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import io
-import typing as t
+import os
+import time
 import uuid
 from decimal import Decimal
+from pathlib import Path
+from unittest import mock
 
 from ruamel.yaml import YAML, CommentedMap
 
 from meltano.core import yaml
 from meltano.core.yaml import _represent_decimal
 
-if t.TYPE_CHECKING:
-    from pathlib import Path
-
 
 def _create_test_data(**kwargs) -> CommentedMap:
     """Create a CommentedMap with test data."""
@@ -126,6 +126,38 @@ settings:
     assert data1["settings"]["decimal_setting"] == 123.45  # ruff:ignore[float-equality-comparison]
 
 
+def test_yaml_cache_stat_revalidation(tmp_path: Path):
+    """Test that unchanged files are not read again when their stat matches."""
+    temp_file = tmp_path / "test.yml"
+    temp_file.write_text("key: value\n")
+    # Make the file old enough for its stat signature to be trusted
+    past = time.time_ns() - 2 * yaml.RACY_MTIME_WINDOW_NS
+    os.utime(temp_file, ns=(past, past))
+
+    data = yaml.load(temp_file)
+    with mock.patch.object(Path, "open", side_effect=AssertionError("file read")):
+        assert yaml.load(temp_file) is data
+
+    # A change of size, mtime or inode is detected
+    temp_file.write_text("key: other value\n")
+    os.utime(temp_file, ns=(past, past))
+    assert yaml.load(temp_file)["key"] == "other value"
+
+
+def test_yaml_cache_recently_modified(tmp_path: Path):
+    """Test that recently modified files are always checked by content."""
+    temp_file = tmp_path / "test.yml"
+    temp_file.write_text("key: value\n")
+
+    data = yaml.load(temp_file)
+    assert yaml.cache[temp_file.resolve()].stat_signature is None
+
+    # Same size, and possibly the same mtime on file systems with coarse timestamps
+    temp_file.write_text("key: eulav\n")
+    assert yaml.load(temp_file) is not data
+    assert yaml.load(temp_file)["key"] == "eulav"
+
+
 def test_decimal_representer_function() -> None:
     """Test the _represent_decimal function directly."""
     yaml_instance = YAML()